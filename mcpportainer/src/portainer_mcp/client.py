@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import time
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urljoin
 
@@ -21,6 +22,14 @@ from portainer_mcp.config import Settings
 
 log = structlog.get_logger(__name__)
 
+# (base URL, stack name) → (stack id, cached-at) so repeated deploys skip list_stacks
+_STACK_TTL = 30.0
+_stack_id_cache: dict[tuple[str, str], tuple[int, float]] = {}
+
+# One pooled httpx client per process so TCP/TLS connections survive across tool calls
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_key: Optional[tuple[Any, ...]] = None
+
 
 class PortainerAPIError(Exception):
     """Raised for non-2xx Portainer API responses."""
@@ -30,24 +39,63 @@ class PortainerAPIError(Exception):
         super().__init__(f"Portainer API error {status_code}: {message}")
 
 
-def _build_headers(token: str) -> dict[str, str]:
-    """Choose the correct auth header based on token format."""
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+@lru_cache(maxsize=4)
+def _headers_for(token: str) -> dict[str, str]:
+    """Return the full request header dict for *token*, choosing the auth header by format.
+
+    Cached per token so every client built with the same token shares one dict;
+    treat the result as read-only.
+    """
     if token.startswith("ptr_"):
-        return {"X-API-Key": token}
-    return {"Authorization": f"Bearer {token}"}
+        return {"X-API-Key": token, **_JSON_HEADERS}
+    return {"Authorization": f"Bearer {token}", **_JSON_HEADERS}
+
+
+async def get_shared_client(settings: Settings) -> httpx.AsyncClient:
+    """Return the process-wide httpx client, creating it on first use.
+
+    The client is rebuilt if *settings* point at a different URL or token.
+    """
+    global _shared_client, _shared_key
+    key = (settings.portainer_url, settings.api_token, settings.ssl_verify, settings.timeout)
+    if _shared_client is not None and not _shared_client.is_closed and _shared_key == key:
+        return _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = httpx.AsyncClient(
+        base_url=settings.portainer_url + "/api/",
+        headers=_headers_for(settings.api_token),
+        verify=settings.ssl_verify,
+        timeout=settings.timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30),
+    )
+    _shared_key = key
+    return _shared_client
+
+
+async def aclose_shared() -> None:
+    """Close the process-wide httpx client. Call once at server shutdown."""
+    global _shared_client, _shared_key
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_key = None
 
 
 class PortainerClient:
-    """Async context-manager wrapper around the Portainer REST API."""
+    """Async context-manager wrapper around the Portainer REST API.
+
+    Entering the context borrows the shared pooled httpx client; exiting does
+    not close it (see ``aclose_shared``).
+    """
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._base_url = settings.portainer_url.rstrip("/") + "/api/"
-        self._headers = {
-            **_build_headers(settings.api_token),
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self._base_url = settings.portainer_url + "/api/"
+        self._headers = _headers_for(settings.api_token)
         self._client: Optional[httpx.AsyncClient] = None
 
     # ------------------------------------------------------------------
@@ -55,18 +103,11 @@ class PortainerClient:
     # ------------------------------------------------------------------
 
     async def __aenter__(self) -> "PortainerClient":
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            headers=self._headers,
-            verify=self._settings.ssl_verify,
-            timeout=self._settings.timeout,
-        )
+        self._client = await get_shared_client(self._settings)
         return self
 
     async def __aexit__(self, *_: Any) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -153,23 +194,41 @@ class PortainerClient:
         tail: int = 100,
         timestamps: bool = False,
     ) -> str:
-        """Retrieve container logs as a string."""
+        """Retrieve container logs as a string.
+
+        Chunks are appended to one ``bytearray`` and decoded once at the end, so
+        large ``tail`` values never hold a chunk list and a joined copy at once.
+        """
         client = self._client_or_raise()
         t0 = time.monotonic()
-        response = await client.get(
+        async with client.stream(
+            "GET",
             f"endpoints/{endpoint_id}/docker/containers/{container_id}/logs",
             params={
                 "stdout": "true",
                 "stderr": "true",
-                "tail": str(tail),
+                "tail": tail,
                 "timestamps": "true" if timestamps else "false",
             },
-        )
+        ) as response:
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
         elapsed = round((time.monotonic() - t0) * 1000)
-        log.info("portainer.api_call", method="GET", path="container_logs", status=response.status_code, elapsed_ms=elapsed)
+
+        log.info(
+            "portainer.api_call",
+            method="GET",
+            path="container_logs",
+            status=response.status_code,
+            elapsed_ms=elapsed,
+        )
+
         if not response.is_success:
-            raise PortainerAPIError(response.status_code, response.text[:500])
-        return response.text
+            raise PortainerAPIError(
+                response.status_code, body[:500].decode("utf-8", "replace")
+            )
+        return body.decode("utf-8", "replace")
 
     # ------------------------------------------------------------------
     # Images
@@ -202,37 +261,62 @@ class PortainerClient:
 
         Creates a new stack if *stack_name* does not exist, otherwise updates it.
         """
+        env_list = [{"name": k, "value": v} for k, v in (env_vars or {}).items()]
+        cache_key = (self._base_url, stack_name)
+
+        # Fast path: a recently seen stack ID lets us update without listing every stack
+        cached = _stack_id_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[1] < _STACK_TTL:
+            try:
+                return await self._update_stack(cached[0], endpoint_id, compose_content, env_list)
+            except PortainerAPIError as e:
+                if e.status_code != 404:
+                    raise
+                _stack_id_cache.pop(cache_key, None)
+
         # Check if a stack with this name already exists
         stacks = await self.list_stacks()
         existing = next((s for s in stacks if s.get("Name") == stack_name), None)
 
-        env_list = [{"name": k, "value": v} for k, v in (env_vars or {}).items()]
-
         if existing:
             stack_id = existing["Id"]
-            payload: dict[str, Any] = {
-                "stackFileContent": compose_content,
-                "env": env_list,
-                "prune": False,
-            }
-            return await self._request(  # type: ignore[return-value]
-                "PUT",
-                f"stacks/{stack_id}",
-                params={"endpointId": endpoint_id},
-                content=json.dumps(payload),
-            )
+            _stack_id_cache[cache_key] = (stack_id, time.monotonic())
+            return await self._update_stack(stack_id, endpoint_id, compose_content, env_list)
 
         payload = {
             "name": stack_name,
             "stackFileContent": compose_content,
             "env": env_list,
         }
-        return await self._request(  # type: ignore[return-value]
+        result = await self._request(
             "POST",
             "stacks/create/standalone/string",
             params={"endpointId": endpoint_id},
             content=json.dumps(payload),
         )
+        if isinstance(result, dict) and "Id" in result:
+            _stack_id_cache[cache_key] = (result["Id"], time.monotonic())
+        return result  # type: ignore[no-any-return]
+
+    async def _update_stack(
+        self,
+        stack_id: int,
+        endpoint_id: int,
+        compose_content: str,
+        env_list: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        """Push new Compose content to an existing stack."""
+        payload: dict[str, Any] = {
+            "stackFileContent": compose_content,
+            "env": env_list,
+            "prune": False,
+        }
+        return await self._request(  # type: ignore[return-value]
+            "PUT",
+            f"stacks/{stack_id}",
+            params={"endpointId": endpoint_id},
+            content=json.dumps(payload),
+        )
 
     # ------------------------------------------------------------------
     # Health
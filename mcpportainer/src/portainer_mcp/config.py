@@ -27,6 +27,14 @@ _CONFIG_FILE = Path.home() / ".config" / "portainer-mcp" / "config.yaml"
 _KEYCHAIN_TOKEN_ACCOUNT = "portainer-token"
 _KEYCHAIN_URL_ACCOUNT = "portainer-url"
 
+# When every one of these is set the YAML file can never contribute a value
+_ENV_KEYS = ("PORTAINER_URL", "PORTAINER_TOKEN", "PORTAINER_SSL_VERIFY", "PORTAINER_TIMEOUT")
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class Settings:
     """Runtime configuration resolved at startup."""
@@ -54,7 +62,7 @@ def _load_yaml_config() -> dict:
     """Load optional YAML config file, returning an empty dict if absent."""
     if _CONFIG_FILE.exists():
         with _CONFIG_FILE.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         log.info("config.yaml_loaded", path=str(_CONFIG_FILE))
         return data
     return {}
@@ -66,7 +74,10 @@ def get_settings() -> Settings:
 
     Raises ``RuntimeError`` if a required value cannot be found in any source.
     """
-    yaml_cfg = _load_yaml_config()
+    if all(os.environ.get(k) for k in _ENV_KEYS):
+        yaml_cfg: dict = {}
+    else:
+        yaml_cfg = _load_yaml_config()
 
     # --- Portainer URL ---
     url = (
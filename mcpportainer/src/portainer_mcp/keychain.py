@@ -8,22 +8,36 @@ Falls back to the `keyring` library when the security CLI is unavailable.
 from __future__ import annotations
 
 import subprocess
+import sys
 import logging
+from functools import lru_cache
 from typing import Optional
 
 import structlog
 
+try:
+    import keyring as _keyring
+except ImportError:  # pragma: no cover - keyring is a declared dependency
+    _keyring = None
+
+# keyring talks to the Security framework in-process on macOS; elsewhere its backend
+# would be a different store than the one the `security` CLI writes to
+_USE_KEYRING = _keyring is not None and sys.platform == "darwin"
+
 log = structlog.get_logger(__name__)
 
 _SERVICE = "portainer-mcp"
 
 
-def _run_security(*args: str) -> subprocess.CompletedProcess[str]:
-    """Run a macOS `security` command and return the result."""
+def _run_security(*args: str, stderr: bool = True) -> subprocess.CompletedProcess[bytes]:
+    """Run a macOS `security` command and return the raw (undecoded) result.
+
+    Pass ``stderr=False`` when the caller never reads the error output.
+    """
     return subprocess.run(
         ["/usr/bin/security", *args],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if stderr else subprocess.DEVNULL,
         check=False,
     )
 
@@ -31,47 +45,65 @@ def _run_security(*args: str) -> subprocess.CompletedProcess[str]:
 def store_secret(account: str, value: str) -> None:
     """Store *value* in the macOS Keychain under *account*.
 
-    If an entry already exists it is deleted first so `add-generic-password`
-    succeeds cleanly.
+    ``-U`` updates an existing entry in place, so a single `security` call
+    covers both the create and the rotate case.
     """
-    # Remove existing entry (ignore errors if it doesn't exist)
-    _run_security("delete-generic-password", "-s", _SERVICE, "-a", account)
-
     result = _run_security(
         "add-generic-password",
+        "-U",
         "-s", _SERVICE,
         "-a", account,
         "-w", value,
     )
     if result.returncode != 0:
         raise RuntimeError(
-            f"Keychain store failed for account '{account}': {result.stderr.strip()}"
+            f"Keychain store failed for account '{account}': "
+            f"{result.stderr.decode('utf-8', 'replace').strip()}"
         )
+    retrieve_secret.cache_clear()
     log.info("keychain.stored", account=account)
 
 
+@lru_cache(maxsize=32)
 def retrieve_secret(account: str) -> Optional[str]:
     """Retrieve the secret stored under *account* from the macOS Keychain.
 
-    Returns ``None`` if the entry does not exist.
+    Returns ``None`` if the entry does not exist. Results are cached for the
+    life of the process; ``store_secret``/``delete_secret`` clear the cache.
     """
+    if _USE_KEYRING:
+        try:
+            value = _keyring.get_password(_SERVICE, account)  # type: ignore[union-attr]
+        except Exception:  # keyring backend failure — fall back to the CLI below
+            log.debug("keychain.keyring_failed", account=account)
+        else:
+            if value is None:
+                log.debug("keychain.not_found", account=account)
+                return None
+            log.info("keychain.retrieved", account=account)
+            return value.strip() or None
+
     result = _run_security(
         "find-generic-password",
         "-s", _SERVICE,
         "-a", account,
         "-w",  # output only the password
+        stderr=False,
     )
     if result.returncode != 0:
         log.debug("keychain.not_found", account=account)
         return None
-    value = result.stdout.strip()
+    value = result.stdout.decode("utf-8").strip()
     log.info("keychain.retrieved", account=account)
     return value or None
 
 
 def delete_secret(account: str) -> bool:
     """Delete a Keychain entry. Returns True if deleted, False if not found."""
-    result = _run_security("delete-generic-password", "-s", _SERVICE, "-a", account)
+    result = _run_security(
+        "delete-generic-password", "-s", _SERVICE, "-a", account, stderr=False
+    )
     deleted = result.returncode == 0
+    retrieve_secret.cache_clear()
     log.info("keychain.deleted", account=account, success=deleted)
     return deleted
@@ -5,9 +5,14 @@ All models use strict validation to prevent injection or unexpected data.
 """
 from __future__ import annotations
 
+import re
 from typing import Any, Optional
 from pydantic import BaseModel, Field, field_validator
 
+# Shell metacharacters rejected in container identifiers
+_FORBIDDEN_RE = re.compile(r"[;&|`$><\\\"'()]")
+_STACK_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+
 
 # ---------------------------------------------------------------------------
 # Portainer API response models
@@ -91,8 +96,7 @@ class ContainerInput(BaseModel):
     @classmethod
     def sanitize_container_id(cls, v: str) -> str:
         """Reject shell metacharacters."""
-        forbidden = set(";&|`$><\\\"'()")
-        if any(c in forbidden for c in v):
+        if _FORBIDDEN_RE.search(v):
             raise ValueError("container_id contains illegal characters")
         return v
 
@@ -107,8 +111,7 @@ class ContainerLogsInput(BaseModel):
     @field_validator("container_id")
     @classmethod
     def sanitize_container_id(cls, v: str) -> str:
-        forbidden = set(";&|`$><\\\"'()")
-        if any(c in forbidden for c in v):
+        if _FORBIDDEN_RE.search(v):
             raise ValueError("container_id contains illegal characters")
         return v
 
@@ -123,7 +126,6 @@ class DeployStackInput(BaseModel):
     @field_validator("stack_name")
     @classmethod
     def sanitize_stack_name(cls, v: str) -> str:
-        import re
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not _STACK_NAME_RE.match(v):
             raise ValueError("stack_name must contain only alphanumerics, hyphens, and underscores")
         return v
@@ -22,15 +22,19 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable
 
 import structlog
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from portainer_mcp.client import PortainerAPIError, PortainerClient
+from portainer_mcp.client import PortainerAPIError, PortainerClient, aclose_shared
 from portainer_mcp.config import get_settings
 from portainer_mcp.models import (
     ContainerInput,
@@ -55,16 +59,34 @@ structlog.configure(
 
 log = structlog.get_logger(__name__)
 
+# ---------------------------------------------------------------------------
+# Input validators — built once so each call goes straight to pydantic-core
+# ---------------------------------------------------------------------------
+
+_ENDPOINT_ADAPTER = TypeAdapter(EndpointIdInput)
+_CONTAINER_ADAPTER = TypeAdapter(ContainerInput)
+_LOGS_ADAPTER = TypeAdapter(ContainerLogsInput)
+_DEPLOY_ADAPTER = TypeAdapter(DeployStackInput)
+
 # ---------------------------------------------------------------------------
 # MCP Server
 # ---------------------------------------------------------------------------
 
 app = Server("portainer-mcp")
 
+_MB = 1.0 / 1_048_576
+
+
+# Compact JSON for MCP clients; MCP_PRETTY=1 restores indented output for debugging
+if os.environ.get("MCP_PRETTY") == "1":
+    _DUMPS = partial(json.dumps, indent=2, default=str)
+else:
+    _DUMPS = partial(json.dumps, separators=(",", ":"), default=str)
+
 
 def _ok(data: object) -> list[types.TextContent]:
     """Wrap a result as a JSON TextContent response."""
-    return [types.TextContent(type="text", text=json.dumps(data, indent=2, default=str))]
+    return [types.TextContent(type="text", text=_DUMPS(data))]
 
 
 def _err(message: str) -> list[types.TextContent]:
@@ -219,108 +241,129 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
         return _err(f"Unexpected error: {type(e).__name__}: {e}")
 
 
+_Handler = Callable[[dict, PortainerClient], Awaitable[list[types.TextContent]]]
+
+
+async def _handle_health_check(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    status = await client.health()
+    return _ok({"status": "ok", "portainer": status})
+
+
+async def _handle_list_endpoints(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    endpoints = await client.list_endpoints()
+    summary = [
+        {"id": e.get("Id"), "name": e.get("Name"), "url": e.get("URL"), "status": e.get("Status")}
+        for e in endpoints
+    ]
+    return _ok(summary)
+
+
+async def _handle_list_stacks(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    stacks = await client.list_stacks()
+    summary = [
+        {"id": s.get("Id"), "name": s.get("Name"), "endpoint_id": s.get("EndpointId"), "status": s.get("Status")}
+        for s in stacks
+    ]
+    return _ok(summary)
+
+
+async def _handle_list_containers(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _ENDPOINT_ADAPTER.validate_python(arguments)
+    containers = await client.list_containers(inp.endpoint_id)
+    g = dict.get
+    summary = [
+        {
+            "id": g(c, "Id", "")[:12],
+            "names": g(c, "Names", ()),
+            "image": g(c, "Image", ""),
+            "state": g(c, "State", ""),
+            "status": g(c, "Status", ""),
+        }
+        for c in containers
+    ]
+    return _ok(summary)
+
+
+async def _handle_inspect_container(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _CONTAINER_ADAPTER.validate_python(arguments)
+    detail = await client.inspect_container(inp.endpoint_id, inp.container_id)
+    return _ok(detail)
+
+
+async def _handle_start_container(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _CONTAINER_ADAPTER.validate_python(arguments)
+    await client.start_container(inp.endpoint_id, inp.container_id)
+    return _ok({"result": "started", "container_id": inp.container_id})
+
+
+async def _handle_stop_container(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _CONTAINER_ADAPTER.validate_python(arguments)
+    await client.stop_container(inp.endpoint_id, inp.container_id)
+    return _ok({"result": "stopped", "container_id": inp.container_id})
+
+
+async def _handle_container_logs(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _LOGS_ADAPTER.validate_python(arguments)
+    logs = await client.container_logs(
+        inp.endpoint_id,
+        inp.container_id,
+        tail=inp.tail,
+        timestamps=inp.timestamps,
+    )
+    return _ok({"logs": logs})
+
+
+async def _handle_list_images(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _ENDPOINT_ADAPTER.validate_python(arguments)
+    images = await client.list_images(inp.endpoint_id)
+    g = dict.get
+    summary = [
+        {
+            "id": g(img, "Id", "")[:19],
+            "tags": g(img, "RepoTags", ()),
+            "size_mb": round(g(img, "Size", 0) * _MB, 1),
+            "created": g(img, "Created"),
+        }
+        for img in images
+    ]
+    return _ok(summary)
+
+
+async def _handle_deploy_stack(arguments: dict, client: PortainerClient) -> list[types.TextContent]:
+    inp = _DEPLOY_ADAPTER.validate_python(arguments)
+    result = await client.deploy_stack(
+        inp.endpoint_id,
+        inp.stack_name,
+        inp.compose_content,
+        inp.env_vars,
+    )
+    return _ok({"result": "deployed", "stack": result})
+
+
+_HANDLERS: dict[str, _Handler] = {
+    "health_check": _handle_health_check,
+    "list_endpoints": _handle_list_endpoints,
+    "list_stacks": _handle_list_stacks,
+    "list_containers": _handle_list_containers,
+    "inspect_container": _handle_inspect_container,
+    "start_container": _handle_start_container,
+    "stop_container": _handle_stop_container,
+    "container_logs": _handle_container_logs,
+    "list_images": _handle_list_images,
+    "deploy_stack": _handle_deploy_stack,
+}
+
+
 async def _dispatch(
     name: str,
     arguments: dict,
     client: PortainerClient,
 ) -> list[types.TextContent]:
     """Route tool name to implementation."""
-
-    # --- health_check ---
-    if name == "health_check":
-        status = await client.health()
-        return _ok({"status": "ok", "portainer": status})
-
-    # --- list_endpoints ---
-    if name == "list_endpoints":
-        endpoints = await client.list_endpoints()
-        summary = [
-            {"id": e.get("Id"), "name": e.get("Name"), "url": e.get("URL"), "status": e.get("Status")}
-            for e in endpoints
-        ]
-        return _ok(summary)
-
-    # --- list_stacks ---
-    if name == "list_stacks":
-        stacks = await client.list_stacks()
-        summary = [
-            {"id": s.get("Id"), "name": s.get("Name"), "endpoint_id": s.get("EndpointId"), "status": s.get("Status")}
-            for s in stacks
-        ]
-        return _ok(summary)
-
-    # --- list_containers ---
-    if name == "list_containers":
-        inp = EndpointIdInput(**arguments)
-        containers = await client.list_containers(inp.endpoint_id)
-        summary = [
-            {
-                "id": c.get("Id", "")[:12],
-                "names": c.get("Names", []),
-                "image": c.get("Image", ""),
-                "state": c.get("State", ""),
-                "status": c.get("Status", ""),
-            }
-            for c in containers
-        ]
-        return _ok(summary)
-
-    # --- inspect_container ---
-    if name == "inspect_container":
-        inp = ContainerInput(**arguments)
-        detail = await client.inspect_container(inp.endpoint_id, inp.container_id)
-        return _ok(detail)
-
-    # --- start_container ---
-    if name == "start_container":
-        inp = ContainerInput(**arguments)
-        await client.start_container(inp.endpoint_id, inp.container_id)
-        return _ok({"result": "started", "container_id": inp.container_id})
-
-    # --- stop_container ---
-    if name == "stop_container":
-        inp = ContainerInput(**arguments)
-        await client.stop_container(inp.endpoint_id, inp.container_id)
-        return _ok({"result": "stopped", "container_id": inp.container_id})
-
-    # --- container_logs ---
-    if name == "container_logs":
-        inp = ContainerLogsInput(**arguments)
-        logs = await client.container_logs(
-            inp.endpoint_id,
-            inp.container_id,
-            tail=inp.tail,
-            timestamps=inp.timestamps,
-        )
-        return _ok({"logs": logs})
-
-    # --- list_images ---
-    if name == "list_images":
-        inp = EndpointIdInput(**arguments)
-        images = await client.list_images(inp.endpoint_id)
-        summary = [
-            {
-                "id": img.get("Id", "")[:19],
-                "tags": img.get("RepoTags", []),
-                "size_mb": round(img.get("Size", 0) / 1_048_576, 1),
-                "created": img.get("Created"),
-            }
-            for img in images
-        ]
-        return _ok(summary)
-
-    # --- deploy_stack ---
-    if name == "deploy_stack":
-        inp = DeployStackInput(**arguments)
-        result = await client.deploy_stack(
-            inp.endpoint_id,
-            inp.stack_name,
-            inp.compose_content,
-            inp.env_vars,
-        )
-        return _ok({"result": "deployed", "stack": result})
-
-    return _err(f"Unknown tool: {name!r}")
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _err(f"Unknown tool: {name!r}")
+    return await handler(arguments, client)
 
 
 # ---------------------------------------------------------------------------
@@ -329,8 +372,11 @@ async def _dispatch(
 
 async def _serve() -> None:
     log.info("server.starting", name="portainer-mcp")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await aclose_shared()
 
 
 def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
@@ -341,6 +387,13 @@ def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
 
     sse = SseServerTransport("/messages/")
 
+    @asynccontextmanager
+    async def _lifespan(_: Starlette) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await aclose_shared()
+
     async def handle_sse(request: Request) -> None:
         async with sse.connect_sse(
             request.scope, request.receive, request._send  # type: ignore[attr-defined]
@@ -351,7 +404,8 @@ def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
         routes=[
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
-        ]
+        ],
+        lifespan=_lifespan,
     )
 
 
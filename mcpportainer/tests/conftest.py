@@ -0,0 +1,69 @@
+"""Shared fixtures for the portainer-mcp test suite."""
+from __future__ import annotations
+
+from typing import AsyncIterator, Iterator
+
+import pytest
+import pytest_asyncio
+import respx
+
+from portainer_mcp import client as client_module
+from portainer_mcp.client import PortainerClient
+
+from tests.helpers import BASE, make_settings
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def portainer_client() -> AsyncIterator[PortainerClient]:
+    """One entered client for the whole session, so the httpx pool is built once."""
+    async with PortainerClient(make_settings()) as client:
+        yield client
+    await client_module.aclose_shared()
+
+
+@pytest_asyncio.fixture
+async def fresh_pool(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    """Give a test its own shared-pool slot so it cannot close the session client's pool."""
+    monkeypatch.setattr(client_module, "_shared_client", None)
+    monkeypatch.setattr(client_module, "_shared_key", None)
+    yield
+    await client_module.aclose_shared()
+
+
+@pytest.fixture(scope="module")
+def respx_router() -> Iterator[respx.MockRouter]:
+    """One router per module with every Portainer route registered up front.
+
+    Tests pick a route by name and set its response with ``.respond()`` or
+    ``.side_effect`` instead of building a new router each time.
+    """
+    with respx.mock(base_url=f"{BASE}/api", assert_all_called=False) as router:
+        router.get("/status", name="health")
+        router.get("/stacks", name="list_stacks")
+        router.post("/stacks/create/standalone/string", name="create_stack")
+        router.put(path__regex=r"/stacks/(?P<stack_id>\d+)$", name="update_stack")
+        router.get(
+            path__regex=r"/endpoints/(?P<endpoint_id>\d+)/docker/containers/json$",
+            name="list_containers",
+        )
+        router.post(
+            path__regex=r"/endpoints/\d+/docker/containers/(?P<container_id>[^/]+)/start$",
+            name="start_container",
+        )
+        router.post(
+            path__regex=r"/endpoints/\d+/docker/containers/(?P<container_id>[^/]+)/stop$",
+            name="stop_container",
+        )
+        router.get(
+            path__regex=r"/endpoints/\d+/docker/containers/(?P<container_id>[^/]+)/logs$",
+            name="container_logs",
+        )
+        yield router
+
+
+@pytest.fixture
+def portainer_api(respx_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """The module router with per-test responses and call stats rolled back afterwards."""
+    respx_router.snapshot()
+    yield respx_router
+    respx_router.rollback()
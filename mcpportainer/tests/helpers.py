@@ -0,0 +1,15 @@
+"""Plain test helpers shared by the portainer-mcp test modules and fixtures."""
+from __future__ import annotations
+
+from portainer_mcp.config import Settings
+
+BASE = "https://portainer.test"
+
+
+def make_settings(api_token: str = "ptr_test_token") -> Settings:
+    return Settings(
+        portainer_url=BASE,
+        api_token=api_token,
+        ssl_verify=False,
+        timeout=5.0,
+    )
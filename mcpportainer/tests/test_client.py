@@ -1,31 +1,29 @@
 """Tests for the Portainer API client (mocked HTTP layer)."""
 from __future__ import annotations
 
+import time
 from typing import Any
 import json
 import pytest
 import httpx
-import respx
+from structlog.testing import capture_logs
 
+from portainer_mcp import client as client_module
 from portainer_mcp.client import PortainerClient, PortainerAPIError
 from portainer_mcp.config import Settings
 
-BASE = "https://portainer.test"
+from tests.helpers import BASE, make_settings
 
 
 def _settings(**kwargs: Any) -> Settings:
-    return Settings(
-        portainer_url=BASE,
-        api_token=kwargs.get("api_token", "ptr_test_token"),
-        ssl_verify=False,
-        timeout=5.0,
-    )
+    return make_settings(api_token=kwargs.get("api_token", "ptr_test_token"))
 
 
 # ---------------------------------------------------------------------------
 # Auth header selection
 # ---------------------------------------------------------------------------
 
+@pytest.mark.usefixtures("fresh_pool")
 class TestAuthHeaders:
     @pytest.mark.asyncio
     async def test_ptr_token_uses_x_api_key(self):
@@ -40,20 +38,20 @@ class TestAuthHeaders:
         async with PortainerClient(settings) as client:
             assert client._headers.get("Authorization", "").startswith("Bearer ")
 
+    def test_headers_shared_per_token(self):
+        settings = _settings(api_token="ptr_some_token")
+        assert PortainerClient(settings)._headers is PortainerClient(settings)._headers
+
 
 # ---------------------------------------------------------------------------
 # health
 # ---------------------------------------------------------------------------
 
 class TestHealth:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_health_ok(self):
-        respx.get(f"{BASE}/api/status").mock(
-            return_value=httpx.Response(200, json={"Version": "2.21.0"})
-        )
-        async with PortainerClient(_settings()) as client:
-            result = await client.health()
+    async def test_health_ok(self, portainer_client, portainer_api):
+        portainer_api["health"].respond(200, json={"Version": "2.21.0"})
+        result = await portainer_client.health()
         assert result["Version"] == "2.21.0"
 
 
@@ -62,37 +60,30 @@ class TestHealth:
 # ---------------------------------------------------------------------------
 
 class TestListContainers:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_returns_containers(self):
-        respx.get(f"{BASE}/api/endpoints/1/docker/containers/json").mock(
-            return_value=httpx.Response(200, json=[{"Id": "abc123", "Names": ["/web"], "State": "running"}])
+    async def test_returns_containers(self, portainer_client, portainer_api):
+        portainer_api["list_containers"].respond(
+            200, json=[{"Id": "abc123", "Names": ["/web"], "State": "running"}]
         )
-        async with PortainerClient(_settings()) as client:
-            result = await client.list_containers(1)
+        result = await portainer_client.list_containers(1)
         assert result[0]["Id"] == "abc123"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_raises_on_401(self):
-        respx.get(f"{BASE}/api/endpoints/1/docker/containers/json").mock(
-            return_value=httpx.Response(401, json={"message": "Unauthorized"})
-        )
-        async with PortainerClient(_settings()) as client:
-            with pytest.raises(PortainerAPIError) as exc_info:
-                await client.list_containers(1)
+    async def test_raises_on_401(self, portainer_client, portainer_api):
+        portainer_api["list_containers"].respond(401, json={"message": "Unauthorized"})
+        with pytest.raises(PortainerAPIError) as exc_info:
+            await portainer_client.list_containers(1)
         assert exc_info.value.status_code == 401
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_raises_on_404(self):
-        respx.get(f"{BASE}/api/endpoints/99/docker/containers/json").mock(
-            return_value=httpx.Response(404)
-        )
-        async with PortainerClient(_settings()) as client:
-            with pytest.raises(PortainerAPIError) as exc_info:
-                await client.list_containers(99)
+    async def test_raises_on_404(self, portainer_client, portainer_api):
+        portainer_api["list_containers"].respond(404)
+        with pytest.raises(PortainerAPIError) as exc_info:
+            await portainer_client.list_containers(99)
         assert exc_info.value.status_code == 404
+        assert portainer_api["list_containers"].calls.last.request.url.path.startswith(
+            "/api/endpoints/99/"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -100,23 +91,17 @@ class TestListContainers:
 # ---------------------------------------------------------------------------
 
 class TestContainerLifecycle:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_stop_container(self):
-        respx.post(f"{BASE}/api/endpoints/1/docker/containers/abc/stop").mock(
-            return_value=httpx.Response(204)
-        )
-        async with PortainerClient(_settings()) as client:
-            await client.stop_container(1, "abc")  # should not raise
+    async def test_stop_container(self, portainer_client, portainer_api):
+        portainer_api["stop_container"].respond(204)
+        await portainer_client.stop_container(1, "abc")  # should not raise
+        assert portainer_api["stop_container"].called
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_start_container(self):
-        respx.post(f"{BASE}/api/endpoints/1/docker/containers/abc/start").mock(
-            return_value=httpx.Response(204)
-        )
-        async with PortainerClient(_settings()) as client:
-            await client.start_container(1, "abc")  # should not raise
+    async def test_start_container(self, portainer_client, portainer_api):
+        portainer_api["start_container"].respond(204)
+        await portainer_client.start_container(1, "abc")  # should not raise
+        assert portainer_api["start_container"].called
 
 
 # ---------------------------------------------------------------------------
@@ -124,12 +109,96 @@ class TestContainerLifecycle:
 # ---------------------------------------------------------------------------
 
 class TestListStacks:
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_returns_stacks(self):
-        respx.get(f"{BASE}/api/stacks").mock(
-            return_value=httpx.Response(200, json=[{"Id": 1, "Name": "mystack", "EndpointId": 1, "Status": 1}])
+    async def test_returns_stacks(self, portainer_client, portainer_api):
+        portainer_api["list_stacks"].respond(
+            200, json=[{"Id": 1, "Name": "mystack", "EndpointId": 1, "Status": 1}]
         )
-        async with PortainerClient(_settings()) as client:
-            stacks = await client.list_stacks()
+        stacks = await portainer_client.list_stacks()
         assert stacks[0]["Name"] == "mystack"
+
+
+# ---------------------------------------------------------------------------
+# deploy_stack
+# ---------------------------------------------------------------------------
+
+class TestDeployStack:
+    @pytest.fixture(autouse=True)
+    def _clear_stack_cache(self):
+        client_module._stack_id_cache.clear()
+        yield
+        client_module._stack_id_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_create_populates_cache_and_update_skips_list(self, portainer_client, portainer_api):
+        portainer_api["list_stacks"].respond(200, json=[])
+        portainer_api["create_stack"].respond(200, json={"Id": 7, "Name": "web"})
+        portainer_api["update_stack"].respond(200, json={"Id": 7, "Name": "web"})
+        await portainer_client.deploy_stack(1, "web", "services: {}")
+        result = await portainer_client.deploy_stack(1, "web", "services: {}")
+        assert result["Id"] == 7
+        assert portainer_api["list_stacks"].call_count == 1
+        assert portainer_api["update_stack"].call_count == 1
+        assert portainer_api["update_stack"].calls.last.request.url.path == "/api/stacks/7"
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_entry_falls_back_to_list(self, portainer_client, portainer_api):
+        client_module._stack_id_cache[(f"{BASE}/api/", "web")] = (3, time.monotonic())
+        portainer_api["update_stack"].side_effect = [
+            httpx.Response(404),
+            httpx.Response(200, json={"Id": 8, "Name": "web"}),
+        ]
+        portainer_api["list_stacks"].respond(200, json=[{"Id": 8, "Name": "web"}])
+        result = await portainer_client.deploy_stack(1, "web", "services: {}")
+        assert result["Id"] == 8
+        assert [c.request.url.path for c in portainer_api["update_stack"].calls] == [
+            "/api/stacks/3",
+            "/api/stacks/8",
+        ]
+        assert client_module._stack_id_cache[(f"{BASE}/api/", "web")][0] == 8
+
+
+# ---------------------------------------------------------------------------
+# container_logs
+# ---------------------------------------------------------------------------
+
+class TestContainerLogs:
+    @pytest.mark.asyncio
+    async def test_returns_decoded_logs(self, portainer_client, portainer_api):
+        portainer_api["container_logs"].respond(200, content=b"line one\nline two\n")
+        logs = await portainer_client.container_logs(1, "abc", tail=50)
+        assert logs == "line one\nline two\n"
+        assert portainer_api["container_logs"].calls.last.request.url.params["tail"] == "50"
+
+    @pytest.mark.asyncio
+    async def test_raises_on_error(self, portainer_client, portainer_api):
+        portainer_api["container_logs"].respond(500, text="boom")
+        with capture_logs() as logs, pytest.raises(PortainerAPIError, match="boom") as exc_info:
+            await portainer_client.container_logs(1, "abc")
+        assert exc_info.value.status_code == 500
+        assert [(e["event"], e["status"]) for e in logs] == [("portainer.api_call", 500)]
+
+
+# ---------------------------------------------------------------------------
+# Shared httpx client
+# ---------------------------------------------------------------------------
+
+@pytest.mark.usefixtures("fresh_pool")
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_clients_reuse_pool_until_closed(self):
+        async with PortainerClient(_settings()) as first:
+            pool = first._client
+        async with PortainerClient(_settings()) as second:
+            assert second._client is pool
+        await client_module.aclose_shared()
+        assert pool.is_closed
+
+    @pytest.mark.asyncio
+    async def test_token_change_rebuilds_pool(self):
+        async with PortainerClient(_settings(api_token="ptr_a")) as first:
+            pool = first._client
+        async with PortainerClient(_settings(api_token="ptr_b")) as second:
+            assert second._client is not pool
+        assert pool.is_closed
+        await client_module.aclose_shared()
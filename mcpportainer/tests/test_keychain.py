@@ -6,9 +6,19 @@ import subprocess
 
 import pytest
 
+from portainer_mcp import keychain
 from portainer_mcp.keychain import store_secret, retrieve_secret, delete_secret
 
 
+@pytest.fixture(autouse=True)
+def _force_security_cli():
+    """Route every lookup through the patched CLI and start with a cold cache."""
+    retrieve_secret.cache_clear()
+    with patch.object(keychain, "_USE_KEYRING", False):
+        yield
+    retrieve_secret.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Helper: mock a successful security CLI response
 # ---------------------------------------------------------------------------
@@ -16,8 +26,8 @@ from portainer_mcp.keychain import store_secret, retrieve_secret, delete_secret
 def _mock_proc(returncode: int = 0, stdout: str = "", stderr: str = "") -> MagicMock:
     m = MagicMock(spec=subprocess.CompletedProcess)
     m.returncode = returncode
-    m.stdout = stdout
-    m.stderr = stderr
+    m.stdout = stdout.encode()
+    m.stderr = stderr.encode()
     return m
 
 
@@ -30,16 +40,14 @@ class TestStoreSecret:
         with patch("portainer_mcp.keychain._run_security") as mock_sec:
             mock_sec.return_value = _mock_proc(returncode=0)
             store_secret("portainer-token", "mytoken")
-            # Called twice: delete (cleanup) then add
-            assert mock_sec.call_count == 2
+            # Single add with -U (update in place)
+            assert mock_sec.call_count == 1
+            assert "-U" in mock_sec.call_args.args
 
     def test_raises_on_add_failure(self):
         with patch("portainer_mcp.keychain._run_security") as mock_sec:
-            mock_sec.side_effect = [
-                _mock_proc(returncode=0),        # delete (ok)
-                _mock_proc(returncode=1, stderr="error"), # add fails
-            ]
-            with pytest.raises(RuntimeError, match="Keychain store failed"):
+            mock_sec.return_value = _mock_proc(returncode=1, stderr="error")
+            with pytest.raises(RuntimeError, match="Keychain store failed.*: error"):
                 store_secret("portainer-token", "mytoken")
 
 
@@ -60,6 +68,21 @@ class TestRetrieveSecret:
             result = retrieve_secret("portainer-token")
         assert result is None
 
+    def test_repeated_lookup_is_cached(self):
+        with patch("portainer_mcp.keychain._run_security") as mock_sec:
+            mock_sec.return_value = _mock_proc(returncode=0, stdout="mytoken\n")
+            retrieve_secret("portainer-token")
+            retrieve_secret("portainer-token")
+        assert mock_sec.call_count == 1
+
+    def test_store_invalidates_cache(self):
+        with patch("portainer_mcp.keychain._run_security") as mock_sec:
+            mock_sec.return_value = _mock_proc(returncode=0, stdout="old\n")
+            assert retrieve_secret("portainer-token") == "old"
+            store_secret("portainer-token", "new")
+            mock_sec.return_value = _mock_proc(returncode=0, stdout="new\n")
+            assert retrieve_secret("portainer-token") == "new"
+
     def test_returns_none_for_empty_value(self):
         with patch("portainer_mcp.keychain._run_security") as mock_sec:
             mock_sec.return_value = _mock_proc(returncode=0, stdout="   ")
@@ -32,7 +32,7 @@ class TestContainerInput:
         assert m.container_id == "abc123"
 
     def test_rejects_shell_metacharacters(self):
-        for bad in ["abc;ls", "cmd|grep", "$(evil)", "`cmd`"]:
+        for bad in ["abc;ls", "cmd|grep", "$(evil)", "`cmd`", "a\\b", 'a"b']:
             with pytest.raises(ValidationError, match="illegal characters"):
                 ContainerInput(endpoint_id=1, container_id=bad)
 
@@ -81,6 +81,14 @@ class TestDeployStackInput:
                 compose_content="version: '3'",
             )
 
+    def test_rejects_trailing_newline_in_stack_name(self):
+        with pytest.raises(ValidationError, match="alphanumerics"):
+            DeployStackInput(
+                endpoint_id=1,
+                stack_name="ok\n",
+                compose_content="version: '3'",
+            )
+
     def test_rejects_empty_compose(self):
         with pytest.raises(ValidationError):
             DeployStackInput(endpoint_id=1, stack_name="ok", compose_content="")
@@ -10,15 +10,44 @@ All methods raise ``ProxmoxAPIError`` on non-2xx responses.
 """
 from __future__ import annotations
 
+import logging
 import time
-from typing import Any, Optional
+import urllib.request
+from contextlib import aclosing
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Optional
+from urllib.parse import urlsplit
 
 import httpx
-import structlog
+import orjson
+
+try:
+    import ijson as _ijson
+except ImportError:  # optional: install the "stream" extra for incremental parsing
+    _ijson = None
 
 from proxmox_mcp.config import Settings
 
-log = structlog.get_logger(__name__)
+# Per-call API logging goes through stdlib logging so formatting is deferred
+# until a handler actually emits; structlog is kept for lifecycle events.
+_logger = logging.getLogger("proxmox_mcp.client")
+
+# Resolved once rather than per call; refresh after changing the logger's level
+_timing_enabled = _logger.isEnabledFor(logging.INFO)
+
+
+def refresh_call_logging() -> None:
+    """Re-read whether per-call API logging (and its timing) is enabled."""
+    global _timing_enabled
+    _timing_enabled = _logger.isEnabledFor(logging.INFO)
+
+
+# Bodies larger than this are parsed incrementally by _request_stream when ijson is available
+_STREAM_THRESHOLD = 256 * 1024
+
+# One pooled httpx client per process so TCP/TLS connections survive across tool calls
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_key: Optional[tuple[Any, ...]] = None
 
 
 class ProxmoxAPIError(Exception):
@@ -29,17 +58,107 @@ class ProxmoxAPIError(Exception):
         super().__init__(f"Proxmox API error {status_code}: {message}")
 
 
+def _generic_error(response: httpx.Response, path: str) -> ProxmoxAPIError:
+    return ProxmoxAPIError(response.status_code, response.text[:500])
+
+
+# Status code → error factory; anything unlisted falls back to _generic_error
+_STATUS_ERRORS: dict[int, Callable[[httpx.Response, str], ProxmoxAPIError]] = {
+    401: lambda r, p: ProxmoxAPIError(
+        401, "Unauthorized — check your API token (format: user@realm!tokenid=uuid)"
+    ),
+    403: lambda r, p: ProxmoxAPIError(403, "Forbidden — token lacks permission for this operation"),
+    404: lambda r, p: ProxmoxAPIError(404, f"Not found: {p}"),
+    500: lambda r, p: ProxmoxAPIError(500, f"Proxmox internal error: {r.text[:500]}"),
+}
+
+
+def _unwrap(payload: Any) -> Any:
+    """Return ``payload["data"]``, or *payload* itself if it is not an envelope."""
+    # Proxmox always wraps in {"data": ...}; only unexpected shapes pay for the except
+    try:
+        return payload["data"]
+    except (KeyError, TypeError):
+        return payload
+
+
+@lru_cache(maxsize=256)
+def _guest_path(kind: str, node: str, vmid: int, action: str) -> str:
+    """Return ``nodes/{node}/{kind}/{vmid}/status/{action}``, interned per guest.
+
+    Status-polling loops hit the same few guests repeatedly; caching hands back
+    one string per (kind, node, vmid, action) instead of formatting a new one.
+    """
+    return f"nodes/{node}/{kind}/{vmid}/status/{action}"
+
+
+def _env_proxy(url: str) -> Optional[str]:
+    """Return the proxy the environment sets for *url*, or None.
+
+    Passing ``transport=`` stops httpx from building its own proxy mounts from
+    ``HTTPS_PROXY``/``HTTP_PROXY``/``ALL_PROXY``, so the lookup (including
+    ``NO_PROXY``) is done here instead.
+    """
+    parts = urlsplit(url)
+    proxies = urllib.request.getproxies_environment()
+    if urllib.request.proxy_bypass_environment(parts.hostname or "", proxies):
+        return None
+    return proxies.get(parts.scheme) or proxies.get("all")
+
+
+async def get_shared_client(settings: Settings) -> httpx.AsyncClient:
+    """Return the process-wide httpx client, creating it on first use.
+
+    The client is rebuilt if *settings* point at a different URL or token.
+    """
+    global _shared_client, _shared_key
+    key = (settings.proxmox_url, settings.api_token, settings.ssl_verify, settings.timeout)
+    if _shared_client is not None and not _shared_client.is_closed and _shared_key == key:
+        return _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    # Proxmox API base path — reverse proxy strips the port, path stays
+    _shared_client = httpx.AsyncClient(
+        base_url=settings.proxmox_url + "/api2/json/",
+        headers={
+            "Authorization": f"PVEAPIToken={settings.api_token}",
+            "Accept": "application/json",
+        },
+        timeout=settings.httpx_timeout,
+        # HTTP/2 lets concurrent calls multiplex over one TLS session; transport-level
+        # retries cover connection failures (verify/limits must live on the transport)
+        transport=httpx.AsyncHTTPTransport(
+            verify=settings.ssl_verify,
+            http2=True,
+            limits=settings.httpx_limits,
+            retries=1,
+            proxy=_env_proxy(settings.proxmox_url),
+        ),
+    )
+    _shared_key = key
+    return _shared_client
+
+
+async def aclose_shared() -> None:
+    """Close the process-wide httpx client. Call once at server shutdown."""
+    global _shared_client, _shared_key
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_key = None
+
+
 class ProxmoxClient:
-    """Async context-manager wrapper around the Proxmox VE REST API."""
+    """Async context-manager wrapper around the Proxmox VE REST API.
+
+    Entering the context borrows the shared pooled httpx client; exiting does
+    not close it (see ``aclose_shared``). The pool speaks HTTP/2, so parallel
+    calls should share one ``ProxmoxClient`` instance to multiplex over a
+    single connection.
+    """
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        # Proxmox API base path — reverse proxy strips the port, path stays
-        self._base_url = settings.proxmox_url.rstrip("/") + "/api2/json/"
-        self._headers = {
-            "Authorization": f"PVEAPIToken={settings.api_token}",
-            "Accept": "application/json",
-        }
         self._client: Optional[httpx.AsyncClient] = None
 
     # ------------------------------------------------------------------
@@ -47,18 +166,11 @@ class ProxmoxClient:
     # ------------------------------------------------------------------
 
     async def __aenter__(self) -> "ProxmoxClient":
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            headers=self._headers,
-            verify=self._settings.ssl_verify,
-            timeout=self._settings.timeout,
-        )
+        self._client = await get_shared_client(self._settings)
         return self
 
     async def __aexit__(self, *_: Any) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -72,39 +184,69 @@ class ProxmoxClient:
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         """Make a request and unwrap the Proxmox ``{"data": ...}`` envelope."""
         client = self._client_or_raise()
-        t0 = time.monotonic()
-        response = await client.request(method, path, **kwargs)
-        elapsed = round((time.monotonic() - t0) * 1000)
-
-        log.info(
-            "proxmox.api_call",
-            method=method,
-            path=path,
-            status=response.status_code,
-            elapsed_ms=elapsed,
-        )
+        if _timing_enabled:
+            t0 = time.monotonic()
+            response = await client.request(method, path, **kwargs)
+            _logger.info(
+                "api_call method=%s path=%s status=%d elapsed_ms=%d",
+                method,
+                path,
+                response.status_code,
+                (time.monotonic() - t0) * 1000,
+            )
+        else:
+            response = await client.request(method, path, **kwargs)
 
-        if response.status_code == 401:
-            raise ProxmoxAPIError(401, "Unauthorized — check your API token (format: user@realm!tokenid=uuid)")
-        if response.status_code == 403:
-            raise ProxmoxAPIError(403, "Forbidden — token lacks permission for this operation")
-        if response.status_code == 404:
-            raise ProxmoxAPIError(404, f"Not found: {path}")
-        if response.status_code == 500:
-            body = response.text[:500]
-            raise ProxmoxAPIError(500, f"Proxmox internal error: {body}")
         if not response.is_success:
-            body = response.text[:500]
-            raise ProxmoxAPIError(response.status_code, body)
+            raise _STATUS_ERRORS.get(response.status_code, _generic_error)(response, path)
 
         if not response.content:
             return None
 
-        payload = response.json()
-        # Proxmox always wraps in {"data": ...}
-        if isinstance(payload, dict) and "data" in payload:
-            return payload["data"]
-        return payload
+        return _unwrap(orjson.loads(response.content))
+
+    async def _request_stream(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[Any]:
+        """Yield the items of a list-valued ``{"data": [...]}`` response one at a time.
+
+        Bodies over ``_STREAM_THRESHOLD``, or without a Content-Length (chunked
+        or HTTP/2 streamed responses), are fed chunk by chunk to ijson so the
+        full array is never buffered. Small bodies, and installs without ijson,
+        are parsed in one go.
+        """
+        client = self._client_or_raise()
+        if _timing_enabled:
+            t0 = time.monotonic()
+        async with client.stream(method, path, **kwargs) as response:
+            if _timing_enabled:
+                # Timed to the response headers; the body is consumed as it is iterated
+                _logger.info(
+                    "api_call method=%s path=%s status=%d elapsed_ms=%d",
+                    method,
+                    path,
+                    response.status_code,
+                    (time.monotonic() - t0) * 1000,
+                )
+            if not response.is_success:
+                await response.aread()
+                raise _STATUS_ERRORS.get(response.status_code, _generic_error)(response, path)
+
+            length = response.headers.get("content-length")
+            if _ijson is None or (length is not None and int(length) <= _STREAM_THRESHOLD):
+                body = await response.aread()
+                for item in (_unwrap(orjson.loads(body)) if body else None) or ():
+                    yield item
+                return
+
+            items = _ijson.sendable_list()
+            parser = _ijson.items_coro(items, "data.item", use_float=True)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
 
     async def _get(self, path: str, **params: Any) -> Any:
         return await self._request("GET", path, params=params or None)
@@ -130,11 +272,27 @@ class ProxmoxClient:
         result = await self._get("cluster/status")
         return result or []
 
+    async def get_cluster_resources(self) -> list[dict[str, Any]]:
+        """Return every node, guest and storage in the cluster in a single call."""
+        result = await self._get("cluster/resources")
+        return result or []
+
     async def list_tasks(self, limit: int = 50) -> list[dict[str, Any]]:
-        """Return recent cluster-wide tasks."""
-        result = await self._get("cluster/tasks")
-        tasks = result or []
-        return tasks[:limit]
+        """Return recent cluster-wide tasks.
+
+        *limit* is sent to Proxmox so only the requested tasks cross the wire;
+        reading stops early for versions that ignore the parameter.
+        """
+        tasks: list[dict[str, Any]] = []
+        if limit <= 0:
+            return tasks
+        stream = self._request_stream("GET", "cluster/tasks", params={"limit": limit})
+        async with aclosing(stream):
+            async for task in stream:
+                tasks.append(task)
+                if len(tasks) >= limit:
+                    break
+        return tasks
 
     # ------------------------------------------------------------------
     # Nodes
@@ -156,33 +314,32 @@ class ProxmoxClient:
 
     async def list_vms(self, node: str) -> list[dict[str, Any]]:
         """Return all QEMU VMs on a node."""
-        result = await self._get(f"nodes/{node}/qemu")
-        return result or []
+        return [vm async for vm in self._request_stream("GET", f"nodes/{node}/qemu")]
 
     async def get_vm_status(self, node: str, vmid: int) -> dict[str, Any]:
         """Return current status of a QEMU VM."""
-        result = await self._get(f"nodes/{node}/qemu/{vmid}/status/current")
+        result = await self._get(_guest_path("qemu", node, vmid, "current"))
         return result or {}
 
     async def start_vm(self, node: str, vmid: int) -> Any:
         """Start a QEMU VM. Returns a task UPID."""
-        return await self._post(f"nodes/{node}/qemu/{vmid}/status/start")
+        return await self._post(_guest_path("qemu", node, vmid, "start"))
 
     async def stop_vm(self, node: str, vmid: int) -> Any:
         """Force-stop a QEMU VM (like pulling the power). Returns a task UPID."""
-        return await self._post(f"nodes/{node}/qemu/{vmid}/status/stop")
+        return await self._post(_guest_path("qemu", node, vmid, "stop"))
 
     async def shutdown_vm(self, node: str, vmid: int, timeout: int = 60) -> Any:
         """Gracefully shut down a QEMU VM (ACPI). Returns a task UPID."""
         return await self._request(
             "POST",
-            f"nodes/{node}/qemu/{vmid}/status/shutdown",
+            _guest_path("qemu", node, vmid, "shutdown"),
             data={"timeout": timeout},
         )
 
     async def reboot_vm(self, node: str, vmid: int) -> Any:
         """Reboot a QEMU VM. Returns a task UPID."""
-        return await self._post(f"nodes/{node}/qemu/{vmid}/status/reboot")
+        return await self._post(_guest_path("qemu", node, vmid, "reboot"))
 
     # ------------------------------------------------------------------
     # LXC Containers
@@ -195,22 +352,22 @@ class ProxmoxClient:
 
     async def get_lxc_status(self, node: str, vmid: int) -> dict[str, Any]:
         """Return current status of an LXC container."""
-        result = await self._get(f"nodes/{node}/lxc/{vmid}/status/current")
+        result = await self._get(_guest_path("lxc", node, vmid, "current"))
         return result or {}
 
     async def start_lxc(self, node: str, vmid: int) -> Any:
         """Start an LXC container. Returns a task UPID."""
-        return await self._post(f"nodes/{node}/lxc/{vmid}/status/start")
+        return await self._post(_guest_path("lxc", node, vmid, "start"))
 
     async def stop_lxc(self, node: str, vmid: int) -> Any:
         """Force-stop an LXC container. Returns a task UPID."""
-        return await self._post(f"nodes/{node}/lxc/{vmid}/status/stop")
+        return await self._post(_guest_path("lxc", node, vmid, "stop"))
 
     async def shutdown_lxc(self, node: str, vmid: int, timeout: int = 60) -> Any:
         """Gracefully shut down an LXC container. Returns a task UPID."""
         return await self._request(
             "POST",
-            f"nodes/{node}/lxc/{vmid}/status/shutdown",
+            _guest_path("lxc", node, vmid, "shutdown"),
             data={"timeout": timeout},
         )
 
@@ -15,10 +15,12 @@ Never write secrets back to any file from this module.
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import httpx
 import yaml
 import structlog
 
@@ -31,10 +33,28 @@ _CONFIG_FILE = Path.home() / ".config" / "proxmox-mcp" / "config.yaml"
 _KEYCHAIN_TOKEN_ACCOUNT = "proxmox-token"
 _KEYCHAIN_URL_ACCOUNT = "proxmox-url"
 
+# Upper bound on concurrent per-item requests for "detailed" list tools; PVE
+# degrades under bursts of parallel API calls. The HTTP pool is sized to match.
+FANOUT_LIMIT = 16
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class Settings:
     """Runtime configuration resolved at startup."""
 
+    __slots__ = (
+        "proxmox_url",
+        "api_token",
+        "ssl_verify",
+        "timeout",
+        "httpx_timeout",
+        "httpx_limits",
+    )
+
     def __init__(
         self,
         proxmox_url: str,
@@ -46,6 +66,15 @@ class Settings:
         self.api_token = api_token  # full string: user@realm!tokenid=uuid
         self.ssl_verify = ssl_verify
         self.timeout = timeout
+        # Built once here so the HTTP client reuses them instead of converting the float
+        self.httpx_timeout = httpx.Timeout(timeout)
+        # HTTP/2 multiplexes everything over one connection; the cap only matters on
+        # an HTTP/1.1 fallback, where it matches the server's detailed-listing fan-out
+        self.httpx_limits = httpx.Limits(
+            max_connections=FANOUT_LIMIT,
+            max_keepalive_connections=FANOUT_LIMIT,
+            keepalive_expiry=60,
+        )
 
     def __repr__(self) -> str:
         return (
@@ -57,13 +86,25 @@ class Settings:
 def _load_yaml_config() -> dict:
     """Load optional YAML config file, returning an empty dict if absent."""
     if _CONFIG_FILE.exists():
-        with _CONFIG_FILE.open() as f:
-            data = yaml.safe_load(f) or {}
+        # Hand libyaml the raw bytes; it detects the encoding itself
+        data = yaml.load(_CONFIG_FILE.read_bytes(), Loader=_SafeLoader) or {}
         log.info("config.yaml_loaded", path=str(_CONFIG_FILE))
         return data
     return {}
 
 
+def _keychain_lookup(accounts: list[str]) -> dict[str, Optional[str]]:
+    """Fetch several Keychain entries concurrently.
+
+    Each lookup may fork the `security` CLI, so running them side by side
+    costs one process round trip instead of one per account.
+    """
+    if len(accounts) < 2:
+        return {account: retrieve_secret(account) for account in accounts}
+    with ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+        return dict(zip(accounts, pool.map(retrieve_secret, accounts)))
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Resolve and return the global Settings singleton.
@@ -72,10 +113,21 @@ def get_settings() -> Settings:
     """
     yaml_cfg = _load_yaml_config()
 
+    env_url = os.environ.get("PROXMOX_URL")
+    env_token = os.environ.get("PROXMOX_TOKEN")
+    secrets = _keychain_lookup([
+        account
+        for account, env_value in (
+            (_KEYCHAIN_URL_ACCOUNT, env_url),
+            (_KEYCHAIN_TOKEN_ACCOUNT, env_token),
+        )
+        if not env_value
+    ])
+
     # --- Proxmox URL ---
     url = (
-        os.environ.get("PROXMOX_URL")
-        or retrieve_secret(_KEYCHAIN_URL_ACCOUNT)
+        env_url
+        or secrets.get(_KEYCHAIN_URL_ACCOUNT)
         or yaml_cfg.get("proxmox_url")
     )
     if not url:
@@ -87,8 +139,8 @@ def get_settings() -> Settings:
 
     # --- API Token ---
     token = (
-        os.environ.get("PROXMOX_TOKEN")
-        or retrieve_secret(_KEYCHAIN_TOKEN_ACCOUNT)
+        env_token
+        or secrets.get(_KEYCHAIN_TOKEN_ACCOUNT)
         or yaml_cfg.get("proxmox_token")
     )
     if not token:
@@ -6,22 +6,24 @@ unexpected data reaching the Proxmox API.
 """
 from __future__ import annotations
 
-import re
-from typing import Any, Optional
-from pydantic import BaseModel, Field, field_validator
+import string
+from functools import partial
+from typing import Annotated, Any, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 
 # ---------------------------------------------------------------------------
 # Input validation helpers
 # ---------------------------------------------------------------------------
 
-_SAFE_NODE_RE = re.compile(r"^[a-zA-Z0-9_\-]{1,64}$")
-_SAFE_VMID_RE = re.compile(r"^\d{1,7}$")
+# Set membership runs in C with no regex engine setup.
+# Length limits are enforced by the Field constraints below.
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 
-def _require_safe_node(v: str) -> str:
-    if not _SAFE_NODE_RE.match(v):
-        raise ValueError("node name contains illegal characters or is too long")
+def _require_safe_name(v: str, label: str) -> str:
+    if not _SAFE_NAME_CHARS.issuperset(v):
+        raise ValueError(f"{label} contains illegal characters")
     return v
 
 
@@ -31,48 +33,57 @@ def _require_safe_vmid(v: int) -> int:
     return v
 
 
+_NodeName = Annotated[
+    str,
+    Field(description="Proxmox node name", min_length=1, max_length=64),
+    AfterValidator(partial(_require_safe_name, label="node name")),
+]
+_StorageId = Annotated[
+    str,
+    Field(description="Storage ID", min_length=1, max_length=64),
+    AfterValidator(partial(_require_safe_name, label="storage ID")),
+]
+
+
 # ---------------------------------------------------------------------------
 # MCP tool input schemas
 # ---------------------------------------------------------------------------
 
 
-class NodeInput(BaseModel):
+class _ToolInput(BaseModel):
+    """Base for tool inputs: immutable, since validated instances are cached and shared."""
+    model_config = ConfigDict(frozen=True)
+
+
+class NodeInput(_ToolInput):
     """Input requiring a node name."""
-    node: str = Field(..., description="Proxmox node name", min_length=1, max_length=64)
+    node: _NodeName
 
-    @field_validator("node")
-    @classmethod
-    def sanitize_node(cls, v: str) -> str:
-        return _require_safe_node(v)
 
+class NodeListInput(_ToolInput):
+    """Input for node-scoped list tools with optional per-item enrichment."""
+    node: _NodeName
+    detailed: bool = Field(
+        default=False,
+        description="Fetch per-item status/content concurrently and include it",
+    )
 
-class VmInput(BaseModel):
+
+class VmInput(_ToolInput):
     """Input for a QEMU VM or LXC operation on a specific node."""
-    node: str = Field(..., description="Proxmox node name", min_length=1, max_length=64)
+    node: _NodeName
     vmid: int = Field(..., description="VM or container ID (100–9999999)", ge=100, le=9_999_999)
 
-    @field_validator("node")
-    @classmethod
-    def sanitize_node(cls, v: str) -> str:
-        return _require_safe_node(v)
-
 
-class StorageInput(BaseModel):
+class StorageInput(_ToolInput):
     """Input for storage operations."""
-    node: str = Field(..., description="Proxmox node name", min_length=1, max_length=64)
-    storage: str = Field(..., description="Storage ID", min_length=1, max_length=64)
+    node: _NodeName
+    storage: _StorageId
 
-    @field_validator("node", "storage")
-    @classmethod
-    def sanitize_names(cls, v: str) -> str:
-        if not _SAFE_NODE_RE.match(v):
-            raise ValueError(f"'{v}' contains illegal characters")
-        return v
 
-
-class ShutdownVmInput(BaseModel):
+class ShutdownVmInput(_ToolInput):
     """Input for graceful VM/LXC shutdown with optional timeout."""
-    node: str = Field(..., description="Proxmox node name", min_length=1, max_length=64)
+    node: _NodeName
     vmid: int = Field(..., description="VM or container ID", ge=100, le=9_999_999)
     timeout: Optional[int] = Field(
         default=60,
@@ -80,8 +91,3 @@ class ShutdownVmInput(BaseModel):
         ge=1,
         le=600,
     )
-
-    @field_validator("node")
-    @classmethod
-    def sanitize_node(cls, v: str) -> str:
-        return _require_safe_node(v)
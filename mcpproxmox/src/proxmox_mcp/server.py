@@ -16,19 +16,20 @@ Exposes the following MCP tools:
   9.  list_storages        — list storage pools on a node
   10. get_storage_content  — list ISOs, templates, backups and VM disks
   11. list_tasks           — recent cluster-wide task history
+  12. get_cluster_overview — nodes, guests and storage from one API call
 
   Power Actions (QEMU VMs)
   ─────────────────────────
-  12. start_vm             — power on a stopped VM
-  13. stop_vm              — force-stop (hard power-off) a VM
-  14. shutdown_vm          — graceful ACPI shutdown with configurable timeout
-  15. reboot_vm            — reboot a running VM
+  13. start_vm             — power on a stopped VM
+  14. stop_vm              — force-stop (hard power-off) a VM
+  15. shutdown_vm          — graceful ACPI shutdown with configurable timeout
+  16. reboot_vm            — reboot a running VM
 
   Power Actions (LXC Containers)
   ────────────────────────────────
-  16. start_lxc            — start a stopped LXC container
-  17. stop_lxc             — force-stop an LXC container
-  18. shutdown_lxc         — graceful shutdown with configurable timeout
+  17. start_lxc            — start a stopped LXC container
+  18. stop_lxc             — force-stop an LXC container
+  19. shutdown_lxc         — graceful shutdown with configurable timeout
 
 Run:
     python -m proxmox_mcp.server
@@ -37,19 +38,30 @@ Run:
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import sys
+import time
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
 
+import orjson
 import structlog
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from proxmox_mcp.client import ProxmoxAPIError, ProxmoxClient
-from proxmox_mcp.config import get_settings
-from proxmox_mcp.models import NodeInput, VmInput, ShutdownVmInput, StorageInput
+from proxmox_mcp.client import (
+    ProxmoxAPIError,
+    ProxmoxClient,
+    aclose_shared,
+    refresh_call_logging,
+)
+from proxmox_mcp.config import FANOUT_LIMIT, get_settings
+from proxmox_mcp.models import NodeInput, NodeListInput, VmInput, ShutdownVmInput, StorageInput
 
 # ---------------------------------------------------------------------------
 # Dual-transport request parser (VSCode/Copilot ↔ Perplexity)
@@ -87,290 +99,457 @@ def parse_request(data: dict) -> tuple[str, dict]:
 # Logging setup — structured JSON to stderr, never to stdout (MCP uses stdout)
 # ---------------------------------------------------------------------------
 
+def _orjson_render(_: Any, __: str, event_dict: Any) -> str:
+    """Render the event dict as one JSON line with orjson instead of stdlib json."""
+    return orjson.dumps(event_dict, default=str).decode()
+
+
 structlog.configure(
     wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
+        _orjson_render,
     ],
 )
 
 log = structlog.get_logger(__name__)
 
+# The client logs API calls via stdlib logging; route them to stderr as well
+_client_logger = logging.getLogger("proxmox_mcp.client")
+if not _client_logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+    _client_logger.addHandler(_handler)
+    _client_logger.setLevel(logging.INFO)
+    _client_logger.propagate = False
+refresh_call_logging()
+
+# ---------------------------------------------------------------------------
+# Input validators — built once so each call goes straight to pydantic-core
+# ---------------------------------------------------------------------------
+
+_NODE_ADAPTER = TypeAdapter(NodeInput)
+_VM_ADAPTER = TypeAdapter(VmInput)
+_SHUTDOWN_ADAPTER = TypeAdapter(ShutdownVmInput)
+_STORAGE_ADAPTER = TypeAdapter(StorageInput)
+_NODE_LIST_ADAPTER = TypeAdapter(NodeListInput)
+
+
+@lru_cache(maxsize=2048)
+def _parse_cached(adapter: TypeAdapter[Any], items: tuple[tuple[str, Any], ...]) -> Any:
+    return adapter.validate_python(dict(items))
+
+
+def _parse(adapter: TypeAdapter[Any], arguments: dict) -> Any:
+    """Validate *arguments*, reusing the model from an identical earlier call.
+
+    Polling clients repeat the same (node, vmid) arguments, so the validated
+    model is memoised. The models are treated as read-only by the handlers.
+    Arguments with unhashable values skip the cache; failures are never cached.
+    """
+    key = tuple(sorted(arguments.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return adapter.validate_python(arguments)
+    return _parse_cached(adapter, key)
+
+
+# Reciprocals of the byte units; both are exact powers of two, so multiplying
+# gives bit-identical results to dividing
+_GIB_INV = 1.0 / (1 << 30)
+_MIB_INV = 1.0 / (1 << 20)
+
+
+async def _gather_bounded(coros: Iterable[Awaitable[Any]]) -> list[Any]:
+    """Await *coros* concurrently, at most FANOUT_LIMIT at a time.
+
+    Exceptions are returned in place of results so one failing item does not
+    sink the whole listing.
+    """
+    sem = asyncio.Semaphore(FANOUT_LIMIT)
+
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
+
+
+def _detail(result: Any) -> Any:
+    """Render a _gather_bounded result, turning exceptions into an error entry."""
+    if isinstance(result, BaseException):
+        return {"error": str(result)}
+    return result
+
+
 # ---------------------------------------------------------------------------
 # MCP Server
 # ---------------------------------------------------------------------------
 
 app = Server("proxmox-mcp")
 
+# Process-wide client, opened on first tool call and released when the server stops
+_CLIENT: Optional[ProxmoxClient] = None
+
+
+async def _get_client() -> ProxmoxClient:
+    """Return the long-lived ProxmoxClient, opening it on first use.
+
+    Raises:
+        RuntimeError: when settings cannot be resolved.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = await ProxmoxClient(get_settings()).__aenter__()
+    return _CLIENT
+
+
+async def _release_client() -> None:
+    """Drop the long-lived client and close its connection pool."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.__aexit__(None, None, None)
+        _CLIENT = None
+    await aclose_shared()
+
+
+def _json_default(o: object) -> object:
+    """orjson fallback, only reached for types it cannot encode natively.
+
+    datetime, UUID and dataclasses are handled by orjson itself. The streamed
+    parser runs with use_float=True, so Decimal only appears if a handler builds
+    one; it becomes a number rather than a quoted string.
+    """
+    if isinstance(o, Decimal):
+        return float(o)
+    return str(o)
+
+
+_OK_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+_OK_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS
+# Lists longer than this (e.g. big backup stores) are emitted without indentation;
+# the whitespace would otherwise add a large share of the response size
+_COMPACT_OVER = 256
+
 
 def _ok(data: object) -> list[types.TextContent]:
     """Wrap a result as a JSON TextContent response."""
-    return [types.TextContent(type="text", text=json.dumps(data, indent=2, default=str))]
+    option = (
+        _OK_COMPACT_OPTIONS
+        if isinstance(data, list) and len(data) > _COMPACT_OVER
+        else _OK_OPTIONS
+    )
+    text = orjson.dumps(data, default=_json_default, option=option).decode()
+    return [types.TextContent(type="text", text=text)]
+
 
+def _validation_message(e: ValidationError) -> str:
+    """Return ``loc: msg`` for the first error, skipping Pydantic's multi-line report."""
+    first = e.errors(include_url=False, include_input=False)[0]
+    loc = ".".join(map(str, first["loc"]))
+    return f"{loc}: {first['msg']}" if loc else first["msg"]
 
-def _err(message: str) -> list[types.TextContent]:
-    """Wrap an error message as a TextContent response."""
-    return [types.TextContent(type="text", text=json.dumps({"error": message}))]
+
+def _error_content(message: str) -> types.TextContent:
+    return types.TextContent(type="text", text=orjson.dumps({"error": message}).decode())
+
+
+# Only fixed messages go through the cache; one-off API error bodies would evict them
+_cached_error_content = lru_cache(maxsize=64)(_error_content)
+
+
+def _err(message: str, *, repeatable: bool = False) -> list[types.TextContent]:
+    """Wrap an error message as a TextContent response.
+
+    *repeatable* marks fixed messages (unknown tool, configuration errors) whose
+    encoded block is cached, so error storms reuse it; the list is always fresh.
+    """
+    content = _cached_error_content(message) if repeatable else _error_content(message)
+    return [content]
 
 
 # ---------------------------------------------------------------------------
 # Tool registry
 # ---------------------------------------------------------------------------
 
-@app.list_tools()
-async def list_tools() -> list[types.Tool]:
-    """Advertise all available tools to the MCP client."""
-    return [
-        # ── Health ──────────────────────────────────────────────────────────
-        types.Tool(
-            name="health_check",
-            description=(
-                "Validate Proxmox connectivity and API token validity. "
-                "Returns Proxmox VE version and release information."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+# Tool schemas are static, so the Tool objects are built once at import
+_TOOLS: list[types.Tool] = [
+    # ── Health ──────────────────────────────────────────────────────────
+    types.Tool(
+        name="health_check",
+        description=(
+            "Validate Proxmox connectivity and API token validity. "
+            "Returns Proxmox VE version and release information."
         ),
-
-        # ── Cluster ─────────────────────────────────────────────────────────
-        types.Tool(
-            name="get_cluster_status",
-            description=(
-                "Return cluster-wide status including all nodes, their online/offline "
-                "state, quorum votes, and cluster name."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+
+    # ── Cluster ─────────────────────────────────────────────────────────
+    types.Tool(
+        name="get_cluster_status",
+        description=(
+            "Return cluster-wide status including all nodes, their online/offline "
+            "state, quorum votes, and cluster name."
         ),
-        types.Tool(
-            name="list_tasks",
-            description="Return recent cluster-wide task history (up to 50 tasks by default).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of tasks to return (default 50, max 200)",
-                        "minimum": 1,
-                        "maximum": 200,
-                    },
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_cluster_overview",
+        description=(
+            "Return every node, QEMU VM, LXC container and storage in the cluster "
+            "from a single API call, grouped by type."
+        ),
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_tasks",
+        description="Return recent cluster-wide task history (up to 50 tasks by default).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of tasks to return (default 50, max 200)",
+                    "minimum": 1,
+                    "maximum": 200,
                 },
-                "required": [],
             },
+            "required": [],
+        },
+    ),
+
+    # ── Nodes ───────────────────────────────────────────────────────────
+    types.Tool(
+        name="list_nodes",
+        description=(
+            "List all Proxmox nodes in the cluster with CPU, memory, disk usage "
+            "summary and uptime."
         ),
-
-        # ── Nodes ───────────────────────────────────────────────────────────
-        types.Tool(
-            name="list_nodes",
-            description=(
-                "List all Proxmox nodes in the cluster with CPU, memory, disk usage "
-                "summary and uptime."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_node_status",
+        description=(
+            "Return detailed resource usage and hardware information for a specific "
+            "Proxmox node (CPU, memory, disk, kernel, PVE version)."
         ),
-        types.Tool(
-            name="get_node_status",
-            description=(
-                "Return detailed resource usage and hardware information for a specific "
-                "Proxmox node (CPU, memory, disk, kernel, PVE version)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                },
-                "required": ["node"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
             },
-        ),
-
-        # ── QEMU VMs ────────────────────────────────────────────────────────
-        types.Tool(
-            name="list_vms",
-            description="List all QEMU virtual machines on a Proxmox node.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
+            "required": ["node"],
+        },
+    ),
+
+    # ── QEMU VMs ────────────────────────────────────────────────────────
+    types.Tool(
+        name="list_vms",
+        description="List all QEMU virtual machines on a Proxmox node.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Also fetch each VM's current status (default false)",
                 },
-                "required": ["node"],
             },
+            "required": ["node"],
+        },
+    ),
+    types.Tool(
+        name="get_vm_status",
+        description=(
+            "Get the current power state and resource usage of a specific QEMU VM."
         ),
-        types.Tool(
-            name="get_vm_status",
-            description=(
-                "Get the current power state and resource usage of a specific QEMU VM."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
             },
-        ),
-        types.Tool(
-            name="start_vm",
-            description="Power on a stopped QEMU virtual machine. Returns the task UPID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="start_vm",
+        description="Power on a stopped QEMU virtual machine. Returns the task UPID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
             },
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="stop_vm",
+        description=(
+            "Force-stop a QEMU VM immediately (equivalent to pulling the power plug). "
+            "Use shutdown_vm for a graceful ACPI shutdown. Returns the task UPID."
         ),
-        types.Tool(
-            name="stop_vm",
-            description=(
-                "Force-stop a QEMU VM immediately (equivalent to pulling the power plug). "
-                "Use shutdown_vm for a graceful ACPI shutdown. Returns the task UPID."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
             },
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="shutdown_vm",
+        description=(
+            "Gracefully shut down a QEMU VM via ACPI. The VM OS is asked to "
+            "power off cleanly. Returns the task UPID."
         ),
-        types.Tool(
-            name="shutdown_vm",
-            description=(
-                "Gracefully shut down a QEMU VM via ACPI. The VM OS is asked to "
-                "power off cleanly. Returns the task UPID."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Seconds to wait before forcing shutdown (default 60)",
-                        "minimum": 1,
-                        "maximum": 600,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
+                "timeout": {
+                    "type": "integer",
+                    "description": "Seconds to wait before forcing shutdown (default 60)",
+                    "minimum": 1,
+                    "maximum": 600,
                 },
-                "required": ["node", "vmid"],
             },
-        ),
-        types.Tool(
-            name="reboot_vm",
-            description="Reboot a running QEMU VM. Returns the task UPID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="reboot_vm",
+        description="Reboot a running QEMU VM. Returns the task UPID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "VM ID", "minimum": 100},
             },
-        ),
-
-        # ── LXC Containers ──────────────────────────────────────────────────
-        types.Tool(
-            name="list_lxc",
-            description="List all LXC containers on a Proxmox node.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
+            "required": ["node", "vmid"],
+        },
+    ),
+
+    # ── LXC Containers ──────────────────────────────────────────────────
+    types.Tool(
+        name="list_lxc",
+        description="List all LXC containers on a Proxmox node.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Also fetch each container's current status (default false)",
                 },
-                "required": ["node"],
             },
-        ),
-        types.Tool(
-            name="get_lxc_status",
-            description="Get the current power state and resource usage of a specific LXC container.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+            "required": ["node"],
+        },
+    ),
+    types.Tool(
+        name="get_lxc_status",
+        description="Get the current power state and resource usage of a specific LXC container.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
             },
-        ),
-        types.Tool(
-            name="start_lxc",
-            description="Start a stopped LXC container. Returns the task UPID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="start_lxc",
+        description="Start a stopped LXC container. Returns the task UPID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
             },
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="stop_lxc",
+        description=(
+            "Force-stop an LXC container immediately. "
+            "Use shutdown_lxc for a graceful shutdown. Returns the task UPID."
         ),
-        types.Tool(
-            name="stop_lxc",
-            description=(
-                "Force-stop an LXC container immediately. "
-                "Use shutdown_lxc for a graceful shutdown. Returns the task UPID."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
-                },
-                "required": ["node", "vmid"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
             },
+            "required": ["node", "vmid"],
+        },
+    ),
+    types.Tool(
+        name="shutdown_lxc",
+        description=(
+            "Gracefully shut down an LXC container. Returns the task UPID."
         ),
-        types.Tool(
-            name="shutdown_lxc",
-            description=(
-                "Gracefully shut down an LXC container. Returns the task UPID."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Seconds to wait before forcing shutdown (default 60)",
-                        "minimum": 1,
-                        "maximum": 600,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "vmid": {"type": "integer", "description": "Container ID", "minimum": 100},
+                "timeout": {
+                    "type": "integer",
+                    "description": "Seconds to wait before forcing shutdown (default 60)",
+                    "minimum": 1,
+                    "maximum": 600,
                 },
-                "required": ["node", "vmid"],
             },
-        ),
-
-        # ── Storage ─────────────────────────────────────────────────────────
-        types.Tool(
-            name="list_storages",
-            description="List all storage pools configured on a Proxmox node with usage statistics.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
+            "required": ["node", "vmid"],
+        },
+    ),
+
+    # ── Storage ─────────────────────────────────────────────────────────
+    types.Tool(
+        name="list_storages",
+        description="List all storage pools configured on a Proxmox node with usage statistics.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Also count each storage's volumes (default false)",
                 },
-                "required": ["node"],
             },
+            "required": ["node"],
+        },
+    ),
+    types.Tool(
+        name="get_storage_content",
+        description=(
+            "List content of a storage pool on a node: VM disk images, "
+            "ISO images, container templates, and backups."
         ),
-        types.Tool(
-            name="get_storage_content",
-            description=(
-                "List content of a storage pool on a node: VM disk images, "
-                "ISO images, container templates, and backups."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node": {"type": "string", "description": "Proxmox node name"},
-                    "storage": {"type": "string", "description": "Storage ID (e.g. 'local', 'local-lvm')"},
-                },
-                "required": ["node", "storage"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node": {"type": "string", "description": "Proxmox node name"},
+                "storage": {"type": "string", "description": "Storage ID (e.g. 'local', 'local-lvm')"},
             },
-        ),
-    ]
+            "required": ["node", "storage"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[types.Tool]:
+    """Advertise all available tools to the MCP client."""
+    return _TOOLS
 
 
 # ---------------------------------------------------------------------------
@@ -383,222 +562,382 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     log.info("tool.called", tool=name)
 
     try:
-        settings = get_settings()
+        client = await _get_client()
     except RuntimeError as e:
-        return _err(f"Configuration error: {e}")
+        return _err(f"Configuration error: {e}", repeatable=True)
 
     try:
-        async with ProxmoxClient(settings) as client:
-            return await _dispatch(name, arguments, client)
+        return await _dispatch(name, arguments, client)
     except ProxmoxAPIError as e:
         log.error("proxmox.api_error", tool=name, status=e.status_code, error=str(e))
         return _err(str(e))
     except ValidationError as e:
-        log.warning("tool.validation_error", tool=name, errors=e.errors())
-        return _err(f"Input validation error: {e}")
+        message = _validation_message(e)
+        log.warning("tool.validation_error", tool=name, error=message, count=e.error_count())
+        return _err(f"Input validation error: {message}")
     except Exception as e:
         log.exception("tool.unexpected_error", tool=name)
         return _err(f"Unexpected error: {type(e).__name__}: {e}")
 
 
+# Per-row summarisers for the list tools; dict.get is bound once per row
+_TASK_KEYS = ("upid", "node", "type", "id", "user", "status", "starttime", "endtime")
+
+
+def _task_row(t: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one task; map() pulls all keys in C, missing ones become None."""
+    return dict(zip(_TASK_KEYS, map(t.get, _TASK_KEYS)))
+
+
+def _node_row(n: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one node from ``GET /nodes``."""
+    g = n.get
+    return {
+        "node": g("node"),
+        "status": g("status"),
+        "uptime": g("uptime"),
+        "cpu": round(g("cpu", 0) * 100, 1),  # fraction → %
+        "maxcpu": g("maxcpu"),
+        "mem_gb": round(g("mem", 0) * _GIB_INV, 2),
+        "maxmem_gb": round(g("maxmem", 0) * _GIB_INV, 2),
+        "disk_gb": round(g("disk", 0) * _GIB_INV, 2),
+        "maxdisk_gb": round(g("maxdisk", 0) * _GIB_INV, 2),
+        "level": g("level"),
+    }
+
+
+def _guest_row(v: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one QEMU VM or LXC container from a node listing."""
+    g = v.get
+    return {
+        "vmid": g("vmid"),
+        "name": g("name"),
+        "status": g("status"),
+        "uptime": g("uptime"),
+        "cpu": round(g("cpu", 0) * 100, 1),
+        "cpus": g("cpus") or g("maxcpu"),  # /cluster/resources only reports maxcpu
+        "mem_mb": round(g("mem", 0) * _MIB_INV, 0),
+        "maxmem_mb": round(g("maxmem", 0) * _MIB_INV, 0),
+        "disk_gb": round(g("disk", 0) * _GIB_INV, 2),
+        "maxdisk_gb": round(g("maxdisk", 0) * _GIB_INV, 2),
+    }
+
+
+def _storage_row(s: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one storage pool from ``GET /nodes/{node}/storage``."""
+    g = s.get
+    return {
+        "storage": g("storage"),
+        "type": g("type"),
+        "status": g("status"),
+        "active": g("active"),
+        "enabled": g("enabled"),
+        "used_gb": round(g("used", 0) * _GIB_INV, 2),
+        "avail_gb": round(g("avail", 0) * _GIB_INV, 2),
+        "total_gb": round(g("total", 0) * _GIB_INV, 2),
+        "content": g("content"),
+    }
+
+
+def _volume_row(i: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one volume from a storage content listing."""
+    g = i.get
+    return {
+        "volid": g("volid"),
+        "content": g("content"),
+        "format": g("format"),
+        "size_gb": round(g("size", 0) * _GIB_INV, 2),
+        "vmid": g("vmid"),
+        "notes": g("notes"),
+    }
+
+
+def _resource_storage_row(s: dict[str, Any]) -> dict[str, Any]:
+    """Summarise one ``type=storage`` row from ``GET /cluster/resources``."""
+    g = s.get
+    return {
+        "storage": g("storage"),
+        "node": g("node"),
+        "type": g("plugintype"),
+        "status": g("status"),
+        "shared": g("shared"),
+        "used_gb": round(g("disk", 0) * _GIB_INV, 2),
+        "total_gb": round(g("maxdisk", 0) * _GIB_INV, 2),
+        "content": g("content"),
+    }
+
+
+# Last /cluster/resources snapshot; node-scoped list tools read from it while fresh
+_RESOURCES_TTL = 2.0
+_resources_cache: Optional[tuple[float, list[dict[str, Any]]]] = None
+
+
+def _fresh_resources(kind: str, node: Optional[str] = None) -> Optional[list[dict[str, Any]]]:
+    """Return cached resources of *kind* (optionally on *node*), or None when stale.
+
+    None is also returned for a node the snapshot does not list, so the caller
+    goes to the per-node endpoint and surfaces the API's error for it.
+    """
+    if _resources_cache is None or time.monotonic() - _resources_cache[0] >= _RESOURCES_TTL:
+        return None
+    rows = _resources_cache[1]
+    if node is None:
+        return [r for r in rows if r.get("type") == kind]
+    if not any(r.get("type") == "node" and r.get("node") == node for r in rows):
+        return None
+    return [r for r in rows if r.get("type") == kind and r.get("node") == node]
+
+
+_Handler = Callable[[dict, ProxmoxClient], Awaitable[list[types.TextContent]]]
+
+
+# Last successful version response; health probes within _VERSION_TTL reuse it
+_VERSION_TTL = 10.0
+_version_cache: Optional[tuple[float, Any]] = None
+
+
+async def _handle_health_check(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    global _version_cache
+    now = time.monotonic()
+    if _version_cache is not None and now - _version_cache[0] < _VERSION_TTL:
+        return _ok({"status": "ok", "proxmox": _version_cache[1], "cached": True})
+    version = await client.get_version()
+    _version_cache = (now, version)
+    return _ok({"status": "ok", "proxmox": version})
+
+
+async def _handle_get_cluster_status(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    status = await client.get_cluster_status()
+    return _ok(status)
+
+
+async def _handle_get_cluster_overview(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    global _resources_cache
+    resources = await client.get_cluster_resources()
+    _resources_cache = (time.monotonic(), resources)
+    overview: dict[str, list[dict[str, Any]]] = {"nodes": [], "vms": [], "lxc": [], "storages": []}
+    for r in resources:
+        kind = r.get("type")
+        if kind == "node":
+            overview["nodes"].append(_node_row(r))
+        elif kind == "qemu":
+            overview["vms"].append({"node": r.get("node"), **_guest_row(r)})
+        elif kind == "lxc":
+            overview["lxc"].append({"node": r.get("node"), **_guest_row(r)})
+        elif kind == "storage":
+            overview["storages"].append(_resource_storage_row(r))
+    return _ok(overview)
+
+
+async def _handle_list_tasks(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    limit = int(arguments.get("limit", 50))
+    limit = max(1, min(limit, 200))
+    tasks = await client.list_tasks(limit=limit)
+    # Summarise the most useful fields
+    summary = [_task_row(t) for t in tasks]
+    return _ok(summary)
+
+
+async def _handle_list_nodes(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    nodes = _fresh_resources("node")
+    if nodes is None:
+        nodes = await client.list_nodes()
+    summary = [_node_row(n) for n in nodes]
+    return _ok(summary)
+
+
+async def _handle_get_node_status(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_NODE_ADAPTER, arguments)
+    status = await client.get_node_status(inp.node)
+    return _ok(status)
+
+
+async def _handle_list_vms(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_NODE_LIST_ADAPTER, arguments)
+    vms = _fresh_resources("qemu", inp.node)
+    if vms is None:
+        vms = await client.list_vms(inp.node)
+    summary = [_guest_row(v) for v in vms]
+    if inp.detailed:
+        statuses = await _gather_bounded(
+            client.get_vm_status(inp.node, v["vmid"]) for v in vms
+        )
+        for entry, status in zip(summary, statuses):
+            entry["details"] = _detail(status)
+    return _ok(summary)
+
+
+async def _handle_get_vm_status(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    status = await client.get_vm_status(inp.node, inp.vmid)
+    return _ok(status)
+
+
+async def _handle_start_vm(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    task = await client.start_vm(inp.node, inp.vmid)
+    return _ok({"result": "start_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_stop_vm(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    task = await client.stop_vm(inp.node, inp.vmid)
+    return _ok({"result": "stop_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_shutdown_vm(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_SHUTDOWN_ADAPTER, arguments)
+    task = await client.shutdown_vm(inp.node, inp.vmid, timeout=inp.timeout or 60)
+    return _ok({"result": "shutdown_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_reboot_vm(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    task = await client.reboot_vm(inp.node, inp.vmid)
+    return _ok({"result": "reboot_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_list_lxc(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_NODE_LIST_ADAPTER, arguments)
+    containers = _fresh_resources("lxc", inp.node)
+    if containers is None:
+        containers = await client.list_lxc(inp.node)
+    summary = [_guest_row(c) for c in containers]
+    if inp.detailed:
+        statuses = await _gather_bounded(
+            client.get_lxc_status(inp.node, c["vmid"]) for c in containers
+        )
+        for entry, status in zip(summary, statuses):
+            entry["details"] = _detail(status)
+    return _ok(summary)
+
+
+async def _handle_get_lxc_status(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    status = await client.get_lxc_status(inp.node, inp.vmid)
+    return _ok(status)
+
+
+async def _handle_start_lxc(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    task = await client.start_lxc(inp.node, inp.vmid)
+    return _ok({"result": "start_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_stop_lxc(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_VM_ADAPTER, arguments)
+    task = await client.stop_lxc(inp.node, inp.vmid)
+    return _ok({"result": "stop_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_shutdown_lxc(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_SHUTDOWN_ADAPTER, arguments)
+    task = await client.shutdown_lxc(inp.node, inp.vmid, timeout=inp.timeout or 60)
+    return _ok({"result": "shutdown_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
+
+
+async def _handle_list_storages(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_NODE_LIST_ADAPTER, arguments)
+    storages = await client.list_storages(inp.node)
+    summary = [_storage_row(s) for s in storages]
+    if inp.detailed:
+        contents = await _gather_bounded(
+            client.get_storage_content(inp.node, s["storage"]) for s in storages
+        )
+        for entry, content in zip(summary, contents):
+            entry["volume_count"] = _detail(
+                content if isinstance(content, BaseException) else len(content)
+            )
+    return _ok(summary)
+
+
+async def _handle_get_storage_content(arguments: dict, client: ProxmoxClient) -> list[types.TextContent]:
+    inp = _parse(_STORAGE_ADAPTER, arguments)
+    items = await client.get_storage_content(inp.node, inp.storage)
+    summary = [_volume_row(i) for i in items]
+    return _ok(summary)
+
+
+_HANDLERS: dict[str, _Handler] = {
+    "health_check": _handle_health_check,
+    "get_cluster_status": _handle_get_cluster_status,
+    "get_cluster_overview": _handle_get_cluster_overview,
+    "list_tasks": _handle_list_tasks,
+    "list_nodes": _handle_list_nodes,
+    "get_node_status": _handle_get_node_status,
+    "list_vms": _handle_list_vms,
+    "get_vm_status": _handle_get_vm_status,
+    "start_vm": _handle_start_vm,
+    "stop_vm": _handle_stop_vm,
+    "shutdown_vm": _handle_shutdown_vm,
+    "reboot_vm": _handle_reboot_vm,
+    "list_lxc": _handle_list_lxc,
+    "get_lxc_status": _handle_get_lxc_status,
+    "start_lxc": _handle_start_lxc,
+    "stop_lxc": _handle_stop_lxc,
+    "shutdown_lxc": _handle_shutdown_lxc,
+    "list_storages": _handle_list_storages,
+    "get_storage_content": _handle_get_storage_content,
+}
+
+
+# Read-only tools whose responses may be reused for _READ_TTL seconds; dashboards
+# poll these far more often than the underlying state changes
+_READ_TOOLS = frozenset({
+    "health_check",
+    "get_cluster_status",
+    "get_cluster_overview",
+    "list_tasks",
+    "list_nodes",
+    "get_node_status",
+    "list_vms",
+    "get_vm_status",
+    "list_lxc",
+    "get_lxc_status",
+    "list_storages",
+    "get_storage_content",
+})
+_READ_TTL = 2.0
+_READ_CACHE_MAX = 128
+_read_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[float, list[types.TextContent]]] = {}
+
+
 async def _dispatch(
     name: str,
     arguments: dict,
     client: ProxmoxClient,
 ) -> list[types.TextContent]:
-    """Route tool name to implementation."""
-
-    # ── health_check ────────────────────────────────────────────────────────
-    if name == "health_check":
-        version = await client.get_version()
-        return _ok({"status": "ok", "proxmox": version})
-
-    # ── get_cluster_status ──────────────────────────────────────────────────
-    if name == "get_cluster_status":
-        status = await client.get_cluster_status()
-        return _ok(status)
-
-    # ── list_tasks ──────────────────────────────────────────────────────────
-    if name == "list_tasks":
-        limit = int(arguments.get("limit", 50))
-        limit = max(1, min(limit, 200))
-        tasks = await client.list_tasks(limit=limit)
-        # Summarise the most useful fields
-        summary = [
-            {
-                "upid": t.get("upid"),
-                "node": t.get("node"),
-                "type": t.get("type"),
-                "id": t.get("id"),
-                "user": t.get("user"),
-                "status": t.get("status"),
-                "starttime": t.get("starttime"),
-                "endtime": t.get("endtime"),
-            }
-            for t in tasks
-        ]
-        return _ok(summary)
-
-    # ── list_nodes ──────────────────────────────────────────────────────────
-    if name == "list_nodes":
-        nodes = await client.list_nodes()
-        summary = [
-            {
-                "node": n.get("node"),
-                "status": n.get("status"),
-                "uptime": n.get("uptime"),
-                "cpu": round(n.get("cpu", 0) * 100, 1),  # fraction → %
-                "maxcpu": n.get("maxcpu"),
-                "mem_gb": round(n.get("mem", 0) / 1_073_741_824, 2),
-                "maxmem_gb": round(n.get("maxmem", 0) / 1_073_741_824, 2),
-                "disk_gb": round(n.get("disk", 0) / 1_073_741_824, 2),
-                "maxdisk_gb": round(n.get("maxdisk", 0) / 1_073_741_824, 2),
-                "level": n.get("level"),
-            }
-            for n in nodes
-        ]
-        return _ok(summary)
-
-    # ── get_node_status ─────────────────────────────────────────────────────
-    if name == "get_node_status":
-        inp = NodeInput(**arguments)
-        status = await client.get_node_status(inp.node)
-        return _ok(status)
-
-    # ── list_vms ────────────────────────────────────────────────────────────
-    if name == "list_vms":
-        inp = NodeInput(**arguments)
-        vms = await client.list_vms(inp.node)
-        summary = [
-            {
-                "vmid": v.get("vmid"),
-                "name": v.get("name"),
-                "status": v.get("status"),
-                "uptime": v.get("uptime"),
-                "cpu": round(v.get("cpu", 0) * 100, 1),
-                "cpus": v.get("cpus"),
-                "mem_mb": round(v.get("mem", 0) / 1_048_576, 0),
-                "maxmem_mb": round(v.get("maxmem", 0) / 1_048_576, 0),
-                "disk_gb": round(v.get("disk", 0) / 1_073_741_824, 2),
-                "maxdisk_gb": round(v.get("maxdisk", 0) / 1_073_741_824, 2),
-            }
-            for v in vms
-        ]
-        return _ok(summary)
-
-    # ── get_vm_status ────────────────────────────────────────────────────────
-    if name == "get_vm_status":
-        inp = VmInput(**arguments)
-        status = await client.get_vm_status(inp.node, inp.vmid)
-        return _ok(status)
-
-    # ── start_vm ─────────────────────────────────────────────────────────────
-    if name == "start_vm":
-        inp = VmInput(**arguments)
-        task = await client.start_vm(inp.node, inp.vmid)
-        return _ok({"result": "start_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── stop_vm ──────────────────────────────────────────────────────────────
-    if name == "stop_vm":
-        inp = VmInput(**arguments)
-        task = await client.stop_vm(inp.node, inp.vmid)
-        return _ok({"result": "stop_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── shutdown_vm ───────────────────────────────────────────────────────────
-    if name == "shutdown_vm":
-        inp = ShutdownVmInput(**arguments)
-        task = await client.shutdown_vm(inp.node, inp.vmid, timeout=inp.timeout or 60)
-        return _ok({"result": "shutdown_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── reboot_vm ─────────────────────────────────────────────────────────────
-    if name == "reboot_vm":
-        inp = VmInput(**arguments)
-        task = await client.reboot_vm(inp.node, inp.vmid)
-        return _ok({"result": "reboot_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── list_lxc ─────────────────────────────────────────────────────────────
-    if name == "list_lxc":
-        inp = NodeInput(**arguments)
-        containers = await client.list_lxc(inp.node)
-        summary = [
-            {
-                "vmid": c.get("vmid"),
-                "name": c.get("name"),
-                "status": c.get("status"),
-                "uptime": c.get("uptime"),
-                "cpu": round(c.get("cpu", 0) * 100, 1),
-                "cpus": c.get("cpus"),
-                "mem_mb": round(c.get("mem", 0) / 1_048_576, 0),
-                "maxmem_mb": round(c.get("maxmem", 0) / 1_048_576, 0),
-                "disk_gb": round(c.get("disk", 0) / 1_073_741_824, 2),
-                "maxdisk_gb": round(c.get("maxdisk", 0) / 1_073_741_824, 2),
-            }
-            for c in containers
-        ]
-        return _ok(summary)
-
-    # ── get_lxc_status ────────────────────────────────────────────────────────
-    if name == "get_lxc_status":
-        inp = VmInput(**arguments)
-        status = await client.get_lxc_status(inp.node, inp.vmid)
-        return _ok(status)
-
-    # ── start_lxc ────────────────────────────────────────────────────────────
-    if name == "start_lxc":
-        inp = VmInput(**arguments)
-        task = await client.start_lxc(inp.node, inp.vmid)
-        return _ok({"result": "start_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── stop_lxc ─────────────────────────────────────────────────────────────
-    if name == "stop_lxc":
-        inp = VmInput(**arguments)
-        task = await client.stop_lxc(inp.node, inp.vmid)
-        return _ok({"result": "stop_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── shutdown_lxc ─────────────────────────────────────────────────────────
-    if name == "shutdown_lxc":
-        inp = ShutdownVmInput(**arguments)
-        task = await client.shutdown_lxc(inp.node, inp.vmid, timeout=inp.timeout or 60)
-        return _ok({"result": "shutdown_requested", "node": inp.node, "vmid": inp.vmid, "task": task})
-
-    # ── list_storages ────────────────────────────────────────────────────────
-    if name == "list_storages":
-        inp = NodeInput(**arguments)
-        storages = await client.list_storages(inp.node)
-        summary = [
-            {
-                "storage": s.get("storage"),
-                "type": s.get("type"),
-                "status": s.get("status"),
-                "active": s.get("active"),
-                "enabled": s.get("enabled"),
-                "used_gb": round(s.get("used", 0) / 1_073_741_824, 2),
-                "avail_gb": round(s.get("avail", 0) / 1_073_741_824, 2),
-                "total_gb": round(s.get("total", 0) / 1_073_741_824, 2),
-                "content": s.get("content"),
-            }
-            for s in storages
-        ]
-        return _ok(summary)
-
-    # ── get_storage_content ───────────────────────────────────────────────────
-    if name == "get_storage_content":
-        inp = StorageInput(**arguments)
-        items = await client.get_storage_content(inp.node, inp.storage)
-        summary = [
-            {
-                "volid": i.get("volid"),
-                "content": i.get("content"),
-                "format": i.get("format"),
-                "size_gb": round(i.get("size", 0) / 1_073_741_824, 2),
-                "vmid": i.get("vmid"),
-                "notes": i.get("notes"),
-            }
-            for i in items
-        ]
-        return _ok(summary)
-
-    return _err(f"Unknown tool: {name!r}")
+    """Route tool name to implementation.
+
+    Read-only tools are served from a short TTL cache; any other tool (the
+    power actions) clears it so the next read reflects the new state.
+    """
+    global _resources_cache
+    # Handler keys are interned literals; interning the incoming name lets the
+    # _HANDLERS/_READ_TOOLS lookups and cache-key compares succeed on identity
+    name = sys.intern(name)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _err(f"Unknown tool: {name!r}", repeatable=True)
+    if name not in _READ_TOOLS:
+        result = await handler(arguments, client)
+        _read_cache.clear()
+        _resources_cache = None
+        return result
+
+    key = (name, tuple(sorted(arguments.items())))
+    try:
+        hit = _read_cache.get(key)
+    except TypeError:  # unhashable argument value — skip the cache
+        return await handler(arguments, client)
+    now = time.monotonic()
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    result = await handler(arguments, client)
+    if len(_read_cache) >= _READ_CACHE_MAX:
+        del _read_cache[next(iter(_read_cache))]
+    _read_cache[key] = (now + _READ_TTL, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -607,12 +946,14 @@ async def _dispatch(
 
 async def _serve() -> None:
     log.info("server.starting", name="proxmox-mcp")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await _release_client()
 
 
 def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
-    import json as _json
     from mcp.server.sse import SseServerTransport
     from starlette.applications import Starlette
     from starlette.requests import Request
@@ -622,6 +963,13 @@ def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
 
     sse = SseServerTransport("/messages/")
 
+    @asynccontextmanager
+    async def _lifespan(_: Starlette) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await _release_client()
+
     async def handle_sse(request: Request) -> None:
         async with sse.connect_sse(
             request.scope, request.receive, request._send  # type: ignore[attr-defined]
@@ -641,19 +989,20 @@ def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
             return JSONResponse({"error": str(exc)}, status_code=400)
 
         try:
-            settings = get_settings()
+            client = await _get_client()
         except RuntimeError as exc:
             return JSONResponse({"error": f"Configuration error: {exc}"}, status_code=500)
 
         try:
-            async with ProxmoxClient(settings) as client:
-                results = await _dispatch(tool_name, tool_args, client)
-            return JSONResponse(_json.loads(results[0].text))
+            results = await _dispatch(tool_name, tool_args, client)
+            return JSONResponse(orjson.loads(results[0].text))
         except ProxmoxAPIError as exc:
             log.error("http.call.api_error", tool=tool_name, status=exc.status_code, error=str(exc))
             return JSONResponse({"error": str(exc)}, status_code=502)
         except _ValidationError as exc:
-            return JSONResponse({"error": f"Input validation error: {exc}"}, status_code=422)
+            return JSONResponse(
+                {"error": f"Input validation error: {_validation_message(exc)}"}, status_code=422
+            )
         except Exception as exc:
             log.exception("http.call.unexpected_error", tool=tool_name)
             return JSONResponse({"error": f"{type(exc).__name__}: {exc}"}, status_code=500)
@@ -663,7 +1012,8 @@ def _create_sse_app() -> "Starlette":  # type: ignore[name-defined]
             Route("/sse", endpoint=handle_sse),
             Route("/call", endpoint=handle_call, methods=["POST"]),
             Mount("/messages/", app=sse.handle_post_message),
-        ]
+        ],
+        lifespan=_lifespan,
     )
 
 
@@ -684,7 +1034,13 @@ def main() -> None:
                  host=args.host, port=args.port)
         uvicorn.run(_create_sse_app(), host=args.host, port=args.port)
     else:
-        asyncio.run(_serve())
+        # uvicorn picks uvloop up on its own; the stdio transport has to ask for it
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(_serve())
+        else:
+            uvloop.run(_serve())
 
 
 if __name__ == "__main__":
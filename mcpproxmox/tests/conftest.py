@@ -0,0 +1,29 @@
+"""Shared fixtures for the proxmox-mcp test suite."""
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from proxmox_mcp import client as client_module
+from proxmox_mcp.client import ProxmoxClient
+
+from tests.helpers import make_settings
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def proxmox_client() -> AsyncIterator[ProxmoxClient]:
+    """One entered client for the whole session, so the httpx pool is built once."""
+    async with ProxmoxClient(make_settings()) as client:
+        yield client
+    await client_module.aclose_shared()
+
+
+@pytest_asyncio.fixture
+async def fresh_pool(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    """Give a test its own shared-pool slot so it cannot close the session client's pool."""
+    monkeypatch.setattr(client_module, "_shared_client", None)
+    monkeypatch.setattr(client_module, "_shared_key", None)
+    yield
+    await client_module.aclose_shared()
@@ -0,0 +1,15 @@
+"""Plain test helpers shared by the proxmox-mcp test modules and fixtures."""
+from __future__ import annotations
+
+from proxmox_mcp.config import Settings
+
+
+def make_settings(**kwargs) -> Settings:
+    base = dict(
+        proxmox_url="https://pm.example.com",
+        api_token="root@pam!mcp=test-uuid-1234",
+        ssl_verify=False,
+        timeout=5.0,
+    )
+    base.update(kwargs)
+    return Settings(**base)
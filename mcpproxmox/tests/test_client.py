@@ -1,24 +1,18 @@
 """Tests for ProxmoxClient."""
 from __future__ import annotations
 
+import logging
+
+import orjson
 import pytest
 import respx
 import httpx
 from unittest.mock import MagicMock
 
+from proxmox_mcp import client as client_module
 from proxmox_mcp.client import ProxmoxClient, ProxmoxAPIError
-from proxmox_mcp.config import Settings
-
 
-def make_settings(**kwargs) -> Settings:
-    base = dict(
-        proxmox_url="https://pm.example.com",
-        api_token="root@pam!mcp=test-uuid-1234",
-        ssl_verify=False,
-        timeout=5.0,
-    )
-    base.update(kwargs)
-    return Settings(**base)
+from tests.helpers import make_settings
 
 
 BASE = "https://pm.example.com/api2/json/"
@@ -26,93 +20,132 @@ BASE = "https://pm.example.com/api2/json/"
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_health_check_ok():
+async def test_health_check_ok(proxmox_client):
     respx.get(f"{BASE}version").mock(
         return_value=httpx.Response(200, json={"data": {"version": "8.1", "release": "1"}})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        result = await client.get_version()
+    result = await proxmox_client.get_version()
     assert result["version"] == "8.1"
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_list_nodes():
+async def test_list_nodes(proxmox_client):
     respx.get(f"{BASE}nodes").mock(
         return_value=httpx.Response(200, json={"data": [
             {"node": "pve", "status": "online", "cpu": 0.05, "maxcpu": 8,
              "mem": 4_294_967_296, "maxmem": 16_000_000_000, "uptime": 100000}
         ]})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        nodes = await client.list_nodes()
+    nodes = await proxmox_client.list_nodes()
     assert len(nodes) == 1
     assert nodes[0]["node"] == "pve"
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_list_vms():
+async def test_list_vms(proxmox_client):
     respx.get(f"{BASE}nodes/pve/qemu").mock(
         return_value=httpx.Response(200, json={"data": [
             {"vmid": 100, "name": "ubuntu", "status": "running",
              "cpu": 0.02, "cpus": 2, "mem": 1_073_741_824, "maxmem": 2_147_483_648}
         ]})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        vms = await client.list_vms("pve")
+    vms = await proxmox_client.list_vms("pve")
     assert vms[0]["vmid"] == 100
     assert vms[0]["name"] == "ubuntu"
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_start_vm():
+async def test_list_tasks_sends_limit(proxmox_client):
+    route = respx.get(f"{BASE}cluster/tasks").mock(
+        return_value=httpx.Response(200, json={"data": [{"upid": f"UPID:{i}"} for i in range(5)]})
+    )
+    tasks = await proxmox_client.list_tasks(limit=3)
+    assert route.calls.last.request.url.params["limit"] == "3"
+    assert len(tasks) == 3
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_vms_streams_large_body(proxmox_client, monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(client_module, "_STREAM_THRESHOLD", 16)
+    vms = [{"vmid": 100 + i, "name": f"vm{i}", "cpu": 0.25} for i in range(50)]
+    respx.get(f"{BASE}nodes/pve/qemu").mock(return_value=httpx.Response(200, json={"data": vms}))
+    assert await proxmox_client.list_vms("pve") == vms
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_list_vms_streams_body_without_length(proxmox_client):
+    pytest.importorskip("ijson")
+    vms = [{"vmid": 100 + i, "name": f"vm{i}"} for i in range(3)]
+    body = orjson.dumps({"data": vms})
+
+    async def chunks():
+        for i in range(0, len(body), 8):
+            yield body[i:i + 8]
+
+    respx.get(f"{BASE}nodes/pve/qemu").mock(return_value=httpx.Response(200, content=chunks()))
+    assert await proxmox_client.list_vms("pve") == vms
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_streamed_call_is_logged(proxmox_client, monkeypatch, caplog):
+    monkeypatch.setattr(client_module, "_timing_enabled", True)
+    respx.get(f"{BASE}nodes/pve/qemu").mock(return_value=httpx.Response(200, json={"data": []}))
+    with caplog.at_level(logging.INFO, logger="proxmox_mcp.client"):
+        await proxmox_client.list_vms("pve")
+    assert "api_call method=GET path=nodes/pve/qemu status=200" in caplog.text
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_start_vm(proxmox_client):
     respx.post(f"{BASE}nodes/pve/qemu/100/status/start").mock(
         return_value=httpx.Response(200, json={"data": "UPID:pve:001:start"})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        task = await client.start_vm("pve", 100)
+    task = await proxmox_client.start_vm("pve", 100)
     assert "UPID" in task
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_stop_vm():
+async def test_stop_vm(proxmox_client):
     respx.post(f"{BASE}nodes/pve/qemu/100/status/stop").mock(
         return_value=httpx.Response(200, json={"data": "UPID:pve:001:stop"})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        task = await client.stop_vm("pve", 100)
+    task = await proxmox_client.stop_vm("pve", 100)
     assert "UPID" in task
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_list_lxc():
+async def test_list_lxc(proxmox_client):
     respx.get(f"{BASE}nodes/pve/lxc").mock(
         return_value=httpx.Response(200, json={"data": [
             {"vmid": 200, "name": "nginx-ct", "status": "running"}
         ]})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        ctrs = await client.list_lxc("pve")
+    ctrs = await proxmox_client.list_lxc("pve")
     assert ctrs[0]["vmid"] == 200
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_unauthorized_raises():
+async def test_unauthorized_raises(proxmox_client):
     respx.get(f"{BASE}version").mock(return_value=httpx.Response(401, text="unauthorized"))
     with pytest.raises(ProxmoxAPIError) as exc_info:
-        async with ProxmoxClient(make_settings()) as client:
-            await client.get_version()
+        await proxmox_client.get_version()
     assert exc_info.value.status_code == 401
 
 
 @respx.mock
 @pytest.mark.asyncio
-async def test_list_storages():
+async def test_list_storages(proxmox_client):
     respx.get(f"{BASE}nodes/pve/storage").mock(
         return_value=httpx.Response(200, json={"data": [
             {"storage": "local", "type": "dir", "status": "available",
@@ -121,6 +154,42 @@ async def test_list_storages():
              "content": "iso,vztmpl,backup"}
         ]})
     )
-    async with ProxmoxClient(make_settings()) as client:
-        storages = await client.list_storages("pve")
+    storages = await proxmox_client.list_storages("pve")
     assert storages[0]["storage"] == "local"
+
+
+@pytest.mark.usefixtures("fresh_pool")
+@pytest.mark.asyncio
+async def test_clients_share_pool_until_closed():
+    async with ProxmoxClient(make_settings()) as first:
+        pool = first._client
+    async with ProxmoxClient(make_settings()) as second:
+        assert second._client is pool
+    async with ProxmoxClient(make_settings(timeout=9.0)) as third:
+        assert third._client is not pool
+    assert pool.is_closed
+
+
+def test_env_proxy_honours_no_proxy(monkeypatch):
+    for var in ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy"):
+        monkeypatch.delenv(var, raising=False)
+    assert client_module._env_proxy("https://pve.example.com:8006") is None
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+    assert client_module._env_proxy("https://pve.example.com:8006") == "http://proxy.local:3128"
+    monkeypatch.setenv("NO_PROXY", "example.com")
+    assert client_module._env_proxy("https://pve.example.com:8006") is None
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_error_messages_by_status(proxmox_client):
+    respx.get(f"{BASE}nodes/pve/status").mock(return_value=httpx.Response(404))
+    respx.get(f"{BASE}cluster/status").mock(return_value=httpx.Response(500, text="boom"))
+    respx.get(f"{BASE}nodes").mock(return_value=httpx.Response(403))
+    with pytest.raises(ProxmoxAPIError, match="Not found: nodes/pve/status"):
+        await proxmox_client.get_node_status("pve")
+    with pytest.raises(ProxmoxAPIError, match="internal error: boom"):
+        await proxmox_client.get_cluster_status()
+    with pytest.raises(ProxmoxAPIError, match="Forbidden") as exc_info:
+        await proxmox_client.list_nodes()
+    assert exc_info.value.status_code == 403
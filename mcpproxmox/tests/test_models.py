@@ -76,3 +76,14 @@ def test_storage_input_valid():
 def test_storage_input_rejects_injection():
     with pytest.raises(ValidationError):
         StorageInput(node="pve", storage="local; cat /etc/passwd")
+
+
+def test_node_input_rejects_trailing_newline():
+    with pytest.raises(ValidationError, match="illegal characters"):
+        NodeInput(node="pve\n")
+
+
+def test_inputs_are_immutable():
+    m = VmInput(node="pve", vmid=100)
+    with pytest.raises(ValidationError):
+        m.vmid = 101
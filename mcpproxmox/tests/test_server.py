@@ -3,7 +3,7 @@ Comprehensive test suite for Proxmox MCP server.
 
 Covers:
   • parse_request()  — dual-transport normalisation (VSCode + Perplexity)
-  • _dispatch()      — all 18 MCP tools, with a mocked ProxmoxClient
+  • _dispatch()      — all 19 MCP tools, with a mocked ProxmoxClient
   • Error paths      — unknown tool, validation error, API error
   • HTTP /call       — Perplexity-style REST endpoint (both payload formats)
 """
@@ -13,7 +13,7 @@ import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from proxmox_mcp.server import _dispatch, _ok, _err, parse_request, _create_sse_app
+from proxmox_mcp.server import _HANDLERS, _dispatch, _ok, _err, parse_request, _create_sse_app, list_tools
 from proxmox_mcp.client import ProxmoxAPIError
 
 
@@ -29,6 +29,19 @@ def _make_client(**async_methods) -> MagicMock:
     return client
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Keep the read-tool and version caches from leaking results between tests."""
+    from proxmox_mcp import server
+    server._read_cache.clear()
+    server._version_cache = None
+    server._resources_cache = None
+    yield
+    server._read_cache.clear()
+    server._version_cache = None
+    server._resources_cache = None
+
+
 def _json(result) -> dict:
     """Parse the first TextContent result as JSON."""
     return json.loads(result[0].text)
@@ -111,6 +124,39 @@ class TestParseRequestInvalid:
             parse_request({})
 
 
+# ---------------------------------------------------------------------------
+# _ok — response encoding
+# ---------------------------------------------------------------------------
+
+class TestOk:
+    def test_small_payload_indented(self):
+        assert "\n  " in _ok([{"a": 1}])[0].text
+
+    def test_decimal_encoded_as_number(self):
+        from decimal import Decimal
+        assert json.loads(_ok({"cpu": Decimal("0.25")})[0].text) == {"cpu": 0.25}
+
+    def test_large_list_compact(self):
+        text = _ok([{"a": i} for i in range(300)])[0].text
+        assert "\n" not in text
+        assert len(json.loads(text)) == 300
+
+
+# ---------------------------------------------------------------------------
+# list_tools
+# ---------------------------------------------------------------------------
+
+class TestListTools:
+    @pytest.mark.asyncio
+    async def test_every_tool_has_a_handler(self):
+        tools = await list_tools()
+        assert {t.name for t in tools} == set(_HANDLERS)
+
+    @pytest.mark.asyncio
+    async def test_tools_built_once(self):
+        assert await list_tools() is await list_tools()
+
+
 # ---------------------------------------------------------------------------
 # _dispatch — read-only tools
 # ---------------------------------------------------------------------------
@@ -130,6 +176,45 @@ class TestDispatchReadTools:
         result = _json(await _dispatch("get_cluster_status", {}, client))
         assert result[0]["name"] == "cluster"
 
+    @pytest.mark.asyncio
+    async def test_get_cluster_overview_groups_resources(self):
+        resources = [
+            {"type": "node", "node": "bab1", "status": "online", "mem": 1_073_741_824},
+            {"type": "qemu", "node": "bab1", "vmid": 101, "name": "vm", "maxcpu": 4},
+            {"type": "lxc", "node": "bab1", "vmid": 200, "name": "ct"},
+            {"type": "storage", "node": "bab1", "storage": "local", "plugintype": "dir"},
+        ]
+        client = _make_client(get_cluster_resources=resources)
+        result = _json(await _dispatch("get_cluster_overview", {}, client))
+        assert result["nodes"][0]["mem_gb"] == 1.0
+        assert result["vms"][0] == {**result["vms"][0], "node": "bab1", "vmid": 101, "cpus": 4}
+        assert result["lxc"][0]["vmid"] == 200
+        assert result["storages"][0]["type"] == "dir"
+
+    @pytest.mark.asyncio
+    async def test_list_vms_served_from_fresh_overview(self):
+        resources = [
+            {"type": "node", "node": "bab1"},
+            {"type": "node", "node": "other"},
+            {"type": "qemu", "node": "bab1", "vmid": 101, "name": "a"},
+            {"type": "qemu", "node": "other", "vmid": 102, "name": "b"},
+        ]
+        client = _make_client(get_cluster_resources=resources, list_vms=[])
+        await _dispatch("get_cluster_overview", {}, client)
+        result = _json(await _dispatch("list_vms", {"node": "bab1"}, client))
+        client.list_vms.assert_not_called()
+        assert [v["vmid"] for v in result] == [101]
+
+    @pytest.mark.asyncio
+    async def test_list_vms_unknown_node_bypasses_overview(self):
+        resources = [{"type": "node", "node": "bab1"}]
+        client = _make_client(get_cluster_resources=resources)
+        client.list_vms = AsyncMock(side_effect=ProxmoxAPIError(404, "no such node"))
+        await _dispatch("get_cluster_overview", {}, client)
+        with pytest.raises(ProxmoxAPIError):
+            await _dispatch("list_vms", {"node": "typo"}, client)
+        client.list_vms.assert_awaited_once_with("typo")
+
     @pytest.mark.asyncio
     async def test_list_tasks_default_limit(self):
         tasks = [{"upid": "UPID:pve:001", "type": "startall", "status": "OK"}]
@@ -188,6 +273,18 @@ class TestDispatchReadTools:
         assert result[0]["name"] == "starwise"
         assert result[0]["mem_mb"] == 2048.0
 
+    @pytest.mark.asyncio
+    async def test_list_vms_detailed_fetches_statuses(self):
+        raw_vms = [{"vmid": 101, "name": "a"}, {"vmid": 102, "name": "b"}]
+        client = _make_client(list_vms=raw_vms)
+        client.get_vm_status = AsyncMock(
+            side_effect=[{"qmpstatus": "running"}, ProxmoxAPIError(500, "boom")]
+        )
+        result = _json(await _dispatch("list_vms", {"node": "bab1", "detailed": True}, client))
+        assert client.get_vm_status.await_count == 2
+        assert result[0]["details"] == {"qmpstatus": "running"}
+        assert "boom" in result[1]["details"]["error"]
+
     @pytest.mark.asyncio
     async def test_get_vm_status(self):
         status = {"status": "running", "cpu": 0.03}
@@ -327,6 +424,17 @@ class TestDispatchErrors:
         assert "error" in result
         assert "nonexistent_tool" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_unknown_tool_error_reused(self):
+        client = _make_client()
+        first = await _dispatch("nonexistent_tool", {}, client)
+        second = await _dispatch("nonexistent_tool", {}, client)
+        assert second is not first
+        assert second[0] is first[0]
+
+    def test_one_off_errors_not_cached(self):
+        assert _err("boom")[0] is not _err("boom")[0]
+
     @pytest.mark.asyncio
     async def test_validation_error_missing_required_field(self):
         """Passing arguments that fail Pydantic validation should return error text."""
@@ -344,6 +452,34 @@ class TestDispatchErrors:
         with pytest.raises(ValidationError):
             await _dispatch("get_vm_status", {"node": "bab1", "vmid": 50}, client)
 
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_version(self):
+        from proxmox_mcp import server
+        client = _make_client(get_version={"version": "8.1"})
+        await _dispatch("health_check", {}, client)
+        server._read_cache.clear()
+        result = _json(await _dispatch("health_check", {}, client))
+        assert result["cached"] is True
+        assert client.get_version.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_read_tools_cached_until_power_action(self):
+        client = _make_client(
+            get_node_status={"cpu": 0.1}, start_vm="UPID:pve:001"
+        )
+        await _dispatch("get_node_status", {"node": "bab1"}, client)
+        await _dispatch("get_node_status", {"node": "bab1"}, client)
+        assert client.get_node_status.await_count == 1
+
+        await _dispatch("start_vm", {"node": "bab1", "vmid": 101}, client)
+        await _dispatch("get_node_status", {"node": "bab1"}, client)
+        assert client.get_node_status.await_count == 2
+
+    def test_parse_reuses_validated_model(self):
+        from proxmox_mcp.server import _VM_ADAPTER, _parse
+        first = _parse(_VM_ADAPTER, {"node": "bab1", "vmid": 101})
+        assert _parse(_VM_ADAPTER, {"vmid": 101, "node": "bab1"}) is first
+
 
 # ---------------------------------------------------------------------------
 # HTTP /call endpoint — integration tests via Starlette TestClient
@@ -400,8 +536,29 @@ class TestHTTPCallEndpoint:
                            headers={"content-type": "application/json"})
         assert resp.status_code == 400
 
+    def test_validation_error_returns_first_error_only(self, test_client):
+        client, _ = test_client
+        resp = client.post("/call", json={"command": "get_vm_status", "args": {"node": "bab1"}})
+        assert resp.status_code == 422
+        assert resp.json()["error"] == "Input validation error: vmid: Field required"
+
     def test_invalid_format_returns_400(self, test_client):
         client, _ = test_client
         resp = client.post("/call", json={"totally": "wrong"})
         assert resp.status_code == 400
         assert "Invalid MCP format" in resp.json()["error"]
+
+    def test_client_opened_once_across_calls(self):
+        from starlette.testclient import TestClient
+
+        mock_client_instance = _make_client(get_version={"version": "8.1", "release": "1"})
+        mock_cm = MagicMock()
+        mock_cm.__aenter__ = AsyncMock(return_value=mock_client_instance)
+
+        with patch("proxmox_mcp.server.ProxmoxClient", return_value=mock_cm) as factory, \
+             patch("proxmox_mcp.server.get_settings", return_value=MagicMock()):
+            with TestClient(_create_sse_app(), raise_server_exceptions=False) as client:
+                client.post("/call", json={"command": "health_check"})
+                client.post("/call", json={"command": "health_check"})
+        assert factory.call_count == 1
+        mock_cm.__aenter__.assert_awaited_once()
@@ -2,9 +2,12 @@
 Async Synology DSM WebAPI client.
 
 Authentication uses SYNO.API.Auth session login (username + password).
-On __aenter__  → GET login  → receive sid (session ID)
+On __aenter__  → reuse the known sid, else POST login → receive sid (session ID)
 All requests    → include _sid=<sid> as query parameter
-On __aexit__   → GET logout
+Session expired → login once more and retry the request (DSM 106/107/119)
+
+The sid is shared by every client for the same NAS and user, and persisted in
+the keychain so a restarted server skips the (slow) login.
 
 All DSM responses are wrapped in {"success": true/false, "data": ...}.
 This client unwraps the data and raises ``SynologyAPIError`` on errors.
@@ -14,21 +17,52 @@ All confirmed APIs on kusanagi.diskstation.me use entry.cgi (verified live).
 """
 from __future__ import annotations
 
+import asyncio
+import random
+import sys
 import time
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 import structlog
 
 from synology_mcp.config import Settings
+from synology_mcp.keychain import delete_secret, retrieve_secret, store_secret
 
 log = structlog.get_logger(__name__)
 
+# One pooled httpx client per process so TCP/TLS sessions survive across tool calls
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_key: Optional[Tuple[Any, ...]] = None
+_shared_lock = asyncio.Lock()
+
+# (synology_url, username) -> live DSM session ID, shared by every SynologyClient
+_sessions: Dict[Tuple[str, str], str] = {}
+_login_lock = asyncio.Lock()
+
+_KEYCHAIN_SID_ACCOUNT = "synology-sid"
+
+# DSM codes meaning the sid is no longer valid; answered by logging in again
+_SESSION_ERRORS = frozenset({106, 107, 119})
+
+# DSM codes worth retrying as-is: the NAS was briefly busy (e.g. during a backup)
+_TRANSIENT_ERRORS = frozenset({412})
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to wait before retry *attempt* (0-based): capped exponential plus jitter."""
+    return min(0.25 * 2 ** attempt, 2.0) + random.random() * 0.1
+
+
 # ---------------------------------------------------------------------------
 # Known static CGI paths for commonly used APIs
 # (avoids a full discovery round-trip on every call)
 # ---------------------------------------------------------------------------
-_STATIC_CGI_MAP: Dict[str, Tuple[str, int]] = {
+_STATIC_CGI_MAP: Mapping[str, Tuple[str, int]] = MappingProxyType({
     # api_name -> (cgi_path, max_version)
     # ALL verified live against kusanagi.diskstation.me:5001
     "SYNO.API.Info":                 ("query.cgi", 1),
@@ -45,9 +79,104 @@ _STATIC_CGI_MAP: Dict[str, Tuple[str, int]] = {
     "SYNO.FileStation.List":         ("entry.cgi", 2),
     "SYNO.Core.SecurityScan.Status": ("entry.cgi", 1),
     "SYNO.Backup.Task":              ("entry.cgi", 2),
+})
+
+# Fallback for APIs missing from the map above
+_DEFAULT_CGI: Tuple[str, int] = ("entry.cgi", 1)
+
+# (api, method, cgi_path, url-encoded query without _sid) — everything a GET
+# needs except the session ID
+_Template = Tuple[str, str, str, str]
+
+
+def _template(api: str, method: str, extra: Optional[Dict[str, Any]] = None) -> _Template:
+    """Resolve CGI path and version for *api* and pre-encode the query string.
+
+    Names are interned so cache and in-flight lookups on the resulting key
+    mostly short-circuit on identity.
+    """
+    api, method = sys.intern(api), sys.intern(method)
+    cgi_path, version = _STATIC_CGI_MAP.get(api, _DEFAULT_CGI)
+    params: Dict[str, Any] = {"api": api, "version": version, "method": method}
+    if extra:
+        params.update(extra)
+    return api, method, cgi_path, urlencode(sorted(params.items()))
+
+
+@lru_cache(maxsize=8)
+def _sid_query(sid: str) -> str:
+    """Encode the ``_sid`` parameter once per session rather than per request."""
+    return urlencode({"_sid": sid})
+
+
+# (api, method, extra params) behind the public getters, keyed by method name
+_METHOD_SPECS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "query_api_info": ("SYNO.API.Info", "query", {"query": "all"}),
+    "get_dsm_info": ("SYNO.DSM.Info", "getinfo", {}),
+    "get_system_utilization": (
+        "SYNO.Core.System.Utilization", "get", {"type": "current", "resource": "all"}
+    ),
+    "get_storage_info": (
+        "SYNO.Storage.CGI.Storage", "load_info", {"fetchBasic": "true", "limit": -1}
+    ),
+    "get_disk_info": ("SYNO.Storage.CGI.HddMan", "list", {"fetchAll": "true"}),
+    "list_shares": (
+        "SYNO.Core.Share",
+        "list",
+        {"limit": -1, "offset": 0, "additional": "recyclebin,share_quota,encrypted"},
+    ),
+    "list_packages": (
+        "SYNO.Core.Package", "list", {"limit": -1, "additional": "description,status,startable"}
+    ),
+    "list_scheduled_tasks": (
+        "SYNO.Core.TaskScheduler",
+        "get",
+        {"additional": "task_setting,owner,real_owner,last_run_result"},
+    ),
+    "list_docker_containers": ("SYNO.Docker.Container", "list", {"limit": -1, "offset": 0}),
+    "list_docker_images": ("SYNO.Docker.Image", "list", {"limit": -1, "offset": 0}),
+    "get_security_status": ("SYNO.Core.SecurityScan.Status", "get", {}),
+    "get_backup_tasks": (
+        "SYNO.Backup.Task", "list", {"additional": "last_bkp_result,schedule,extra"}
+    ),
+}
+
+# The same calls pre-encoded as GET templates, resolved once at import
+_METHOD_TEMPLATES: Dict[str, _Template] = {
+    name: _template(*spec) for name, spec in _METHOD_SPECS.items()
 }
 
 
+# Seconds a successful response may be reused, per API. Data that changes on the
+# order of minutes or hours is cached; live metrics (utilization, disks, tasks)
+# are absent and always fetched. DSM.Info carries uptime and temperature, so it
+# is kept short. API.Info is absent too: its only caller is health_check, which
+# must reach the NAS to prove connectivity.
+_CACHE_TTL: Dict[str, float] = {
+    "SYNO.DSM.Info": 60.0,
+    "SYNO.Core.Share": 300.0,
+    "SYNO.Core.Package": 300.0,
+}
+
+# (synology_url, api, method, encoded query) -> (expires_at, data)
+_response_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+# Same key -> task currently fetching it (single-flight)
+_inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+
+
+def _drop_inflight(key: Tuple[Any, ...], task: "asyncio.Task[Any]") -> None:
+    """Done callback: forget *task* and retrieve its outcome.
+
+    Retrieving the exception keeps asyncio from logging it when every caller
+    was cancelled before the task failed.
+    """
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
 class SynologyAPIError(Exception):
     """Raised for DSM API errors (HTTP non-2xx or success=false)."""
 
@@ -59,7 +188,7 @@ class SynologyAPIError(Exception):
 
 
 # DSM error code → human-readable explanation
-_DSM_ERROR_CODES: Dict[int, str] = {
+_DSM_ERROR_CODES: Mapping[int, str] = MappingProxyType({
     100: "Unknown error",
     101: "No parameter",
     102: "API does not exist",
@@ -83,50 +212,247 @@ _DSM_ERROR_CODES: Dict[int, str] = {
     410: "Disk quota exceeded",
     411: "File size exceeds limit",
     412: "Remote connection failed",
-}
+})
+
+
+# The same messages indexed directly by code (all codes are small and dense)
+_DSM_ERROR_ARRAY: Tuple[Optional[str], ...] = tuple(
+    _DSM_ERROR_CODES.get(code) for code in range(max(_DSM_ERROR_CODES) + 1)
+)
 
 
 def _dsm_error_message(code: int) -> str:
-    return _DSM_ERROR_CODES.get(code, f"Unknown DSM error code {code}")
+    if 0 <= code < len(_DSM_ERROR_ARRAY):
+        msg = _DSM_ERROR_ARRAY[code]
+        if msg is not None:
+            return msg
+    return f"Unknown DSM error code {code}"
+
+
+def _raise_for_status(response: httpx.Response, cgi_path: str, api: str) -> None:
+    """Raise ``SynologyAPIError`` for an HTTP-level failure."""
+    if response.status_code == 401:
+        raise SynologyAPIError(401, "Unauthorized — session expired or invalid SID")
+    if response.status_code == 403:
+        raise SynologyAPIError(403, "Forbidden — account lacks permission for this operation")
+    if response.status_code == 404:
+        raise SynologyAPIError(404, f"Not found: {cgi_path}?api={api}")
+    if not response.is_success:
+        raise SynologyAPIError(response.status_code, response.text[:500])
+
+
+def _unwrap(body: Dict[str, Any]) -> Any:
+    """Return the ``data`` of a DSM envelope, raising on ``success: false``."""
+    if not body.get("success", False):
+        err = body.get("error", {})
+        code = err.get("code", 0)
+        raise SynologyAPIError(200, _dsm_error_message(code), error_code=code)
+    return body.get("data")
+
+
+# DSM serialises a successful envelope as {"data":<payload>,"success":true}
+_RAW_HEAD = b'{"data":'
+_RAW_TAIL = b',"success":true}'
+
+
+def _raw_data(content: bytes, body: Dict[str, Any]) -> bytes:
+    """Return the JSON bytes of ``body["data"]`` exactly as DSM sent them.
+
+    *body* is the parsed *content*. With exactly two keys and DSM's usual
+    layout, everything between head and tail is the payload; any other layout
+    falls back to re-encoding.
+    """
+    if len(body) == 2 and content.startswith(_RAW_HEAD) and content.endswith(_RAW_TAIL):
+        return content[len(_RAW_HEAD):-len(_RAW_TAIL)]
+    return orjson.dumps(body.get("data"))
+
+
+def _list_params(folder_path: str, limit: int, additional: Optional[str]) -> Dict[str, Any]:
+    """Query params for a name-sorted SYNO.FileStation.List page starting at 0."""
+    params: Dict[str, Any] = {
+        "folder_path": folder_path,
+        "limit": limit,
+        "offset": 0,
+        "sort_by": "name",
+        "sort_direction": "ASC",
+    }
+    if additional:
+        params["additional"] = additional
+    return params
+
+
+async def _restore_sid(settings: Settings) -> Optional[str]:
+    """Return a known sid for this NAS and user, checking the keychain once."""
+    key = (settings.synology_url, settings.username)
+    sid = _sessions.get(key)
+    if sid is None:
+        stored = await asyncio.to_thread(retrieve_secret, _KEYCHAIN_SID_ACCOUNT)
+        parts = stored.split("\t") if stored else []
+        # Never hand a sid to a different NAS or account than it was issued for
+        if len(parts) == 3 and (parts[0], parts[1]) == key:
+            sid = _sessions[key] = parts[2]
+    return sid
+
+
+async def _persist_sid(settings: Settings, sid: str) -> None:
+    _sessions[(settings.synology_url, settings.username)] = sid
+    value = "\t".join((settings.synology_url, settings.username, sid))
+    try:
+        await asyncio.to_thread(store_secret, _KEYCHAIN_SID_ACCOUNT, value)
+    except RuntimeError as exc:
+        log.debug("synology.sid_not_persisted", error=str(exc))
+
+
+async def _forget_sid(settings: Settings) -> None:
+    if _sessions.pop((settings.synology_url, settings.username), None) is not None:
+        await asyncio.to_thread(delete_secret, _KEYCHAIN_SID_ACCOUNT)
+
+
+async def get_shared_client(settings: Settings) -> httpx.AsyncClient:
+    """Return the process-wide httpx client, creating it on first use.
+
+    The client is rebuilt if *settings* point at a different NAS. Creation is
+    serialised so concurrent tool calls cannot each build (and leak) a client.
+    """
+    global _shared_client, _shared_key
+    key = (settings.synology_url, settings.ssl_verify, settings.timeout)
+    async with _shared_lock:
+        if _shared_client is not None and not _shared_client.is_closed and _shared_key == key:
+            return _shared_client
+        if _shared_client is not None:
+            await _shared_client.aclose()
+        _shared_client = httpx.AsyncClient(
+            base_url=settings.synology_url + "/webapi/",
+            headers={"Accept": "application/json"},
+            verify=settings.ssl_verify,
+            # Bound cold connects separately so an unreachable NAS fails fast
+            # instead of consuming the whole read budget
+            timeout=httpx.Timeout(settings.timeout, connect=min(5.0, settings.timeout)),
+            # DSM 7 speaks HTTP/2, so multi() calls share one multiplexed TLS
+            # connection; the pool limits only matter on an HTTP/1.1 fallback
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=90
+            ),
+        )
+        _shared_key = key
+        return _shared_client
+
+
+async def aclose_shared() -> None:
+    """Close the process-wide httpx client. Call once at server shutdown."""
+    global _shared_client, _shared_key
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_key = None
+
+
+class _Span:
+    """Times one DSM request and logs it at DEBUG on exit."""
+
+    __slots__ = ("_log", "_event", "_fields", "_t0", "_status")
+
+    def __init__(self, logger: Any, event: str, **fields: Any) -> None:
+        self._log = logger
+        self._event = event
+        self._fields = fields
+        self._status: Optional[int] = None
+
+    def __enter__(self) -> "_Span":
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._log.debug(
+            self._event,
+            status=self._status,
+            elapsed_ms=(time.perf_counter_ns() - self._t0) // 1_000_000,
+            **self._fields,
+        )
+
+    def record(self, response: httpx.Response) -> None:
+        self._status = response.status_code
+
+
+class _NullSpan:
+    """Stand-in for ``_Span`` factories when tracing is off; every step is a no-op."""
+
+    __slots__ = ()
+
+    def __call__(self, *_: Any, **__: Any) -> "_NullSpan":
+        return self
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+    def record(self, response: httpx.Response) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _endpoint(name: str, doc: str) -> Callable[["SynologyClient"], Awaitable[Any]]:
+    """Build the getter *name*, a closure over its frozen ``_METHOD_TEMPLATES`` entry."""
+    frozen = _METHOD_TEMPLATES[name]
+
+    async def endpoint(self: "SynologyClient") -> Any:
+        return await self._call(frozen)
+
+    endpoint.__name__ = name
+    endpoint.__qualname__ = f"SynologyClient.{name}"
+    endpoint.__doc__ = doc
+    return endpoint
 
 
 class SynologyClient:
     """Async context-manager wrapper around the Synology DSM WebAPI.
 
     Auth flow:
-      __aenter__  → SYNO.API.Auth login  → stores self._sid
+      __aenter__  → reuse the shared sid, else SYNO.API.Auth login → stores self._sid
       all calls   → pass _sid=<sid> as query param
-      __aexit__   → SYNO.API.Auth logout → invalidates session
+      __aexit__   → releases the wrapper; the session stays open for reuse
+      logout()    → SYNO.API.Auth logout → invalidates the shared session
     """
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._base_url = settings.synology_url.rstrip("/") + "/webapi/"
         self._sid: Optional[str] = None
         self._client: Optional[httpx.AsyncClient] = None
+        self._log = log.bind(component="synology")
+        # Per-call timing logs only at DEBUG; formatting an event per request is not free
+        self._span: Callable[..., Any] = (
+            partial(_Span, self._log) if settings.log_level == "DEBUG" else _NULL_SPAN
+        )
 
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
 
     async def __aenter__(self) -> "SynologyClient":
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            headers={"Accept": "application/json"},
-            verify=self._settings.ssl_verify,
-            timeout=self._settings.timeout,
-        )
-        await self._login()
+        self._client = await get_shared_client(self._settings)
+        async with _login_lock:
+            self._sid = await _restore_sid(self._settings)
+            if self._sid is None:
+                await self._login()
         return self
 
     async def __aexit__(self, *_: Any) -> None:
+        # The pooled httpx client and the DSM session both outlive this wrapper
+        self._client = None
+        self._sid = None
+
+    async def logout(self) -> None:
+        """End the DSM session shared by every client for this NAS and user."""
         try:
             if self._client and self._sid:
                 await self._logout()
         finally:
-            if self._client:
-                await self._client.aclose()
-                self._client = None
+            await _forget_sid(self._settings)
             self._sid = None
 
     # ------------------------------------------------------------------
@@ -144,18 +470,16 @@ class SynologyClient:
             "passwd": self._settings.password,
             "format": "sid",
         }
-        t0 = time.monotonic()
         # POST form data — avoids special characters in passwd being mangled
         # in URL query strings (e.g. '*', '+', '#' break GET-based auth)
-        response = await client.post("entry.cgi", data=params)
-        elapsed = round((time.monotonic() - t0) * 1000)
-
-        log.info("synology.login", status=response.status_code, elapsed_ms=elapsed)
+        with self._span("synology.login") as span:
+            response = await client.post("entry.cgi", data=params)
+            span.record(response)
 
         if not response.is_success:
             raise SynologyAPIError(response.status_code, "Login request failed")
 
-        body = response.json()
+        body = orjson.loads(response.content)
         if not body.get("success", False):
             err = body.get("error", {})
             code = err.get("code", 0)
@@ -175,8 +499,19 @@ class SynologyClient:
             raise SynologyAPIError(200, msg, error_code=code)
 
         self._sid = body["data"]["sid"]
+        await _persist_sid(self._settings, self._sid)
         log.info("synology.login_ok")
 
+    async def _relogin(self, stale_sid: str) -> None:
+        """Replace *stale_sid*, unless a concurrent call already has."""
+        async with _login_lock:
+            current = _sessions.get((self._settings.synology_url, self._settings.username))
+            if current is not None and current != stale_sid:
+                self._sid = current
+                return
+            await _forget_sid(self._settings)
+            await self._login()
+
     async def _logout(self) -> None:
         """Invalidate the current session via SYNO.API.Auth logout."""
         client = self._client_or_raise()
@@ -204,133 +539,234 @@ class SynologyClient:
         return self._client
 
     async def _get(self, api: str, method: str, extra: Optional[Dict[str, Any]] = None) -> Any:
+        """Return the ``data`` payload of an ad-hoc DSM WebAPI call."""
+        return await self._call(_template(api, method, extra))
+
+    async def _call(self, template: _Template) -> Any:
+        """Run *template*, serving from cache or joining an identical call in flight.
+
+        Responses are cached per ``_CACHE_TTL`` (APIs without an entry always go
+        to the NAS), and identical calls already in flight are joined rather
+        than sent again.
+        """
+        api, method, _, query = template
+        key = (self._settings.synology_url, api, method, query)
+        ttl = _CACHE_TTL.get(api)
+        if ttl:
+            hit = _response_cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+
+        task = _inflight.get(key)
+        if task is None:
+            # The fetch runs as its own task so no single caller owns it: every
+            # caller, the first included, awaits it through shield, so a
+            # cancelled caller never cancels the request the others joined.
+            task = asyncio.create_task(self._fetch_into_cache(template, key, ttl))
+            _inflight[key] = task
+            task.add_done_callback(partial(_drop_inflight, key))
+        return await asyncio.shield(task)
+
+    async def _fetch_into_cache(
+        self, template: _Template, key: Tuple[Any, ...], ttl: Optional[float]
+    ) -> Any:
+        data = await self._fetch(template)
+        if ttl:
+            _response_cache[key] = (time.monotonic() + ttl, data)
+        return data
+
+    def invalidate(self, api: Optional[str] = None) -> None:
+        """Drop cached responses for *api* on this NAS, or all of them when omitted."""
+        url = self._settings.synology_url
+        for key in [k for k in _response_cache if k[0] == url and (api is None or k[1] == api)]:
+            del _response_cache[key]
+
+    async def _fetch(self, template: _Template, retry: bool = True, raw: bool = False) -> Any:
         """Perform a DSM WebAPI GET request and return the ``data`` payload.
 
-        Resolves the CGI path and version from ``_STATIC_CGI_MAP`` (falls
-        back to entry.cgi v1). Attaches the session SID as ``_sid``.
+        The template already carries the CGI path and encoded query; only the
+        session SID is appended here as ``_sid``. Transport errors, HTTP 5xx
+        and busy-NAS errors are retried up to ``settings.max_retries`` times
+        with backoff; an expired session is renewed and the request retried once.
         """
-        if not self._sid:
+        sid = self._sid
+        if not sid:
             raise RuntimeError("Not logged in — use SynologyClient as an async context manager")
         client = self._client_or_raise()
-        cgi_path, version = _STATIC_CGI_MAP.get(api, ("entry.cgi", 1))
+        api, method, cgi_path, query = template
+
+        url = f"{cgi_path}?{query}&{_sid_query(sid)}"
+        attempts = self._settings.max_retries + 1
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            reason: Optional[str] = None
+            try:
+                with self._span("synology.api_call", api=api, method=method) as span:
+                    response = await client.get(url)
+                    span.record(response)
+            except httpx.TransportError as exc:
+                if last:
+                    raise
+                reason = type(exc).__name__
+            else:
+                if response.status_code >= 500 and not last:
+                    reason = f"HTTP {response.status_code}"
+                else:
+                    _raise_for_status(response, cgi_path, api)
+                    body = orjson.loads(response.content)
+                    if not last and not body.get("success", False):
+                        code = body.get("error", {}).get("code")
+                        if code in _TRANSIENT_ERRORS:
+                            reason = f"DSM error {code}"
+            if reason is None:
+                break
+            log.info("synology.retry", api=api, attempt=attempt + 1, reason=reason)
+            await asyncio.sleep(_backoff(attempt))
+
+        if retry and await self._renew_expired(body, sid):
+            return await self._fetch(template, retry=False, raw=raw)
+        data = _unwrap(body)
+        return _raw_data(response.content, body) if raw else data
+
+    async def _renew_expired(self, body: Dict[str, Any], sid: str) -> bool:
+        """Log in again if *body* reports that *sid* expired; True if so.
+
+        The caller then retries its request once with the new session.
+        """
+        if body.get("success", False):
+            return False
+        code = body.get("error", {}).get("code")
+        if code not in _SESSION_ERRORS:
+            return False
+        log.info("synology.session_expired", code=code)
+        await self._relogin(sid)
+        return True
 
-        params: Dict[str, Any] = {
-            "api": api,
-            "version": version,
-            "method": method,
-            "_sid": self._sid,
-        }
-        if extra:
-            params.update(extra)
-
-        t0 = time.monotonic()
-        response = await client.get(cgi_path, params=params)
-        elapsed = round((time.monotonic() - t0) * 1000)
-
-        log.info(
-            "synology.api_call",
-            api=api,
-            method=method,
-            status=response.status_code,
-            elapsed_ms=elapsed,
-        )
+    async def multi(self, **named_calls: Awaitable[Any]) -> Dict[str, Any]:
+        """Await independent API calls concurrently and return results by name.
 
-        # HTTP-level errors
-        if response.status_code == 401:
-            raise SynologyAPIError(401, "Unauthorized — session expired or invalid SID")
-        if response.status_code == 403:
-            raise SynologyAPIError(403, "Forbidden — account lacks permission for this operation")
-        if response.status_code == 404:
-            raise SynologyAPIError(404, f"Not found: {cgi_path}?api={api}")
-        if not response.is_success:
-            raise SynologyAPIError(response.status_code, response.text[:500])
+        Example::
 
-        body = response.json()
+            res = await client.multi(dsm=client.get_dsm_info(), shares=client.list_shares())
 
-        # DSM application-level errors
-        if not body.get("success", False):
-            err = body.get("error", {})
-            code = err.get("code", 0)
-            msg = _dsm_error_message(code)
-            raise SynologyAPIError(200, msg, error_code=code)
+        A failed call yields its exception instance under its name instead of
+        aborting the others.
+        """
+        results = await asyncio.gather(*named_calls.values(), return_exceptions=True)
+        return dict(zip(named_calls, results))
+
+    async def multi_compound(self, calls: List[Tuple[str, str, Dict[str, Any]]]) -> List[Any]:
+        """Run several ``(api, method, extra)`` calls in one SYNO.Entry.Request round-trip.
+
+        DSM executes the sub-requests server-side and returns their envelopes
+        in order. As with :meth:`multi`, a failed call yields its
+        ``SynologyAPIError`` in place of its data. Calls to APIs not served by
+        entry.cgi cannot be packed and are issued concurrently instead. An
+        expired session is renewed and the request retried once.
+        """
+        if any(_STATIC_CGI_MAP.get(api, _DEFAULT_CGI)[0] != "entry.cgi" for api, _, _ in calls):
+            results = await asyncio.gather(
+                *(self._get(api, method, extra or None) for api, method, extra in calls),
+                return_exceptions=True,
+            )
+            return list(results)
+        return await self._compound(calls)
 
-        return body.get("data")
+    async def compound(self, *names: str) -> Dict[str, Any]:
+        """Run the named getters (e.g. ``"get_dsm_info"``) in one round-trip, by name.
+
+        Built on :meth:`multi_compound`: a failed getter yields its exception.
+        The response cache is bypassed, so every call reads fresh data.
+        """
+        results = await self.multi_compound([_METHOD_SPECS[name] for name in names])
+        return dict(zip(names, results))
+
+    async def _compound(
+        self, calls: List[Tuple[str, str, Dict[str, Any]]], retry: bool = True
+    ) -> List[Any]:
+        sid = self._sid
+        if not sid:
+            raise RuntimeError("Not logged in — use SynologyClient as an async context manager")
+        client = self._client_or_raise()
+        compound = [
+            {
+                "api": api,
+                "method": method,
+                "version": _STATIC_CGI_MAP.get(api, _DEFAULT_CGI)[1],
+                **extra,
+            }
+            for api, method, extra in calls
+        ]
+
+        with self._span(
+            "synology.api_call", api="SYNO.Entry.Request", method="request", calls=len(compound)
+        ) as span:
+            response = await client.post(
+                "entry.cgi",
+                data={
+                    "api": "SYNO.Entry.Request",
+                    "version": 1,
+                    "method": "request",
+                    "stop_when_error": "false",
+                    "compound": orjson.dumps(compound).decode(),
+                    "_sid": sid,
+                },
+            )
+            span.record(response)
+
+        _raise_for_status(response, "entry.cgi", "SYNO.Entry.Request")
+        body = orjson.loads(response.content)
+        if retry and await self._renew_expired(body, sid):
+            return await self._compound(calls, retry=False)
+        out: List[Any] = []
+        for item in _unwrap(body).get("result", []):
+            try:
+                out.append(_unwrap(item))
+            except SynologyAPIError as exc:
+                out.append(exc)
+        return out
 
     # ------------------------------------------------------------------
     # Public API methods
     # ------------------------------------------------------------------
 
-    async def query_api_info(self) -> Any:
-        """Query all available APIs — used for health check and API discovery."""
-        return await self._get("SYNO.API.Info", "query", {"query": "all"})
+    query_api_info = _endpoint(
+        "query_api_info", "Query all available APIs — used for health check and API discovery."
+    )
 
-    async def get_dsm_info(self) -> Any:
-        """Return DSM system info: model, firmware version, serial, uptime."""
-        return await self._get("SYNO.DSM.Info", "getinfo")
+    get_dsm_info = _endpoint(
+        "get_dsm_info", "Return DSM system info: model, firmware version, serial, uptime."
+    )
 
-    async def get_system_utilization(self) -> Any:
-        """Return current CPU, memory, network, and disk I/O utilization."""
-        return await self._get(
-            "SYNO.Core.System.Utilization",
-            "get",
-            {"type": "current", "resource": "all"},
-        )
+    get_system_utilization = _endpoint(
+        "get_system_utilization", "Return current CPU, memory, network, and disk I/O utilization."
+    )
 
-    async def get_storage_info(self) -> Any:
-        """Return storage pool, volume, and disk health overview."""
-        return await self._get(
-            "SYNO.Storage.CGI.Storage",
-            "load_info",
-            {"fetchBasic": "true", "limit": -1},
-        )
+    get_storage_info = _endpoint(
+        "get_storage_info", "Return storage pool, volume, and disk health overview."
+    )
 
-    async def get_disk_info(self) -> Any:
-        """Return per-disk details: model, temperature, S.M.A.R.T. status."""
-        return await self._get(
-            "SYNO.Storage.CGI.HddMan",
-            "list",
-            {"fetchAll": "true"},
-        )
+    get_disk_info = _endpoint(
+        "get_disk_info", "Return per-disk details: model, temperature, S.M.A.R.T. status."
+    )
 
-    async def list_shares(self) -> Any:
-        """Return all shared folders with permissions and encryption status."""
-        return await self._get(
-            "SYNO.Core.Share",
-            "list",
-            {"limit": -1, "offset": 0, "additional": "recyclebin,share_quota,encrypted"},
-        )
+    list_shares = _endpoint(
+        "list_shares", "Return all shared folders with permissions and encryption status."
+    )
 
-    async def list_packages(self) -> Any:
-        """Return all installed packages and their running status."""
-        return await self._get(
-            "SYNO.Core.Package",
-            "list",
-            {"limit": -1, "additional": "description,status,startable"},
-        )
+    list_packages = _endpoint(
+        "list_packages", "Return all installed packages and their running status."
+    )
 
-    async def list_scheduled_tasks(self) -> Any:
-        """Return all Task Scheduler tasks with last-run status."""
-        return await self._get(
-            "SYNO.Core.TaskScheduler",
-            "get",
-            {"additional": "task_setting,owner,real_owner,last_run_result"},
-        )
+    list_scheduled_tasks = _endpoint(
+        "list_scheduled_tasks", "Return all Task Scheduler tasks with last-run status."
+    )
 
-    async def list_docker_containers(self) -> Any:
-        """Return all Docker / Container Manager containers."""
-        return await self._get(
-            "SYNO.Docker.Container",
-            "list",
-            {"limit": -1, "offset": 0},
-        )
+    list_docker_containers = _endpoint(
+        "list_docker_containers", "Return all Docker / Container Manager containers."
+    )
 
-    async def list_docker_images(self) -> Any:
-        """Return all Docker images on the NAS."""
-        return await self._get(
-            "SYNO.Docker.Image",
-            "list",
-            {"limit": -1, "offset": 0},
-        )
+    list_docker_images = _endpoint("list_docker_images", "Return all Docker images on the NAS.")
 
     async def list_files(
         self,
@@ -343,25 +779,53 @@ class SynologyClient:
             folder_path: Absolute share path, e.g. ``/docker`` or ``/homes/admin``.
             additional:  Comma-separated extra fields: ``real_path,size,owner,time,perm,type``.
         """
-        params: Dict[str, Any] = {
-            "folder_path": folder_path,
-            "limit": 100,
-            "offset": 0,
-            "sort_by": "name",
-            "sort_direction": "ASC",
-        }
-        if additional:
-            params["additional"] = additional
-        return await self._get("SYNO.FileStation.List", "list", params)
+        return await self._get(
+            "SYNO.FileStation.List", "list", _list_params(folder_path, 100, additional)
+        )
 
-    async def get_security_status(self) -> Any:
-        """Return Security Advisor scan results."""
-        return await self._get("SYNO.Core.SecurityScan.Status", "get")
+    async def list_files_raw(
+        self,
+        folder_path: str,
+        additional: Optional[str] = None,
+    ) -> bytes:
+        """Like :meth:`list_files`, but return the payload as DSM's own JSON bytes.
 
-    async def get_backup_tasks(self) -> Any:
-        """Return Hyper Backup task status and last-run results."""
-        return await self._get(
-            "SYNO.Backup.Task",
-            "list",
-            {"additional": "last_bkp_result,schedule,extra"},
+        The envelope is still parsed to check ``success``, but the payload is
+        never re-encoded, so it can be passed straight to the MCP response.
+        """
+        template = _template(
+            "SYNO.FileStation.List", "list", _list_params(folder_path, 100, additional)
         )
+        return await self._fetch(template, raw=True)  # type: ignore[no-any-return]
+
+    async def list_files_all(
+        self,
+        folder_path: str,
+        page_size: int = 1000,
+        additional: Optional[str] = None,
+    ) -> Any:
+        """Return every entry inside *folder_path*, fetching pages concurrently.
+
+        The first page reports ``total``; the remaining pages are requested
+        together (multiplexed over one HTTP/2 connection) and spliced in order.
+        """
+        params = _list_params(folder_path, page_size, additional)
+        first = await self._get("SYNO.FileStation.List", "list", params)
+        total = first.get("total", 0)
+        if total <= page_size:
+            return first
+
+        pages = await asyncio.gather(*(
+            self._get("SYNO.FileStation.List", "list", {**params, "offset": offset})
+            for offset in range(page_size, total, page_size)
+        ))
+        files = list(first.get("files", []))
+        for page in pages:
+            files.extend(page.get("files", []))
+        return {**first, "files": files}
+
+    get_security_status = _endpoint("get_security_status", "Return Security Advisor scan results.")
+
+    get_backup_tasks = _endpoint(
+        "get_backup_tasks", "Return Hyper Backup task status and last-run results."
+    )
@@ -8,8 +8,8 @@ Priority order (highest → lowest):
 
 Authentication:
   Session-based via SYNO.API.Auth (username + password).
-  The client calls the login endpoint on startup to obtain a session SID,
-  attaches _sid=<sid> to every request, and calls logout on shutdown.
+  The client calls the login endpoint on first use to obtain a session SID,
+  attaches _sid=<sid> to every request, and keeps the session for reuse.
 
   DSM API Auth v7 endpoint: GET /webapi/entry.cgi?api=SYNO.API.Auth&version=7
     &method=login&account=USER&passwd=PASS&format=sid
@@ -18,12 +18,11 @@ Never write secrets back to any file from this module.
 """
 from __future__ import annotations
 
+import copy
 import os
-from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
 
-import yaml
 import structlog
 
 from synology_mcp.keychain import retrieve_secret
@@ -36,10 +35,23 @@ _KEYCHAIN_USERNAME_ACCOUNT = "synology-username"
 _KEYCHAIN_PASSWORD_ACCOUNT = "synology-password"
 _KEYCHAIN_URL_ACCOUNT = "synology-url"
 
+# Values that turn a boolean option (ssl_verify) off, compared after strip/lower
+_FALSY = frozenset({"false", "0", "no", "off", ""})
+
 
 class Settings:
     """Runtime configuration resolved at startup."""
 
+    __slots__ = (
+        "synology_url",
+        "username",
+        "password",
+        "ssl_verify",
+        "timeout",
+        "log_level",
+        "max_retries",
+    )
+
     def __init__(
         self,
         synology_url: str,
@@ -47,44 +59,88 @@ class Settings:
         password: str,
         ssl_verify: bool = True,
         timeout: float = 30.0,
+        log_level: str = "INFO",
+        max_retries: int = 3,
     ) -> None:
         self.synology_url = synology_url.rstrip("/")
         self.username = username
         self.password = password
         self.ssl_verify = ssl_verify
         self.timeout = timeout
+        self.log_level = log_level.upper()
+        self.max_retries = max_retries
 
     def __repr__(self) -> str:
         return (
             f"Settings(url={self.synology_url!r}, "
             f"username={self.username!r}, "
-            f"ssl_verify={self.ssl_verify}, timeout={self.timeout})"
+            f"ssl_verify={self.ssl_verify}, timeout={self.timeout}, "
+            f"log_level={self.log_level!r}, max_retries={self.max_retries})"
         )
 
 
+# ((mtime_ns, size), parsed data) of the last config.yaml read
+_yaml_cache: Optional[Tuple[Tuple[int, int], dict]] = None  # type: ignore[type-arg]
+
+
 def _load_yaml_config() -> dict:  # type: ignore[type-arg]
-    """Load optional YAML config file, returning an empty dict if absent."""
-    if _CONFIG_FILE.exists():
-        with _CONFIG_FILE.open() as f:
-            data = yaml.safe_load(f) or {}
+    """Load optional YAML config file, returning an empty dict if absent.
+
+    The parse is reused until the file's mtime or size changes, so
+    re-resolving settings does not re-parse an unchanged file. Callers
+    get a deep copy and cannot corrupt the cached data.
+    """
+    global _yaml_cache
+    try:
+        st = _CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if _yaml_cache is None or _yaml_cache[0] != key:
+        # Imported here: env- or keychain-only setups never pay for PyYAML
+        import yaml
+
+        # libyaml's C loader when PyYAML was built with it (same safe semantics),
+        # fed whole-buffer bytes so it scans them in one go
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(_CONFIG_FILE.read_bytes(), Loader=loader) or {}
         log.info("config.yaml_loaded", path=str(_CONFIG_FILE))
-        return data  # type: ignore[return-value]
-    return {}
+        _yaml_cache = (key, data)
+    return copy.deepcopy(_yaml_cache[1])
+
+
+_SETTINGS: Optional[Settings] = None
 
 
-@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Resolve and return the global Settings singleton.
 
     Raises ``RuntimeError`` if a required value cannot be found in any source.
     """
-    yaml_cfg = _load_yaml_config()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = _resolve_settings()
+    return _SETTINGS
+
+
+def _resolve_settings() -> Settings:
+    """Build Settings from env, keychain and config.yaml (see module docstring)."""
+    # Each chain short-circuits: the keychain and YAML file are only touched
+    # when the environment leaves a value unset.
+    env = os.environ
+    yaml_cfg: Optional[dict] = None  # type: ignore[type-arg]
+
+    def from_yaml(key: str, default: Any = None) -> Any:
+        nonlocal yaml_cfg
+        if yaml_cfg is None:
+            yaml_cfg = _load_yaml_config()
+        return yaml_cfg.get(key, default)
 
     # --- Synology URL ---
     url: Optional[str] = (
-        os.environ.get("SYNOLOGY_URL")
+        env.get("SYNOLOGY_URL")
         or retrieve_secret(_KEYCHAIN_URL_ACCOUNT)
-        or yaml_cfg.get("synology_url")
+        or from_yaml("synology_url")
     )
     if not url:
         raise RuntimeError(
@@ -95,9 +151,9 @@ def get_settings() -> Settings:
 
     # --- Username ---
     username: Optional[str] = (
-        os.environ.get("SYNOLOGY_USER")
+        env.get("SYNOLOGY_USER")
         or retrieve_secret(_KEYCHAIN_USERNAME_ACCOUNT)
-        or yaml_cfg.get("synology_username")
+        or from_yaml("synology_username")
     )
     if not username:
         raise RuntimeError(
@@ -108,9 +164,9 @@ def get_settings() -> Settings:
 
     # --- Password ---
     password: Optional[str] = (
-        os.environ.get("SYNOLOGY_PASSWORD")
+        env.get("SYNOLOGY_PASSWORD")
         or retrieve_secret(_KEYCHAIN_PASSWORD_ACCOUNT)
-        or yaml_cfg.get("synology_password")
+        or from_yaml("synology_password")
     )
     if not password:
         raise RuntimeError(
@@ -121,22 +177,45 @@ def get_settings() -> Settings:
 
     # --- Optional settings ---
     ssl_verify_raw = (
-        os.environ.get("SYNOLOGY_SSL_VERIFY")
-        or str(yaml_cfg.get("ssl_verify", "true"))
+        env.get("SYNOLOGY_SSL_VERIFY")
+        or str(from_yaml("ssl_verify", "true"))
     )
-    ssl_verify = ssl_verify_raw.lower() not in ("false", "0", "no")
-
-    timeout = float(
-        os.environ.get("SYNOLOGY_TIMEOUT")
-        or yaml_cfg.get("timeout", 30.0)
+    ssl_verify = ssl_verify_raw.strip().lower() not in _FALSY
+
+    timeout_raw = env.get("SYNOLOGY_TIMEOUT") or from_yaml("timeout", 30.0)
+    try:
+        timeout = float(timeout_raw)
+    except (TypeError, ValueError):
+        log.warning("config.invalid_timeout", value=str(timeout_raw), default=30.0)
+        timeout = 30.0
+
+    log_level = str(
+        env.get("SYNOLOGY_LOG_LEVEL")
+        or from_yaml("log_level", "INFO")
     )
 
+    retries_raw = env.get("SYNOLOGY_MAX_RETRIES") or from_yaml("max_retries", 3)
+    try:
+        max_retries = max(0, int(retries_raw))
+    except (TypeError, ValueError):
+        log.warning("config.invalid_max_retries", value=str(retries_raw), default=3)
+        max_retries = 3
+
     settings = Settings(
         synology_url=url,
         username=username,
         password=password,
         ssl_verify=ssl_verify,
         timeout=timeout,
+        log_level=log_level,
+        max_retries=max_retries,
+    )
+    # Scalars only: nothing is formatted unless DEBUG is on, and the password
+    # cannot leak through a repr
+    log.debug(
+        "config.resolved",
+        url=settings.synology_url,
+        ssl_verify=settings.ssl_verify,
+        timeout=settings.timeout,
     )
-    log.info("config.resolved", settings=repr(settings))
     return settings
@@ -3,55 +3,86 @@ macOS Keychain integration for secure Synology token/URL storage.
 
 Uses the `security` CLI (built into macOS) to store and retrieve
 secrets without ever exposing them in plaintext to the process environment.
+On macOS secrets are written through the `keyring` library instead, which talks
+to the Security framework in-process.
 """
 from __future__ import annotations
 
 import subprocess
+import sys
 import logging
+from functools import lru_cache
 from typing import Optional
 
 import structlog
 
+try:
+    import keyring as _keyring
+except ImportError:  # pragma: no cover - keyring is a declared dependency
+    _keyring = None
+
+# keyring talks to the Security framework in-process on macOS; elsewhere its backend
+# would be a different store than the one the `security` CLI reads from
+_USE_KEYRING = _keyring is not None and sys.platform == "darwin"
+
 log = structlog.get_logger(__name__)
 
 _SERVICE = "synology-mcp"
 
 
 def _run_security(*args: str) -> subprocess.CompletedProcess[str]:
-    """Run a macOS `security` command and return the result."""
-    return subprocess.run(
-        ["/usr/bin/security", *args],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    """Run a macOS `security` command and return the result.
+
+    On hosts without the `security` binary (Linux containers) a failed result
+    is returned, so every caller sees the same "not found" path.
+    """
+    try:
+        return subprocess.run(
+            ["/usr/bin/security", *args],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as exc:
+        return subprocess.CompletedProcess(["/usr/bin/security", *args], 127, "", str(exc))
 
 
 def store_secret(account: str, value: str) -> None:
     """Store *value* in the macOS Keychain under *account*.
 
-    If an entry already exists it is deleted first so ``add-generic-password``
-    succeeds cleanly.
+    On macOS the value goes through ``keyring.set_password``, which updates an
+    existing entry in place and never puts the secret on a command line where
+    other local users could read it from the process list. Elsewhere the
+    `security` CLI is used, deleting any existing entry first so
+    ``add-generic-password`` succeeds cleanly.
     """
-    _run_security("delete-generic-password", "-s", _SERVICE, "-a", account)
-
-    result = _run_security(
-        "add-generic-password",
-        "-s", _SERVICE,
-        "-a", account,
-        "-w", value,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Keychain store failed for account '{account}': {result.stderr.strip()}"
+    if _USE_KEYRING:
+        try:
+            _keyring.set_password(_SERVICE, account, value)  # type: ignore[union-attr]
+        except Exception as exc:
+            raise RuntimeError(f"Keychain store failed for account '{account}': {exc}") from exc
+    else:
+        _run_security("delete-generic-password", "-s", _SERVICE, "-a", account)
+        result = _run_security(
+            "add-generic-password",
+            "-s", _SERVICE,
+            "-a", account,
+            "-w", value,
         )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Keychain store failed for account '{account}': {result.stderr.strip()}"
+            )
+    retrieve_secret.cache_clear()
     log.info("keychain.stored", account=account)
 
 
+@lru_cache(maxsize=8)
 def retrieve_secret(account: str) -> Optional[str]:
     """Retrieve the secret stored under *account* from the macOS Keychain.
 
-    Returns ``None`` if the entry does not exist.
+    Returns ``None`` if the entry does not exist. Results are cached for the
+    life of the process; ``store_secret``/``delete_secret`` clear the cache.
     """
     result = _run_security(
         "find-generic-password",
@@ -71,5 +102,6 @@ def delete_secret(account: str) -> bool:
     """Delete a Keychain entry. Returns True if deleted, False if not found."""
     result = _run_security("delete-generic-password", "-s", _SERVICE, "-a", account)
     deleted = result.returncode == 0
+    retrieve_secret.cache_clear()
     log.info("keychain.deleted", account=account, success=deleted)
     return deleted
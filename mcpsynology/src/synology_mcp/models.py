@@ -7,9 +7,10 @@ unexpected data reaching the DSM API.
 from __future__ import annotations
 
 import re
-from typing import Optional
+import string
+from typing import Annotated, Any, Mapping, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field
 
 
 # ---------------------------------------------------------------------------
@@ -22,21 +23,49 @@ _SAFE_SHARE_RE = re.compile(r"^[\w\-. ]{1,64}$")
 # File paths: alphanumeric, slashes, hyphens, underscores, dots, spaces
 _SAFE_PATH_RE = re.compile(r"^[/\w\-. ]{1,512}$")
 
+# Package IDs: letters, digits, hyphens, underscores
+_SAFE_PACKAGE_ID_RE = re.compile(r"^[\w\-]{1,128}$")
 
+# ASCII fast path for the two patterns above: a set-membership pass instead of
+# a regex run. Non-ASCII input (\w also admits accented letters) uses the regex.
+_SHARE_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-. ")
+_PATH_ALLOWED = _SHARE_ALLOWED | {"/"}
+
+
+# O(1) length first, then the per-character check, so oversized input exits early
 def _require_safe_share(v: str) -> str:
-    if not _SAFE_SHARE_RE.match(v):
+    if not 1 <= len(v) <= 64 or not (
+        _SHARE_ALLOWED.issuperset(v) if v.isascii() else _SAFE_SHARE_RE.fullmatch(v)
+    ):
         raise ValueError("share name contains illegal characters or is too long")
     return v
 
 
+# O(1) length, then one C-level substring scan for "..", then the
+# per-character check
 def _require_safe_path(v: str) -> str:
-    if not _SAFE_PATH_RE.match(v):
+    if not 1 <= len(v) <= 512:
         raise ValueError("path contains illegal characters or is too long")
     if ".." in v:
         raise ValueError("path traversal ('..') is not allowed")
+    if not (_PATH_ALLOWED.issuperset(v) if v.isascii() else _SAFE_PATH_RE.fullmatch(v)):
+        raise ValueError("path contains illegal characters or is too long")
+    return v
+
+
+def _require_safe_package_id(v: str) -> str:
+    if not _SAFE_PACKAGE_ID_RE.match(v):
+        raise ValueError("package_id contains illegal characters")
     return v
 
 
+# Plain no-info after-validators: pydantic-core calls these directly instead of
+# going through a classmethod wrapper
+_ShareName = Annotated[str, AfterValidator(_require_safe_share)]
+_SafePath = Annotated[str, AfterValidator(_require_safe_path)]
+_PackageId = Annotated[str, AfterValidator(_require_safe_package_id)]
+
+
 # ---------------------------------------------------------------------------
 # MCP tool input schemas
 # ---------------------------------------------------------------------------
@@ -45,23 +74,18 @@ def _require_safe_path(v: str) -> str:
 class ShareInput(BaseModel):
     """Input for operations that target a specific shared folder."""
 
-    share_name: str = Field(
+    share_name: _ShareName = Field(
         ...,
         description="Shared folder name (e.g. 'docker', 'homes')",
         min_length=1,
         max_length=64,
     )
 
-    @field_validator("share_name")
-    @classmethod
-    def sanitize_share(cls, v: str) -> str:
-        return _require_safe_share(v)
-
 
 class ListFilesInput(BaseModel):
     """Input for FileStation directory listing."""
 
-    folder_path: str = Field(
+    folder_path: _SafePath = Field(
         ...,
         description="Absolute path to a shared folder or subfolder (e.g. '/docker', '/homes/admin')",
         min_length=1,
@@ -72,25 +96,41 @@ class ListFilesInput(BaseModel):
         description="Comma-separated extra fields to return: real_path, size, owner, time, perm, type",
     )
 
-    @field_validator("folder_path")
-    @classmethod
-    def sanitize_path(cls, v: str) -> str:
-        return _require_safe_path(v)
-
 
 class PackageInput(BaseModel):
     """Input for package operations."""
 
-    package_id: str = Field(
+    package_id: _PackageId = Field(
         ...,
         description="Package ID as shown in the Package Center (e.g. 'ContainerManager', 'HyperBackup')",
         min_length=1,
         max_length=128,
     )
 
-    @field_validator("package_id")
-    @classmethod
-    def sanitize_id(cls, v: str) -> str:
-        if not re.match(r"^[\w\-]{1,128}$", v):
-            raise ValueError("package_id contains illegal characters")
-        return v
+
+# Validators are normally built at class creation; rebuild here so that one
+# deferred by a forward reference is still finished at import, never on the
+# first tool call (a no-op for models that are already complete)
+for _model in (ShareInput, ListFilesInput, PackageInput):
+    _model.model_rebuild()
+del _model
+
+
+def parse_list_files(arguments: Mapping[str, Any]) -> Tuple[str, Optional[str]]:
+    """Validate ``list_files`` tool arguments without building a ``ListFilesInput``.
+
+    Applies the same rules as the model (which still provides the JSON schema)
+    as straight-line checks. Returns ``(folder_path, additional)`` and raises
+    ``ValueError`` on bad input.
+    """
+    folder_path = arguments.get("folder_path")
+    if not isinstance(folder_path, str):
+        raise ValueError("folder_path: a string is required")
+    try:
+        _require_safe_path(folder_path)
+    except ValueError as exc:
+        raise ValueError(f"folder_path: {exc}") from None
+    additional = arguments.get("additional")
+    if additional is not None and not isinstance(additional, str):
+        raise ValueError("additional: must be a string")
+    return folder_path, additional
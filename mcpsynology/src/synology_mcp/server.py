@@ -10,26 +10,27 @@ Exposes the following MCP tools:
   3.  get_system_utilization  — CPU %, RAM, per-interface network I/O, disk I/O
   4.  get_storage_info        — volumes, RAID groups, storage pool health
   5.  get_disk_info           — per-disk S.M.A.R.T. status, temperature, model
+  6.  get_full_snapshot       — system info, utilization, storage and disks in one call
 
   Shares & Files
   ───────────────
-  6.  list_shares             — all shared folders with quota and encryption status
-  7.  list_files              — browse files in a shared folder path
+  7.  list_shares             — all shared folders with quota and encryption status
+  8.  list_files              — browse files in a shared folder path
 
   Packages & Tasks
   ─────────────────
-  8.  list_packages           — installed packages and running status
-  9.  list_scheduled_tasks    — Task Scheduler jobs and last-run results
+  9.  list_packages           — installed packages and running status
+  10. list_scheduled_tasks    — Task Scheduler jobs and last-run results
 
   Container Manager (Docker)
   ──────────────────────────
-  10. list_docker_containers  — containers managed by Container Manager
-  11. list_docker_images      — Docker images stored on the NAS
+  11. list_docker_containers  — containers managed by Container Manager
+  12. list_docker_images      — Docker images stored on the NAS
 
   Security & Backup
   ──────────────────
-  12. get_security_status     — Security Advisor scan results
-  13. get_backup_tasks        — Hyper Backup task status and last-run results
+  13. get_security_status     — Security Advisor scan results
+  14. get_backup_tasks        — Hyper Backup task status and last-run results
 
 Run:
     python -m synology_mcp.server
@@ -38,19 +39,21 @@ Run:
 """
 from __future__ import annotations
 
-import json
 import logging
+import os
 import sys
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
 
+import orjson
 import structlog
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
-from pydantic import ValidationError
 
-from synology_mcp.client import SynologyAPIError, SynologyClient
+from synology_mcp.client import SynologyAPIError, SynologyClient, aclose_shared
 from synology_mcp.config import get_settings
-from synology_mcp.models import ListFilesInput
+from synology_mcp.models import parse_list_files
 
 # ---------------------------------------------------------------------------
 # Logging setup — structured JSON to stderr, never to stdout (MCP uses stdout)
@@ -58,7 +61,9 @@ from synology_mcp.models import ListFilesInput
 
 structlog.configure(
     wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+    # WriteLogger emits each record as one write() of "line\n" (print() issues
+    # separate writes for the message and the newline); both flush per record
+    logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
@@ -75,224 +80,304 @@ log = structlog.get_logger(__name__)
 app = Server("synology-mcp")
 
 
+# Compact by default: the MCP client is a program. SYNOLOGY_MCP_PRETTY=1 indents
+# responses for debugging.
+_OK_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+    orjson.OPT_INDENT_2 if os.environ.get("SYNOLOGY_MCP_PRETTY") == "1" else 0
+)
+
+
 def _ok(data: object) -> list[types.TextContent]:
-    """Wrap a result as a JSON TextContent response."""
-    return [types.TextContent(type="text", text=json.dumps(data, indent=2, default=str))]
+    """Wrap a result as a JSON TextContent response.
+
+    ``bytes`` are taken as already-encoded JSON (see ``list_files_raw``) and
+    passed through as-is, unless pretty output is on.
+    """
+    if isinstance(data, bytes):
+        if not _OK_OPTIONS & orjson.OPT_INDENT_2:
+            return [types.TextContent(type="text", text=data.decode())]
+        data = orjson.loads(data)
+    text = orjson.dumps(data, default=str, option=_OK_OPTIONS).decode()
+    return [types.TextContent(type="text", text=text)]
+
+
+@lru_cache(maxsize=64)
+def _err_content(message: str) -> types.TextContent:
+    # Repeated errors (unknown tool, bad input, NAS down) reuse one encoded block
+    return types.TextContent(type="text", text=orjson.dumps({"error": message}).decode())
 
 
 def _err(message: str) -> list[types.TextContent]:
     """Wrap an error string as a TextContent response."""
-    return [types.TextContent(type="text", text=json.dumps({"error": message}))]
+    # A fresh list each time: the MCP server reads a 2-tuple as (content, structured)
+    return [_err_content(message)]
 
 
 # ---------------------------------------------------------------------------
 # Tool registry
 # ---------------------------------------------------------------------------
 
-@app.list_tools()
-async def list_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name="health_check",
-            description=(
-                "Validate Synology DSM connectivity and Personal Access Token (PAT) validity. "
-                "Returns DSM version and a list of available APIs."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+# Static, so built once at import rather than on every tools/list request
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="health_check",
+        description=(
+            "Validate Synology DSM connectivity and Personal Access Token (PAT) validity. "
+            "Returns DSM version and a list of available APIs."
+        ),
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_system_info",
+        description=(
+            "Return DSM system information: NAS model, firmware version, serial number, "
+            "temperature, uptime, hostname, and RAM."
         ),
-        types.Tool(
-            name="get_system_info",
-            description=(
-                "Return DSM system information: NAS model, firmware version, serial number, "
-                "temperature, uptime, hostname, and RAM."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_system_utilization",
+        description=(
+            "Return current system resource utilization: CPU usage %, total/used/free RAM, "
+            "per-network-interface TX/RX bytes, and disk I/O read/write bytes."
         ),
-        types.Tool(
-            name="get_system_utilization",
-            description=(
-                "Return current system resource utilization: CPU usage %, total/used/free RAM, "
-                "per-network-interface TX/RX bytes, and disk I/O read/write bytes."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_storage_info",
+        description=(
+            "Return storage overview: RAID groups, volumes (size, used, free, filesystem), "
+            "and disk health summary (normal, warning, error counts)."
         ),
-        types.Tool(
-            name="get_storage_info",
-            description=(
-                "Return storage overview: RAID groups, volumes (size, used, free, filesystem), "
-                "and disk health summary (normal, warning, error counts)."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_disk_info",
+        description=(
+            "Return per-disk details for all drives installed in the NAS: model, "
+            "firmware, serial, temperature, S.M.A.R.T. status, and slot location."
         ),
-        types.Tool(
-            name="get_disk_info",
-            description=(
-                "Return per-disk details for all drives installed in the NAS: model, "
-                "firmware, serial, temperature, S.M.A.R.T. status, and slot location."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_full_snapshot",
+        description=(
+            "Return get_system_info, get_system_utilization, get_storage_info and "
+            "get_disk_info together in a single DSM request. A section that fails holds "
+            "an 'error' message instead of data."
         ),
-        types.Tool(
-            name="list_shares",
-            description=(
-                "Return all shared folders: name, path, comment, whether encryption is active, "
-                "recycle bin status, and disk quota if set."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_shares",
+        description=(
+            "Return all shared folders: name, path, comment, whether encryption is active, "
+            "recycle bin status, and disk quota if set."
         ),
-        types.Tool(
-            name="list_files",
-            description=(
-                "Browse files and subfolders inside a Synology shared folder. "
-                "Returns name, type (dir/file), size, owner, and modification time."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "folder_path": {
-                        "type": "string",
-                        "description": (
-                            "Absolute path starting with '/' — use the share name as the first "
-                            "component, e.g. '/docker', '/homes/admin', '/photo/2024'."
-                        ),
-                    },
-                    "additional": {
-                        "type": "string",
-                        "description": (
-                            "Optional comma-separated extra fields to include in the response. "
-                            "Supported: real_path, size, owner, time, perm, type"
-                        ),
-                    },
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_files",
+        description=(
+            "Browse files and subfolders inside a Synology shared folder. "
+            "Returns name, type (dir/file), size, owner, and modification time."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "folder_path": {
+                    "type": "string",
+                    "description": (
+                        "Absolute path starting with '/' — use the share name as the first "
+                        "component, e.g. '/docker', '/homes/admin', '/photo/2024'."
+                    ),
+                },
+                "additional": {
+                    "type": "string",
+                    "description": (
+                        "Optional comma-separated extra fields to include in the response. "
+                        "Supported: real_path, size, owner, time, perm, type"
+                    ),
                 },
-                "required": ["folder_path"],
             },
+            "required": ["folder_path"],
+        },
+    ),
+    types.Tool(
+        name="list_packages",
+        description=(
+            "Return all packages installed via Package Center: ID, display name, version, "
+            "author, and whether the package is currently running."
         ),
-        types.Tool(
-            name="list_packages",
-            description=(
-                "Return all packages installed via Package Center: ID, display name, version, "
-                "author, and whether the package is currently running."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_scheduled_tasks",
+        description=(
+            "Return all Task Scheduler jobs: name, type (script/package), owner, "
+            "schedule (cron expression), enabled status, and last-run result."
         ),
-        types.Tool(
-            name="list_scheduled_tasks",
-            description=(
-                "Return all Task Scheduler jobs: name, type (script/package), owner, "
-                "schedule (cron expression), enabled status, and last-run result."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_docker_containers",
+        description=(
+            "Return all Docker containers managed by Container Manager (formerly Docker "
+            "package): name, image, status (running/stopped), ports, and creation time."
         ),
-        types.Tool(
-            name="list_docker_containers",
-            description=(
-                "Return all Docker containers managed by Container Manager (formerly Docker "
-                "package): name, image, status (running/stopped), ports, and creation time."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="list_docker_images",
+        description=(
+            "Return all Docker images stored on the NAS: tag, size, creation time, "
+            "and whether any containers are using the image."
         ),
-        types.Tool(
-            name="list_docker_images",
-            description=(
-                "Return all Docker images stored on the NAS: tag, size, creation time, "
-                "and whether any containers are using the image."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_security_status",
+        description=(
+            "Return Security Advisor scan results: overall risk score, last scan time, "
+            "and individual check results (pass/warn/fail) for firewall, updates, "
+            "SSH config, account policies, and more."
         ),
-        types.Tool(
-            name="get_security_status",
-            description=(
-                "Return Security Advisor scan results: overall risk score, last scan time, "
-                "and individual check results (pass/warn/fail) for firewall, updates, "
-                "SSH config, account policies, and more."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    types.Tool(
+        name="get_backup_tasks",
+        description=(
+            "Return all Hyper Backup tasks: name, destination type, last backup time, "
+            "last backup result (success/error/warning), and schedule."
         ),
-        types.Tool(
-            name="get_backup_tasks",
-            description=(
-                "Return all Hyper Backup tasks: name, destination type, last backup time, "
-                "last backup result (success/error/warning), and schedule."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-    ]
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[types.Tool]:
+    return _TOOLS
+
+
+# ---------------------------------------------------------------------------
+# Long-lived client
+# ---------------------------------------------------------------------------
+
+# One logged-in client for the server's lifetime; expired sessions are renewed
+# inside the client, so tool calls never pay a login of their own
+_client: Optional[SynologyClient] = None
+
+
+async def _get_client() -> SynologyClient:
+    """Return the shared client, logging in on first use (or after a failed login)."""
+    global _client
+    if _client is None:
+        client = SynologyClient(get_settings())
+        await client.__aenter__()
+        _client = client
+    return _client
+
+
+async def _release_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.__aexit__(None, None, None)
+        _client = None
 
 
 # ---------------------------------------------------------------------------
 # Tool handlers
 # ---------------------------------------------------------------------------
 
+class _InvalidInput(Exception):
+    """Tool arguments failed validation; reported as ``Invalid input: ...``."""
+
+
+# Handlers return the payload for _ok; SynologyAPIError propagates to call_tool
+_Handler = Callable[[SynologyClient, dict[str, Any]], Awaitable[object]]
+
+
+async def _handle_health_check(client: SynologyClient, arguments: dict[str, Any]) -> object:
+    data = await client.query_api_info()
+    # Summarise the available API count — data may be a dict of api_name → info
+    api_count = len(data) if isinstance(data, dict) else "unknown"
+    return {
+        "status": "ok",
+        "synology_url": get_settings().synology_url,
+        "available_apis": api_count,
+        "note": "PAT is valid and DSM is reachable.",
+    }
+
+
+# Snapshot section → client getter it is read from
+_SNAPSHOT_SECTIONS = {
+    "system_info": "get_dsm_info",
+    "utilization": "get_system_utilization",
+    "storage": "get_storage_info",
+    "disks": "get_disk_info",
+}
+
+
+async def _handle_get_full_snapshot(
+    client: SynologyClient, arguments: dict[str, Any]
+) -> object:
+    results = await client.compound(*_SNAPSHOT_SECTIONS.values())
+    snapshot: dict[str, Any] = {}
+    for section, getter in _SNAPSHOT_SECTIONS.items():
+        result = results[getter]
+        if isinstance(result, SynologyAPIError):
+            result = {"error": str(result)}
+        elif isinstance(result, BaseException):
+            raise result
+        snapshot[section] = result
+    return snapshot
+
+
+async def _handle_list_files(client: SynologyClient, arguments: dict[str, Any]) -> object:
+    try:
+        folder_path, additional = parse_list_files(arguments)
+    except ValueError as exc:
+        raise _InvalidInput(str(exc)) from None
+    return await client.list_files_raw(folder_path=folder_path, additional=additional)
+
+
+_HANDLERS: dict[str, _Handler] = {
+    # ── Read / Introspection ───────────────────────────────────────
+    "health_check": _handle_health_check,
+    "get_system_info": lambda client, _: client.get_dsm_info(),
+    "get_system_utilization": lambda client, _: client.get_system_utilization(),
+    "get_storage_info": lambda client, _: client.get_storage_info(),
+    "get_disk_info": lambda client, _: client.get_disk_info(),
+    "get_full_snapshot": _handle_get_full_snapshot,
+    # ── Shares & Files ────────────────────────────────────────────
+    "list_shares": lambda client, _: client.list_shares(),
+    "list_files": _handle_list_files,
+    # ── Packages & Tasks ──────────────────────────────────────────
+    "list_packages": lambda client, _: client.list_packages(),
+    "list_scheduled_tasks": lambda client, _: client.list_scheduled_tasks(),
+    # ── Container Manager (Docker) ─────────────────────────────────
+    "list_docker_containers": lambda client, _: client.list_docker_containers(),
+    "list_docker_images": lambda client, _: client.list_docker_images(),
+    # ── Security & Backup ─────────────────────────────────────────
+    "get_security_status": lambda client, _: client.get_security_status(),
+    "get_backup_tasks": lambda client, _: client.get_backup_tasks(),
+}
+
+
 @app.call_tool()
 async def call_tool(
     name: str,
     arguments: dict,  # type: ignore[type-arg]
 ) -> list[types.TextContent]:
-    settings = get_settings()
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _err(f"Unknown tool: {name!r}")
     try:
-        async with SynologyClient(settings) as client:
-            # ── Read / Introspection ───────────────────────────────────────
-            if name == "health_check":
-                data = await client.query_api_info()
-                # Summarise the available API count — data may be a dict of api_name → info
-                api_count = len(data) if isinstance(data, dict) else "unknown"
-                return _ok({
-                    "status": "ok",
-                    "synology_url": settings.synology_url,
-                    "available_apis": api_count,
-                    "note": "PAT is valid and DSM is reachable.",
-                })
-
-            elif name == "get_system_info":
-                return _ok(await client.get_dsm_info())
-
-            elif name == "get_system_utilization":
-                return _ok(await client.get_system_utilization())
-
-            elif name == "get_storage_info":
-                return _ok(await client.get_storage_info())
-
-            elif name == "get_disk_info":
-                return _ok(await client.get_disk_info())
-
-            # ── Shares & Files ────────────────────────────────────────────
-            elif name == "list_shares":
-                return _ok(await client.list_shares())
-
-            elif name == "list_files":
-                try:
-                    inp = ListFilesInput(**arguments)
-                except (ValidationError, TypeError) as exc:
-                    return _err(f"Invalid input: {exc}")
-                return _ok(await client.list_files(
-                    folder_path=inp.folder_path,
-                    additional=inp.additional,
-                ))
-
-            # ── Packages & Tasks ──────────────────────────────────────────
-            elif name == "list_packages":
-                return _ok(await client.list_packages())
-
-            elif name == "list_scheduled_tasks":
-                return _ok(await client.list_scheduled_tasks())
-
-            # ── Container Manager (Docker) ─────────────────────────────────
-            elif name == "list_docker_containers":
-                return _ok(await client.list_docker_containers())
-
-            elif name == "list_docker_images":
-                return _ok(await client.list_docker_images())
-
-            # ── Security & Backup ─────────────────────────────────────────
-            elif name == "get_security_status":
-                return _ok(await client.get_security_status())
-
-            elif name == "get_backup_tasks":
-                return _ok(await client.get_backup_tasks())
-
-            else:
-                return _err(f"Unknown tool: {name!r}")
-
+        client = await _get_client()
+        return _ok(await handler(client, arguments))
+    except _InvalidInput as exc:
+        return _err(f"Invalid input: {exc}")
     except SynologyAPIError as exc:
         log.error("synology.api_error", tool=name, error=str(exc))
         return _err(str(exc))
@@ -317,9 +402,20 @@ def main() -> None:
         log.error("synology_mcp.config_error", error=str(exc))
         sys.exit(1)
 
+    level = logging.getLevelName(settings.log_level)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            level if isinstance(level, int) else logging.INFO
+        ),
+    )
+
     async def _serve() -> None:
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(read_stream, write_stream, app.create_initialization_options())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(read_stream, write_stream, app.create_initialization_options())
+        finally:
+            await _release_client()
+            await aclose_shared()
 
     asyncio.run(_serve())
 
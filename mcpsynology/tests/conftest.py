@@ -0,0 +1,37 @@
+"""Shared fixtures for the synology-mcp test suite."""
+from __future__ import annotations
+
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+import structlog
+
+from synology_mcp import client as client_module
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def fresh_pool(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    """Start every test without a shared httpx client, DSM session or cached responses.
+
+    The keychain is replaced by an in-memory dict.
+    """
+    monkeypatch.setattr(client_module, "_shared_client", None)
+    monkeypatch.setattr(client_module, "_shared_key", None)
+    monkeypatch.setattr(client_module, "_response_cache", {})
+    monkeypatch.setattr(client_module, "_inflight", {})
+    monkeypatch.setattr(client_module, "_sessions", {})
+    keychain: dict[str, str] = {}
+    monkeypatch.setattr(client_module, "retrieve_secret", keychain.get)
+    monkeypatch.setattr(client_module, "store_secret", keychain.__setitem__)
+    monkeypatch.setattr(
+        client_module, "delete_secret", lambda account: keychain.pop(account, None) is not None
+    )
+    yield
+    await client_module.aclose_shared()
+
+
+@pytest.fixture(autouse=True)
+def structlog_defaults() -> None:
+    """Undo the INFO-level filter that importing synology_mcp.server installs."""
+    structlog.reset_defaults()
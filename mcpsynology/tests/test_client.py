@@ -1,22 +1,32 @@
 """
-Tests for SynologyClient — all HTTP calls are mocked with respx.
+Tests for SynologyClient — all HTTP calls are mocked through the respx_mock fixture.
 
 Auth flow (SYNO.API.Auth session-based):
-  Every test sequences three calls on entry.cgi:
+  Every test starts without a session (see conftest.py), so it sequences:
     1. login  → {"success": true, "data": {"sid": "test-sid"}}
     2. actual API call (or query.cgi for query_api_info)
-    3. logout → {"success": true}
+  The session is kept for reuse; logout only happens via client.logout().
+  The _auth_routes fixture mocks login and logout for every test.
 """
-from __future__ import annotations
+import asyncio
+import json
+from typing import AsyncIterator
 
 import pytest
+import pytest_asyncio
 import respx
 import httpx
+import orjson
+import structlog
 
+from synology_mcp import client as client_module
 from synology_mcp.client import SynologyClient, SynologyAPIError
 from synology_mcp.config import Settings
 
 BASE_URL = "https://nas.test:5001/webapi/"
+# Parsed once; every route below reuses these instead of re-parsing a string
+ENTRY_URL = httpx.URL(BASE_URL + "entry.cgi")
+QUERY_URL = httpx.URL(BASE_URL + "query.cgi")
 
 SETTINGS = Settings(
     synology_url="https://nas.test:5001",
@@ -26,10 +36,35 @@ SETTINGS = Settings(
     timeout=5.0,
 )
 
+
+def _json_response(body: object) -> httpx.Response:
+    """A 200 response carrying ``body`` as orjson-encoded JSON."""
+    return httpx.Response(
+        200, content=orjson.dumps(body), headers={"content-type": "application/json"}
+    )
+
+
 # Shared mock responses for login/logout
 # Login is now POST (to handle special chars in passwords), API calls + logout are GET
-_LOGIN = httpx.Response(200, json={"success": True, "data": {"sid": "test-sid"}})
-_LOGOUT = httpx.Response(200, json={"success": True})
+_LOGIN = _json_response({"success": True, "data": {"sid": "test-sid"}})
+_LOGOUT = _json_response({"success": True})
+
+
+@pytest.fixture(autouse=True)
+def _auth_routes(respx_mock: respx.MockRouter) -> None:
+    """Register the login and logout routes, so tests only mock the call under test.
+
+    A test needing another login outcome re-mocks ``respx_mock["login"]``.
+    """
+    respx_mock.post(ENTRY_URL, name="login").mock(return_value=_LOGIN)
+    respx_mock.get(ENTRY_URL, params={"method": "logout"}, name="logout").mock(return_value=_LOGOUT)
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncIterator[SynologyClient]:
+    """A logged-in client for tests that exercise API calls rather than login itself."""
+    async with SynologyClient(SETTINGS) as c:
+        yield c
 
 
 def _dsm_ok(data: object) -> dict:
@@ -40,49 +75,55 @@ def _dsm_err(code: int) -> dict:
     return {"success": False, "error": {"code": code}}
 
 
+# Responses replayed by several tests; respx can return the same object every time
+_UTILIZATION = _json_response(_dsm_ok({"cpu": {}}))
+_MODEL = _json_response(_dsm_ok({"model": "DS923+"}))
+_PERMISSION_DENIED = _json_response(_dsm_err(105))
+_HTTP_401 = httpx.Response(401)
+_HTTP_503 = httpx.Response(503)
+
+
 # ---------------------------------------------------------------------------
 # health_check / query_api_info  (hits query.cgi; login/logout on entry.cgi)
 # ---------------------------------------------------------------------------
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_health_check_ok() -> None:
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(return_value=_LOGOUT)
-    respx.get(BASE_URL + "query.cgi").mock(
-        return_value=httpx.Response(200, json=_dsm_ok({"SYNO.API.Info": {"path": "query.cgi"}}))
+async def test_health_check_ok(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(QUERY_URL).mock(
+        return_value=_json_response(_dsm_ok({"SYNO.API.Info": {"path": "query.cgi"}}))
     )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.query_api_info()
+    data = await client.query_api_info()
     assert "SYNO.API.Info" in data
 
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_health_check_unauthorized() -> None:
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(return_value=_LOGOUT)
-    respx.get(BASE_URL + "query.cgi").mock(
-        return_value=httpx.Response(401)
-    )
-    async with SynologyClient(SETTINGS) as client:
-        with pytest.raises(SynologyAPIError) as exc_info:
-            await client.query_api_info()
+async def test_health_check_is_never_cached(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    route = respx_mock.get(QUERY_URL).mock(return_value=_json_response(_dsm_ok({})))
+    assert await client.query_api_info() == {}
+    route.mock(return_value=_PERMISSION_DENIED)
+    with pytest.raises(SynologyAPIError):
+        await client.query_api_info()
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_health_check_unauthorized(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    respx_mock.get(QUERY_URL).mock(return_value=_HTTP_401)
+    with pytest.raises(SynologyAPIError) as exc_info:
+        await client.query_api_info()
     assert exc_info.value.status_code == 401
 
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_dsm_application_error() -> None:
+async def test_dsm_application_error(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
     """DSM returns HTTP 200 but success=false."""
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(return_value=_LOGOUT)
-    respx.get(BASE_URL + "query.cgi").mock(
-        return_value=httpx.Response(200, json=_dsm_err(105))
-    )
-    async with SynologyClient(SETTINGS) as client:
-        with pytest.raises(SynologyAPIError) as exc_info:
-            await client.query_api_info()
+    respx_mock.get(QUERY_URL).mock(return_value=_PERMISSION_DENIED)
+    with pytest.raises(SynologyAPIError) as exc_info:
+        await client.query_api_info()
     assert exc_info.value.error_code == 105
     assert "privilege" in str(exc_info.value).lower()
 
@@ -91,12 +132,11 @@ async def test_dsm_application_error() -> None:
 # Login failure paths
 # ---------------------------------------------------------------------------
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_login_bad_credentials() -> None:
+async def test_login_bad_credentials(respx_mock: respx.MockRouter) -> None:
     """DSM returns success=false on login (wrong password)."""
-    respx.post(BASE_URL + "entry.cgi").mock(
-        return_value=httpx.Response(200, json={"success": False, "error": {"code": 400}})
+    respx_mock["login"].mock(
+        return_value=_json_response({"success": False, "error": {"code": 400}})
     )
     with pytest.raises(SynologyAPIError) as exc_info:
         async with SynologyClient(SETTINGS):
@@ -105,13 +145,10 @@ async def test_login_bad_credentials() -> None:
     assert "password" in str(exc_info.value).lower()
 
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_login_http_error() -> None:
+async def test_login_http_error(respx_mock: respx.MockRouter) -> None:
     """Non-2xx HTTP response from the login endpoint."""
-    respx.post(BASE_URL + "entry.cgi").mock(
-        return_value=httpx.Response(503)
-    )
+    respx_mock["login"].mock(return_value=_HTTP_503)
     with pytest.raises(SynologyAPIError) as exc_info:
         async with SynologyClient(SETTINGS):
             pass
@@ -122,23 +159,20 @@ async def test_login_http_error() -> None:
 # get_dsm_info
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_DSM_INFO = _json_response(_dsm_ok({
+    "model": "DS923+",
+    "version": "7.2.2-72806",
+    "firmware_ver": "7.2.2",
+    "up_time": "10 days 2:30:00",
+    "temperature": 35,
+    "sys_temp_warn": False,
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_dsm_info() -> None:
-    payload = {
-        "model": "DS923+",
-        "version": "7.2.2-72806",
-        "firmware_ver": "7.2.2",
-        "up_time": "10 days 2:30:00",
-        "temperature": 35,
-        "sys_temp_warn": False,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.get_dsm_info()
+async def test_get_dsm_info(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_DSM_INFO)
+    data = await client.get_dsm_info()
     assert data["model"] == "DS923+"
     assert data["firmware_ver"] == "7.2.2"
 
@@ -147,21 +181,18 @@ async def test_get_dsm_info() -> None:
 # get_system_utilization
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_SYSTEM_UTILIZATION = _json_response(_dsm_ok({
+    "cpu": {"user_load": 12, "system_load": 3, "other_load": 1},
+    "memory": {"real_usage": 45, "total_real": 8192},
+    "network": [{"device": "eth0", "rx": 1024, "tx": 512}],
+    "disk": [{"device": "sda", "read_byte": 2048, "write_byte": 1024}],
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_system_utilization() -> None:
-    payload = {
-        "cpu": {"user_load": 12, "system_load": 3, "other_load": 1},
-        "memory": {"real_usage": 45, "total_real": 8192},
-        "network": [{"device": "eth0", "rx": 1024, "tx": 512}],
-        "disk": [{"device": "sda", "read_byte": 2048, "write_byte": 1024}],
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.get_system_utilization()
+async def test_get_system_utilization(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_SYSTEM_UTILIZATION)
+    data = await client.get_system_utilization()
     assert data["cpu"]["user_load"] == 12
 
 
@@ -169,26 +200,23 @@ async def test_get_system_utilization() -> None:
 # get_storage_info (SYNO.Storage.CGI.Storage — confirmed on entry.cgi)
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_STORAGE_INFO = _json_response(_dsm_ok({
+    "volumes": [
+        {
+            "id": "volume_1",
+            "status": "normal",
+            "size_total_byte": "7999999999",
+            "size_used_byte": "3000000000",
+        }
+    ],
+    "disk": [],
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_storage_info() -> None:
-    payload = {
-        "volumes": [
-            {
-                "id": "volume_1",
-                "status": "normal",
-                "size_total_byte": "7999999999",
-                "size_used_byte": "3000000000",
-            }
-        ],
-        "disk": [],
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.get_storage_info()
+async def test_get_storage_info(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_STORAGE_INFO)
+    data = await client.get_storage_info()
     assert data["volumes"][0]["id"] == "volume_1"
 
 
@@ -196,21 +224,18 @@ async def test_get_storage_info() -> None:
 # get_disk_info (SYNO.Storage.CGI.HddMan — confirmed on entry.cgi)
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_DISK_INFO = _json_response(_dsm_ok({
+    "disk": [
+        {"id": "disk1", "model": "WD Red Plus 8TB", "status": "normal", "temp": 38},
+        {"id": "disk2", "model": "WD Red Plus 8TB", "status": "normal", "temp": 37},
+    ]
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_disk_info() -> None:
-    payload = {
-        "disk": [
-            {"id": "disk1", "model": "WD Red Plus 8TB", "status": "normal", "temp": 38},
-            {"id": "disk2", "model": "WD Red Plus 8TB", "status": "normal", "temp": 37},
-        ]
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.get_disk_info()
+async def test_get_disk_info(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_DISK_INFO)
+    data = await client.get_disk_info()
     assert len(data["disk"]) == 2
     assert data["disk"][0]["temp"] == 38
 
@@ -219,22 +244,19 @@ async def test_get_disk_info() -> None:
 # list_shares
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_SHARES = _json_response(_dsm_ok({
+    "shares": [
+        {"name": "docker", "vol_path": "/volume1/docker", "encrypted": False},
+        {"name": "homes", "vol_path": "/volume1/homes", "encrypted": False},
+    ],
+    "total": 2,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_shares() -> None:
-    payload = {
-        "shares": [
-            {"name": "docker", "vol_path": "/volume1/docker", "encrypted": False},
-            {"name": "homes", "vol_path": "/volume1/homes", "encrypted": False},
-        ],
-        "total": 2,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_shares()
+async def test_list_shares(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_SHARES)
+    data = await client.list_shares()
     assert data["total"] == 2
     assert data["shares"][0]["name"] == "docker"
 
@@ -243,22 +265,19 @@ async def test_list_shares() -> None:
 # list_packages
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_PACKAGES = _json_response(_dsm_ok({
+    "packages": [
+        {"id": "ContainerManager", "version": "20.10.23-1455", "status": "running"},
+        {"id": "HyperBackup", "version": "4.2.1-3390", "status": "running"},
+    ],
+    "total": 2,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_packages() -> None:
-    payload = {
-        "packages": [
-            {"id": "ContainerManager", "version": "20.10.23-1455", "status": "running"},
-            {"id": "HyperBackup", "version": "4.2.1-3390", "status": "running"},
-        ],
-        "total": 2,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_packages()
+async def test_list_packages(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_PACKAGES)
+    data = await client.list_packages()
     assert data["total"] == 2
     assert data["packages"][0]["id"] == "ContainerManager"
 
@@ -267,21 +286,18 @@ async def test_list_packages() -> None:
 # list_scheduled_tasks
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_SCHEDULED_TASKS = _json_response(_dsm_ok({
+    "tasks": [
+        {"id": 1, "name": "Backup-NAS", "enable": True, "status": "waiting"},
+    ],
+    "total": 1,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_scheduled_tasks() -> None:
-    payload = {
-        "tasks": [
-            {"id": 1, "name": "Backup-NAS", "enable": True, "status": "waiting"},
-        ],
-        "total": 1,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_scheduled_tasks()
+async def test_list_scheduled_tasks(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_SCHEDULED_TASKS)
+    data = await client.list_scheduled_tasks()
     assert data["tasks"][0]["name"] == "Backup-NAS"
 
 
@@ -289,22 +305,19 @@ async def test_list_scheduled_tasks() -> None:
 # list_docker_containers
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_DOCKER_CONTAINERS = _json_response(_dsm_ok({
+    "containers": [
+        {"name": "portainer", "image": "portainer/portainer-ce:latest", "status": "running"},
+        {"name": "grafana", "image": "grafana/grafana:latest", "status": "running"},
+    ],
+    "total": 2,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_docker_containers() -> None:
-    payload = {
-        "containers": [
-            {"name": "portainer", "image": "portainer/portainer-ce:latest", "status": "running"},
-            {"name": "grafana", "image": "grafana/grafana:latest", "status": "running"},
-        ],
-        "total": 2,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_docker_containers()
+async def test_list_docker_containers(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_DOCKER_CONTAINERS)
+    data = await client.list_docker_containers()
     assert data["total"] == 2
 
 
@@ -312,21 +325,18 @@ async def test_list_docker_containers() -> None:
 # list_docker_images
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_DOCKER_IMAGES = _json_response(_dsm_ok({
+    "images": [
+        {"id": "sha256:abc123", "name": "grafana/grafana", "tag": "latest", "size": 302000000},
+    ],
+    "total": 1,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_docker_images() -> None:
-    payload = {
-        "images": [
-            {"id": "sha256:abc123", "name": "grafana/grafana", "tag": "latest", "size": 302000000},
-        ],
-        "total": 1,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_docker_images()
+async def test_list_docker_images(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_DOCKER_IMAGES)
+    data = await client.list_docker_images()
     assert data["total"] == 1
     assert data["images"][0]["name"] == "grafana/grafana"
 
@@ -335,43 +345,83 @@ async def test_list_docker_images() -> None:
 # list_files
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_LIST_FILES = _json_response(_dsm_ok({
+    "files": [
+        {"name": "compose.yml", "isdir": False, "path": "/docker/compose.yml"},
+        {"name": "data", "isdir": True, "path": "/docker/data"},
+    ],
+    "total": 2,
+}))
+
+
 @pytest.mark.asyncio
-async def test_list_files() -> None:
-    payload = {
-        "files": [
-            {"name": "compose.yml", "isdir": False, "path": "/docker/compose.yml"},
-            {"name": "data", "isdir": True, "path": "/docker/data"},
-        ],
-        "total": 2,
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.list_files("/docker")
+async def test_list_files(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_LIST_FILES)
+    data = await client.list_files("/docker")
     assert data["total"] == 2
     assert data["files"][0]["name"] == "compose.yml"
 
 
+@pytest.mark.asyncio
+async def test_list_files_all_fetches_remaining_pages(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    def page(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        files = [{"name": f"f{i}"} for i in range(offset, min(offset + 2, 5))]
+        return _json_response(_dsm_ok({"total": 5, "offset": offset, "files": files}))
+
+    route = respx_mock.get(ENTRY_URL, params={"api": "SYNO.FileStation.List"}).mock(
+        side_effect=page
+    )
+    data = await client.list_files_all("/docker", page_size=2)
+    assert [f["name"] for f in data["files"]] == ["f0", "f1", "f2", "f3", "f4"]
+    assert data["total"] == 5
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body,expected", [
+    (b'{"data":{"files":[{"name":"a"}],"total":1},"success":true}',
+     b'{"files":[{"name":"a"}],"total":1}'),
+    # unexpected layout: payload is re-encoded rather than sliced
+    (b'{"success": true, "data": {"total": 0}}', b'{"total":0}'),
+])
+async def test_list_files_raw_passes_payload_bytes(
+    respx_mock: respx.MockRouter, body: bytes, expected: bytes, client: SynologyClient
+) -> None:
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.FileStation.List"}).mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    assert await client.list_files_raw("/docker") == expected
+
+
+@pytest.mark.asyncio
+async def test_list_files_raw_raises_dsm_error(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.FileStation.List"}).mock(
+        return_value=_json_response(_dsm_err(408))
+    )
+    with pytest.raises(SynologyAPIError) as exc_info:
+        await client.list_files_raw("/docker")
+    assert exc_info.value.error_code == 408
+
+
 # ---------------------------------------------------------------------------
 # get_security_status
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_SECURITY_STATUS = _json_response(_dsm_ok({
+    "risk_item_cnt": {"critical": 0, "high": 1, "medium": 3, "low": 2, "info": 5},
+    "last_scan_time": "2024-01-15 02:00:00",
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_security_status() -> None:
-    payload = {
-        "risk_item_cnt": {"critical": 0, "high": 1, "medium": 3, "low": 2, "info": 5},
-        "last_scan_time": "2024-01-15 02:00:00",
-    }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
-    )
-    async with SynologyClient(SETTINGS) as client:
-        data = await client.get_security_status()
+async def test_get_security_status(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_SECURITY_STATUS)
+    data = await client.get_security_status()
     assert data["risk_item_cnt"]["critical"] == 0
 
 
@@ -379,28 +429,332 @@ async def test_get_security_status() -> None:
 # get_backup_tasks
 # ---------------------------------------------------------------------------
 
-@respx.mock
+_BACKUP_TASKS = _json_response(_dsm_ok({
+    "task_list": [
+        {
+            "id": 1,
+            "name": "NAS-to-Cloud",
+            "enable": True,
+            "last_bkp_result": "success",
+            "last_bkp_time": "2024-01-15 03:00:00",
+        }
+    ],
+    "total": 1,
+}))
+
+
 @pytest.mark.asyncio
-async def test_get_backup_tasks() -> None:
-    payload = {
-        "task_list": [
-            {
-                "id": 1,
-                "name": "NAS-to-Cloud",
-                "enable": True,
-                "last_bkp_result": "success",
-                "last_bkp_time": "2024-01-15 03:00:00",
-            }
+async def test_get_backup_tasks(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    respx_mock.get(ENTRY_URL).mock(return_value=_BACKUP_TASKS)
+    data = await client.get_backup_tasks()
+    assert data["task_list"][0]["last_bkp_result"] == "success"
+
+
+# ---------------------------------------------------------------------------
+# multi — concurrent independent calls
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_multi_returns_results_by_name(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.DSM.Info"}).mock(return_value=_MODEL)
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.Share"}).mock(
+        return_value=_PERMISSION_DENIED
+    )
+    res = await client.multi(dsm=client.get_dsm_info(), shares=client.list_shares())
+    assert res["dsm"] == {"model": "DS923+"}
+    assert isinstance(res["shares"], SynologyAPIError)
+
+
+@pytest.mark.asyncio
+async def test_multi_compound_packs_calls_into_one_request(respx_mock: respx.MockRouter) -> None:
+    compound = _json_response(_dsm_ok({
+        "has_fail": True,
+        "result": [
+            {"api": "SYNO.DSM.Info", "method": "getinfo", "success": True,
+             "data": {"model": "DS923+"}},
+            {"api": "SYNO.Core.Share", "method": "list", "success": False,
+             "error": {"code": 105}},
         ],
-        "total": 1,
+    }))
+    route = respx_mock["login"].mock(side_effect=[_LOGIN, compound])
+    async with SynologyClient(SETTINGS) as client:
+        res = await client.multi_compound([
+            ("SYNO.DSM.Info", "getinfo", {}),
+            ("SYNO.Core.Share", "list", {"limit": -1}),
+        ])
+    assert res[0] == {"model": "DS923+"}
+    assert isinstance(res[1], SynologyAPIError) and res[1].error_code == 105
+    sent = dict(httpx.QueryParams(route.calls[1].request.content.decode()))
+    assert sent["api"] == "SYNO.Entry.Request"
+    assert json.loads(sent["compound"]) == [
+        {"api": "SYNO.DSM.Info", "method": "getinfo", "version": 2},
+        {"api": "SYNO.Core.Share", "method": "list", "version": 1, "limit": -1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_multi_compound_falls_back_outside_entry_cgi(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    route = respx_mock["login"]
+    respx_mock.get(QUERY_URL).mock(
+        return_value=_json_response(_dsm_ok({"SYNO.API.Auth": {}}))
+    )
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.DSM.Info"}).mock(return_value=_MODEL)
+    res = await client.multi_compound([
+        ("SYNO.API.Info", "query", {"query": "all"}),
+        ("SYNO.DSM.Info", "getinfo", {}),
+    ])
+    assert res == [{"SYNO.API.Auth": {}}, {"model": "DS923+"}]
+    assert route.call_count == 1  # login only
+
+
+@pytest.mark.asyncio
+async def test_multi_compound_relogs_in_on_expired_session(respx_mock: respx.MockRouter) -> None:
+    compound = _json_response(_dsm_ok({
+        "has_fail": False,
+        "result": [{"api": "SYNO.DSM.Info", "method": "getinfo", "success": True,
+                    "data": {"model": "DS923+"}}],
+    }))
+    route = respx_mock["login"].mock(side_effect=[
+        _LOGIN,
+        _json_response(_dsm_err(119)),
+        _json_response({"success": True, "data": {"sid": "new-sid"}}),
+        compound,
+    ])
+    async with SynologyClient(SETTINGS) as client:
+        res = await client.multi_compound([("SYNO.DSM.Info", "getinfo", {})])
+    assert res == [{"model": "DS923+"}]
+    assert dict(httpx.QueryParams(route.calls[3].request.content.decode()))["_sid"] == "new-sid"
+
+
+@pytest.mark.asyncio
+async def test_compound_returns_getter_results_by_name(respx_mock: respx.MockRouter) -> None:
+    compound = _json_response(_dsm_ok({
+        "has_fail": True,
+        "result": [
+            {"api": "SYNO.DSM.Info", "method": "getinfo", "success": True,
+             "data": {"model": "DS923+"}},
+            {"api": "SYNO.Storage.CGI.HddMan", "method": "list", "success": False,
+             "error": {"code": 105}},
+        ],
+    }))
+    route = respx_mock["login"].mock(side_effect=[_LOGIN, compound])
+    async with SynologyClient(SETTINGS) as client:
+        res = await client.compound("get_dsm_info", "get_disk_info")
+    assert res["get_dsm_info"] == {"model": "DS923+"}
+    assert isinstance(res["get_disk_info"], SynologyAPIError)
+    sent = json.loads(dict(httpx.QueryParams(route.calls[1].request.content.decode()))["compound"])
+    assert sent[1] == {
+        "api": "SYNO.Storage.CGI.HddMan", "method": "list", "version": 1, "fetchAll": "true"
     }
-    respx.post(BASE_URL + "entry.cgi").mock(return_value=_LOGIN)
-    respx.get(BASE_URL + "entry.cgi").mock(
-        side_effect=[httpx.Response(200, json=_dsm_ok(payload)), _LOGOUT]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("level,logged", [("INFO", False), ("debug", True)])
+async def test_api_call_log_only_at_debug(
+    respx_mock: respx.MockRouter, level: str, logged: bool
+) -> None:
+    settings = Settings(
+        synology_url=SETTINGS.synology_url,
+        username=SETTINGS.username,
+        password=SETTINGS.password,
+        log_level=level,
+    )
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        return_value=_UTILIZATION
+    )
+    with structlog.testing.capture_logs() as logs:
+        async with SynologyClient(settings) as client:
+            await client.get_system_utilization()
+    events = [e["event"] for e in logs]
+    assert ("synology.api_call" in events) is logged
+    assert ("synology.login" in events) is logged
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_cached_api_fetched_once_until_invalidated(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    shares = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.Share"}).mock(
+        return_value=_json_response(_dsm_ok({"shares": []}))
+    )
+    await client.list_shares()
+    await client.list_shares()
+    assert shares.call_count == 1
+    client.invalidate("SYNO.Core.Share")
+    await client.list_shares()
+    assert shares.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_api_always_fetched(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    util = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        return_value=_UTILIZATION
+    )
+    await client.get_system_utilization()
+    await client.get_system_utilization()
+    assert util.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    async def slow_containers(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return _json_response(_dsm_ok({"containers": []}))
+
+    route = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Docker.Container"}).mock(
+        side_effect=slow_containers
+    )
+    first, second = await asyncio.gather(
+        client.list_docker_containers(), client.list_docker_containers()
+    )
+    assert first == second == {"containers": []}
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_joined_call(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    release = asyncio.Event()
+
+    async def held_containers(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return _json_response(_dsm_ok({"containers": []}))
+
+    route = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Docker.Container"}).mock(
+        side_effect=held_containers
+    )
+    leader = asyncio.create_task(client.list_docker_containers())
+    await asyncio.sleep(0)  # leader starts the request
+    follower = asyncio.create_task(client.list_docker_containers())
+    await asyncio.sleep(0)  # follower joins it
+    leader.cancel()
+    release.set()
+    assert await follower == {"containers": []}
+    assert leader.cancelled()
+    assert route.call_count == 1
+    assert not client_module._inflight
+
+
+# ---------------------------------------------------------------------------
+# Transient failure retries
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "_backoff", lambda attempt: 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_backoff")
+async def test_transient_failures_are_retried(
+    respx_mock: respx.MockRouter, client: SynologyClient
+) -> None:
+    util = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        side_effect=[
+            httpx.ConnectError("refused"),
+            _HTTP_503,
+            _json_response(_dsm_err(412)),
+            _UTILIZATION,
+        ]
+    )
+    assert await client.get_system_utilization() == {"cpu": {}}
+    assert util.call_count == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_backoff")
+async def test_retries_are_bounded(respx_mock: respx.MockRouter, client: SynologyClient) -> None:
+    util = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        return_value=httpx.Response(502)
+    )
+    with pytest.raises(SynologyAPIError) as exc_info:
+        await client.get_system_utilization()
+    assert exc_info.value.status_code == 502
+    assert util.call_count == SETTINGS.max_retries + 1
+
+
+# ---------------------------------------------------------------------------
+# Session reuse
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_session_reused_across_clients(respx_mock: respx.MockRouter) -> None:
+    login = respx_mock["login"]
+    respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        return_value=_UTILIZATION
+    )
+    for _ in range(2):
+        async with SynologyClient(SETTINGS) as client:
+            await client.get_system_utilization()
+    assert login.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_session_relogs_in_and_retries(respx_mock: respx.MockRouter) -> None:
+    login = respx_mock["login"].mock(side_effect=[
+        _LOGIN,
+        _json_response({"success": True, "data": {"sid": "new-sid"}}),
+    ])
+    util = respx_mock.get(ENTRY_URL, params={"api": "SYNO.Core.System.Utilization"}).mock(
+        side_effect=[
+            _json_response(_dsm_err(119)),
+            _UTILIZATION,
+        ]
     )
     async with SynologyClient(SETTINGS) as client:
-        data = await client.get_backup_tasks()
-    assert data["task_list"][0]["last_bkp_result"] == "success"
+        assert await client.get_system_utilization() == {"cpu": {}}
+    assert login.call_count == 2
+    assert util.calls[1].request.url.params["_sid"] == "new-sid"
+
+
+@pytest.mark.asyncio
+async def test_stored_sid_only_used_for_its_own_nas(
+    respx_mock: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stored = "https://other-nas:5001\tadmin\tother-sid"
+    monkeypatch.setattr(client_module, "retrieve_secret", lambda account: stored)
+    login = respx_mock["login"]
+    async with SynologyClient(SETTINGS) as client:
+        assert client._sid == "test-sid"
+    assert login.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_ends_shared_session(respx_mock: respx.MockRouter) -> None:
+    login = respx_mock["login"]
+    logout = respx_mock["logout"]
+    async with SynologyClient(SETTINGS) as client:
+        await client.logout()
+    async with SynologyClient(SETTINGS):
+        pass
+    assert logout.call_count == 1
+    assert login.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Shared connection pool
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_clients_share_pool_across_sessions() -> None:
+    async with SynologyClient(SETTINGS) as first:
+        pool = first._client
+    async with SynologyClient(SETTINGS) as second:
+        assert second._client is pool
+    assert not pool.is_closed
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+"""
+Tests for config.yaml loading.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from synology_mcp import config
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "config.yaml"
+    monkeypatch.setattr(config, "_CONFIG_FILE", path)
+    monkeypatch.setattr(config, "_yaml_cache", None)
+    return path
+
+
+def test_missing_file_yields_empty_config(config_file: Path) -> None:
+    assert config._load_yaml_config() == {}
+
+
+def test_unchanged_file_parsed_once(config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_file.write_text("timeout: 10\n")
+    parses = []
+    real_load = yaml.load
+
+    def counting_load(*args: object, **kwargs: object) -> object:
+        parses.append(1)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    first = config._load_yaml_config()
+    first["timeout"] = 99
+    assert config._load_yaml_config() == {"timeout": 10}
+    assert len(parses) == 1
+
+    config_file.write_text("timeout: 20.5\n")
+    assert config._load_yaml_config() == {"timeout": 20.5}
+    assert len(parses) == 2
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch, config_file: Path) -> pytest.MonkeyPatch:
+    monkeypatch.setattr(config, "retrieve_secret", lambda account: None)
+    monkeypatch.setenv("SYNOLOGY_URL", "https://nas.test:5001")
+    monkeypatch.setenv("SYNOLOGY_USER", "admin")
+    monkeypatch.setenv("SYNOLOGY_PASSWORD", "secret")
+    return monkeypatch
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("true", True), (" Off ", False), ("NO", False), ("0", False), ("yes", True),
+])
+def test_ssl_verify_parsing(env: pytest.MonkeyPatch, raw: str, expected: bool) -> None:
+    env.setenv("SYNOLOGY_SSL_VERIFY", raw)
+    assert config._resolve_settings().ssl_verify is expected
+
+
+def test_malformed_numbers_fall_back_to_defaults(env: pytest.MonkeyPatch) -> None:
+    env.setenv("SYNOLOGY_TIMEOUT", "thirty")
+    env.setenv("SYNOLOGY_MAX_RETRIES", "many")
+    settings = config._resolve_settings()
+    assert settings.timeout == 30.0
+    assert settings.max_retries == 3
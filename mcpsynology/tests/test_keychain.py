@@ -0,0 +1,64 @@
+"""Tests for macOS Keychain integration."""
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from synology_mcp.keychain import retrieve_secret, store_secret
+
+
+@pytest.fixture(autouse=True)
+def _cold_cache():
+    retrieve_secret.cache_clear()
+    yield
+    retrieve_secret.cache_clear()
+
+
+def _proc(returncode: int = 0, stdout: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess([], returncode, stdout, "")
+
+
+def test_retrieve_is_cached() -> None:
+    with patch("synology_mcp.keychain._run_security", return_value=_proc(stdout="secret\n")) as sec:
+        assert retrieve_secret("synology-url") == "secret"
+        assert retrieve_secret("synology-url") == "secret"
+    assert sec.call_count == 1
+
+
+def test_missing_entry_is_cached_as_none() -> None:
+    with patch("synology_mcp.keychain._run_security", return_value=_proc(returncode=44)) as sec:
+        assert retrieve_secret("synology-url") is None
+        assert retrieve_secret("synology-url") is None
+    assert sec.call_count == 1
+
+
+def test_store_invalidates_cache() -> None:
+    with patch("synology_mcp.keychain._run_security", return_value=_proc(stdout="old")) as sec:
+        retrieve_secret("synology-sid")
+        store_secret("synology-sid", "new")
+        sec.return_value = _proc(stdout="new")
+        assert retrieve_secret("synology-sid") == "new"
+
+
+def test_missing_security_binary_reads_as_not_found() -> None:
+    with patch("synology_mcp.keychain.subprocess.run", side_effect=FileNotFoundError):
+        assert retrieve_secret("synology-url") is None
+
+
+def test_store_uses_keyring_on_macos() -> None:
+    with patch("synology_mcp.keychain._USE_KEYRING", True), \
+            patch("synology_mcp.keychain._keyring") as kr, \
+            patch("synology_mcp.keychain._run_security") as sec:
+        store_secret("synology-sid", "s3cret")
+    kr.set_password.assert_called_once_with("synology-mcp", "synology-sid", "s3cret")
+    sec.assert_not_called()
+
+
+def test_store_keyring_failure_raises() -> None:
+    with patch("synology_mcp.keychain._USE_KEYRING", True), \
+            patch("synology_mcp.keychain._keyring") as kr:
+        kr.set_password.side_effect = OSError("locked")
+        with pytest.raises(RuntimeError, match="locked"):
+            store_secret("synology-sid", "s3cret")
@@ -1,12 +1,16 @@
 """
 Tests for Pydantic input models.
 """
-from __future__ import annotations
+import re
 
 import pytest
 from pydantic import ValidationError
 
-from synology_mcp.models import ListFilesInput, ShareInput, PackageInput
+from synology_mcp.models import ListFilesInput, ShareInput, PackageInput, parse_list_files
+
+# Compiled once for every parametrized case that matches on them
+_TRAVERSAL = re.compile("traversal")
+_ILLEGAL = re.compile("illegal")
 
 
 # ---------------------------------------------------------------------------
@@ -26,21 +30,45 @@ class TestListFilesInput:
         inp = ListFilesInput(folder_path="/docker", additional="size,owner,time")
         assert inp.additional == "size,owner,time"
 
-    def test_path_traversal_rejected(self) -> None:
-        with pytest.raises(ValidationError, match="traversal"):
-            ListFilesInput(folder_path="/docker/../etc/passwd")
-
-    def test_empty_path_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            ListFilesInput(folder_path="")
-
-    def test_path_too_long_rejected(self) -> None:
+    def test_non_ascii_letters_allowed(self) -> None:
+        inp = ListFilesInput(folder_path="/homes/données")
+        assert inp.folder_path == "/homes/données"
+
+    @pytest.mark.parametrize("folder_path,match", [
+        ("/docker/../etc/passwd", _TRAVERSAL),
+        ("", None),
+        ("/" + "a" * 513, None),
+        ("/docker; rm -rf /", _ILLEGAL),
+        ("/docker\n", _ILLEGAL),
+    ])
+    def test_rejected(self, folder_path: str, match: re.Pattern[str] | None) -> None:
+        with pytest.raises(ValidationError, match=match):
+            ListFilesInput(folder_path=folder_path)
+
+
+class TestParseListFiles:
+    def test_matches_model(self) -> None:
+        args = {"folder_path": "/homes/admin", "additional": "size"}
+        inp = ListFilesInput(**args)
+        assert parse_list_files(args) == (inp.folder_path, inp.additional)
+
+    def test_additional_optional(self) -> None:
+        assert parse_list_files({"folder_path": "/docker"}) == ("/docker", None)
+
+    @pytest.mark.parametrize("args", [
+        {},
+        {"folder_path": 42},
+        {"folder_path": ""},
+        {"folder_path": "/" + "a" * 512},
+        {"folder_path": "/docker; rm -rf /"},
+        {"folder_path": "/docker/../etc"},
+        {"folder_path": "/docker", "additional": ["size"]},
+    ])
+    def test_rejects_what_the_model_rejects(self, args: dict) -> None:
         with pytest.raises(ValidationError):
-            ListFilesInput(folder_path="/" + "a" * 513)
-
-    def test_illegal_characters_rejected(self) -> None:
-        with pytest.raises(ValidationError, match="illegal"):
-            ListFilesInput(folder_path="/docker; rm -rf /")
+            ListFilesInput(**args)
+        with pytest.raises(ValueError):
+            parse_list_files(args)
 
 
 # ---------------------------------------------------------------------------
@@ -56,17 +84,14 @@ class TestShareInput:
         inp = ShareInput(share_name="my share")
         assert inp.share_name == "my share"
 
-    def test_empty_name_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            ShareInput(share_name="")
-
-    def test_name_too_long_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            ShareInput(share_name="a" * 65)
-
-    def test_injection_rejected(self) -> None:
-        with pytest.raises(ValidationError, match="illegal"):
-            ShareInput(share_name="'; DROP TABLE shares; --")
+    @pytest.mark.parametrize("share_name,match", [
+        ("", None),
+        ("a" * 65, None),
+        ("'; DROP TABLE shares; --", _ILLEGAL),
+    ])
+    def test_rejected(self, share_name: str, match: re.Pattern[str] | None) -> None:
+        with pytest.raises(ValidationError, match=match):
+            ShareInput(share_name=share_name)
 
 
 # ---------------------------------------------------------------------------
@@ -82,10 +107,15 @@ class TestPackageInput:
         inp = PackageInput(package_id="Hyper-Backup")
         assert inp.package_id == "Hyper-Backup"
 
-    def test_empty_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            PackageInput(package_id="")
+    @pytest.mark.parametrize("package_id,match", [
+        ("", None),
+        ("pkg; rm -rf /", _ILLEGAL),
+    ])
+    def test_rejected(self, package_id: str, match: re.Pattern[str] | None) -> None:
+        with pytest.raises(ValidationError, match=match):
+            PackageInput(package_id=package_id)
+
 
-    def test_injection_rejected(self) -> None:
-        with pytest.raises(ValidationError, match="illegal"):
-            PackageInput(package_id="pkg; rm -rf /")
+@pytest.mark.parametrize("model", [ShareInput, ListFilesInput, PackageInput])
+def test_models_complete_at_import(model: type) -> None:
+    assert model.__pydantic_complete__
@@ -0,0 +1,55 @@
+"""Tests for the MCP tool handlers, with a mocked SynologyClient."""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from synology_mcp import server
+from synology_mcp.client import SynologyAPIError
+
+
+def _client_returning(**results: object) -> MagicMock:
+    client = MagicMock()
+    client.compound = AsyncMock(return_value=results)
+    return client
+
+
+@pytest.fixture
+def use_client(monkeypatch: pytest.MonkeyPatch):
+    def install(client: MagicMock) -> None:
+        monkeypatch.setattr(server, "_get_client", AsyncMock(return_value=client))
+    return install
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_reports_failed_sections_inline(use_client) -> None:
+    use_client(_client_returning(
+        get_dsm_info={"model": "DS923+"},
+        get_system_utilization={"cpu": {}},
+        get_storage_info=SynologyAPIError(200, "no privilege", error_code=105),
+        get_disk_info={"disk": []},
+    ))
+    result = await server.call_tool("get_full_snapshot", {})
+    snapshot = json.loads(result[0].text)
+    assert snapshot == {
+        "system_info": {"model": "DS923+"},
+        "utilization": {"cpu": {}},
+        "storage": {"error": str(SynologyAPIError(200, "no privilege", error_code=105))},
+        "disks": {"disk": []},
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_reraises_unexpected_errors(use_client) -> None:
+    client = _client_returning(
+        get_dsm_info={"model": "DS923+"},
+        get_system_utilization=RuntimeError("boom"),
+        get_storage_info={},
+        get_disk_info={},
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        await server._HANDLERS["get_full_snapshot"](client, {})
+
+    use_client(client)
+    result = await server.call_tool("get_full_snapshot", {})
+    assert json.loads(result[0].text) == {"error": "Unexpected error: boom"}